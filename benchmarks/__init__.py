@@ -0,0 +1,9 @@
+"""
+Benchmarks for ControlDB.
+
+Run against the embedded SQLite backend so they need no MS Access driver:
+
+    python -m benchmarks.bench_controldb --sizes 100 1000 10000 --output bench.json
+    python -m benchmarks.bench_controldb --compare bench_old.json bench.json
+    python -m benchmarks.load_test --workers 8 --mode process --duration 10
+"""
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+ControlDB benchmark suite
+=========================
+
+Times the CRUD, bulk, export and login paths against SQLite stand-in
+databases filled with synthetic data at several sizes, and writes the
+results as JSON so releases can be compared.
+
+Usage:
+------
+>>> python -m benchmarks.bench_controldb --sizes 100 1000 10000 --output bench.json
+>>> python -m benchmarks.bench_controldb --compare bench_old.json bench.json
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import random
+import logging
+import argparse
+import platform
+import tempfile
+import statistics
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+import sqlalchemy
+from sqlalchemy import Integer, Float, String
+
+from src import ControlDB, ControlDBManager, ExcelManager
+
+
+LOG_LEVEL = logging.ERROR
+
+
+def measure(fn, setup=None, repeat: int = 5, number: int = 1) -> dict:
+    """
+    Time `fn` like timeit: `repeat` rounds of `number` calls, GC disabled.
+
+    Returns:
+        dict: min/median/mean/stdev seconds per call plus round settings.
+    """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            times.append((time.perf_counter() - start) / number)
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def synthetic_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Candle-like rows: a symbol, a random-walk price and a volume."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "symbol": rng.choice(["BTC", "ETH", "ADA", "SOL", "XRP"], size=rows),
+        "close": 100 + rng.standard_normal(rows).cumsum(),
+        "volume": rng.lognormal(3, 1, size=rows),
+    })
+
+
+class Suite:
+    """One benchmark environment: a temp folder, a filled SQLite ControlDB and an Excel file."""
+
+    COLUMNS = {"ID": Integer, "symbol": String, "close": Float, "volume": Float}
+
+    def __init__(self, size: int, repeat: int, number: int):
+        self.size = size
+        self.repeat = repeat
+        self.number = number
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.frame = synthetic_frame(size)
+
+        self.db = ControlDB("bench", rootPath=self.temp_dir.name, db_type="db", logLevel=LOG_LEVEL)
+        self.db.setup()
+        self.table = self.db.create_table("Candles", self.COLUMNS)
+        self.table.insert_dataframe(self.frame)
+        self.rng = random.Random(size)
+
+        self.excel = ExcelManager(logLevel=LOG_LEVEL)
+        self.excel_path = os.path.join(self.temp_dir.name, "bench.xlsx")
+        self.excel.upload_dataframe(self.excel_path, self.frame)
+
+    def close(self):
+        self.db.detach()
+        self.temp_dir.cleanup()
+
+    def random_id(self) -> int:
+        return self.rng.randint(1, self.size)
+
+    # ---------------------- 🔹 CASES ----------------------
+
+    def cases(self) -> dict:
+        """Return name -> (fn, setup, number) of all cases for this size."""
+        row = self.table.row
+        number = self.number
+
+        def create():
+            row.id = None
+            row.create(symbol="BTC", close=1.0, volume=2.0)
+
+        def get():
+            row.get(self.random_id())
+
+        def merge():
+            row.id = self.random_id()
+            row.merge({"close": self.rng.random()})
+
+        def replace():
+            row.id = self.random_id()
+            row.replace({"symbol": "ETH", "close": self.rng.random(), "volume": 1.0})
+
+        def delete():
+            row.id = row.create(symbol="TMP", close=0.0, volume=0.0)
+            row.delete()
+
+        excel_merge_path = os.path.join(self.temp_dir.name, "merge.xlsx")
+
+        def excel_merge_setup():
+            self.excel.upload_dataframe(excel_merge_path, self.frame)
+
+        return {
+            "row.create": (create, None, number),
+            "row.get": (get, None, number),
+            "row.merge": (merge, None, number),
+            "row.replace": (replace, None, number),
+            "row.delete": (delete, None, number),
+            "table.get_df_table": (self.table.get_df_table, None, 1),
+            "table.get_column_as_list": (lambda: self.table.get_column_as_list("close"), None, 1),
+            "table.to_numpy": (lambda: self.table.to_numpy("close"), None, 1),
+            "table.get_first_free_id": (self.table.get_first_free_id, None, 1),
+            "table.insert_dataframe": (lambda: self.table.insert_dataframe(self.frame), None, 1),
+            "excel.upload_dataframe": (lambda: self.excel.upload_dataframe(self.excel_path, self.frame), None, 1),
+            "excel.read_file": (lambda: self.excel.read_file(self.excel_path, sheet_name="Sheet1"), None, 1),
+            "excel.merge_dataframe": (lambda: self.excel.merge_dataframe(excel_merge_path, self.frame),
+                                      excel_merge_setup, 1),
+        }
+
+    def run(self, only: list[str] | None = None) -> list[dict]:
+        results = []
+        for name, (fn, setup, number) in self.cases().items():
+            if only and not any(name.startswith(prefix) for prefix in only):
+                continue
+            stats = measure(fn, setup=setup, repeat=self.repeat, number=number)
+            results.append({"name": name, "size": self.size, **stats})
+            print(f"  {name:<28} size={self.size:<8} median={stats['median'] * 1000:10.3f} ms", flush=True)
+        return results
+
+
+def bench_login(databases: int, repeat: int) -> dict:
+    """Time ControlDBManager.login loading `databases` tenant databases."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        manager = ControlDBManager("bench", rootPath=temp_dir, db_type="db", logLevel=LOG_LEVEL)
+        manager.setup(username="admin", password="pw")
+        for i in range(databases):
+            manager.create(f"tenant_{i}", password="pw")
+        manager.detach_all()
+
+        def login():
+            m = ControlDBManager("bench", rootPath=temp_dir, db_type="db", logLevel=LOG_LEVEL)
+            m.login("admin", password="pw")
+            for db in m.databaseDir.values():
+                db.session.close()
+                db.engine.dispose()
+
+        stats = measure(login, repeat=repeat)
+    print(f"  {'manager.login':<28} dbs={databases:<9} median={stats['median'] * 1000:10.3f} ms", flush=True)
+    return {"name": "manager.login", "size": databases, **stats}
+
+
+def metadata() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+    }
+
+
+def compare(old_path: str, new_path: str) -> None:
+    """Print the median ratio new/old per (case, size)."""
+    with open(old_path) as f:
+        old = {(r["name"], r["size"]): r for r in json.load(f)["results"]}
+    with open(new_path) as f:
+        new = {(r["name"], r["size"]): r for r in json.load(f)["results"]}
+
+    print(f"{'case':<28} {'size':>8} {'old ms':>10} {'new ms':>10} {'ratio':>7}")
+    for key in sorted(old.keys() & new.keys()):
+        o, n = old[key]["median"], new[key]["median"]
+        print(f"{key[0]:<28} {key[1]:>8} {o * 1000:>10.3f} {n * 1000:>10.3f} {n / o if o else float('nan'):>7.2f}")
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="ControlDB benchmark suite (SQLite stand-in)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="table sizes in rows")
+    parser.add_argument("--databases", type=int, nargs="+", default=[1, 10], help="tenant counts for login")
+    parser.add_argument("--repeat", type=int, default=5, help="rounds per case")
+    parser.add_argument("--number", type=int, default=50, help="calls per round for single-row cases")
+    parser.add_argument("--only", nargs="+", help="run only cases starting with these prefixes")
+    parser.add_argument("--output", help="write JSON results to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two result files and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        compare(*args.compare)
+        return 0
+
+    results = []
+    for size in args.sizes:
+        suite = Suite(size, repeat=args.repeat, number=args.number)
+        try:
+            results += suite.run(only=args.only)
+        finally:
+            suite.close()
+
+    if not args.only or any("manager.login".startswith(p) for p in args.only):
+        for databases in args.databases:
+            results.append(bench_login(databases, repeat=args.repeat))
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"meta": metadata(), "results": results}, f, indent=2)
+        print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
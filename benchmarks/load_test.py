@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+ControlDB load test
+===================
+
+Runs N worker threads or processes against databases registered in a
+ControlDBManager (SQLite stand-in) with a configurable mix of operations,
+and reports throughput, latency percentiles, lock-contention errors and retries.
+
+Every worker logs in with its own ControlDBManager, so each has its own
+engines and sessions; contention happens on the shared database files.
+
+Usage:
+------
+>>> python -m benchmarks.load_test --workers 8 --mode thread --duration 10 \\
+...     --mix get=70 create=10 merge=15 get_df_table=5 --output load.json
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import logging
+import argparse
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+import numpy as np
+from sqlalchemy import Integer, Float, String
+
+from src import ControlDBManager, DataGenerator
+from src.utils import is_lock_error
+
+
+LOG_LEVEL = logging.CRITICAL
+TABLE = "LoadTable"
+COLUMNS = {"ID": Integer, "key": String, "value": Float}
+OPERATIONS = ("get", "create", "merge", "get_df_table")
+
+
+def prepare(root: str, databases: int, rows: int) -> str:
+    """Create a manager with `databases` tenant databases holding `rows` rows each."""
+    manager = ControlDBManager("load", rootPath=root, db_type="db", logLevel=LOG_LEVEL)
+    manager.setup(username="admin", password="pw")
+    gen = DataGenerator(seed=0, logLevel=LOG_LEVEL)
+    for i in range(databases):
+        db = manager.create(f"tenant_{i}", password="pw")
+        db.create_table(TABLE, COLUMNS)
+        gen.populate(db, TABLE, rows, spec={"key": {"cardinality": 1000}})
+    manager.detach_all()
+    return root
+
+
+def run_worker(root: str, worker: int, mix: dict[str, int], duration: float,
+               retries: int, backoff: float) -> dict:
+    """
+    Execute random operations for `duration` seconds.
+
+    Returns:
+        dict: {"latency": {op: [seconds]}, "errors", "lock_errors", "retries"}
+    """
+    rng = random.Random(worker)
+    manager = ControlDBManager("load", rootPath=root, db_type="db", logLevel=LOG_LEVEL)
+    if not manager.login("admin", password="pw"):
+        raise RuntimeError("Worker login failed")
+
+    tables = [db.load_table(TABLE) for id, db in sorted(manager.databaseDir.items()) if id != 1]
+    sizes = [len(t.get_column_as_list("ID")) for t in tables]
+    ops, weights = list(mix), list(mix.values())
+
+    result = {"latency": {op: [] for op in ops}, "errors": 0, "lock_errors": 0, "retries": 0}
+
+    def attempt(op: str, i: int):
+        table, row = tables[i], tables[i].row
+        if op == "get":
+            row.get(rng.randint(1, sizes[i]))
+            return True, None
+        if op == "create":
+            row.id = None
+            ok = row.create(key=f"w{worker}", value=rng.random()) is not None
+            return ok, row.last_error
+        if op == "merge":
+            row.id = rng.randint(1, sizes[i])
+            ok = row.merge({"value": rng.random()})
+            return ok, row.last_error
+        if op == "get_df_table":
+            return table.get_df_table() is not None, None
+        raise ValueError(f"Unknown operation '{op}'")
+
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        op = rng.choices(ops, weights)[0]
+        i = rng.randrange(len(tables))
+        start = time.perf_counter()
+        for n in range(retries + 1):
+            try:
+                ok, error = attempt(op, i)
+            except Exception as e:
+                ok, error = False, e
+            if ok:
+                break
+            if is_lock_error(error):
+                result["lock_errors"] += 1
+                if n < retries:
+                    result["retries"] += 1
+                    time.sleep(backoff * (2 ** n) * rng.random())
+                    continue
+            result["errors"] += 1
+            break
+        if ok:
+            result["latency"][op].append(time.perf_counter() - start)
+
+    manager.detach_all()
+    return result
+
+
+def summarize(results: list[dict], elapsed: float) -> dict:
+    """Merge worker results into throughput and latency percentiles per operation."""
+    ops = {}
+    for op in results[0]["latency"]:
+        samples = np.concatenate([np.asarray(r["latency"][op], dtype=float) for r in results])
+        ops[op] = {
+            "count": int(samples.size),
+            "throughput": samples.size / elapsed,
+            **({f"p{q}": float(np.percentile(samples, q)) for q in (50, 95, 99)} if samples.size else {}),
+        }
+    total = sum(o["count"] for o in ops.values())
+    return {
+        "elapsed": elapsed,
+        "operations": total,
+        "throughput": total / elapsed,
+        "errors": sum(r["errors"] for r in results),
+        "lock_errors": sum(r["lock_errors"] for r in results),
+        "retries": sum(r["retries"] for r in results),
+        "per_operation": ops,
+    }
+
+
+def parse_mix(items: list[str]) -> dict[str, int]:
+    mix = {}
+    for item in items:
+        op, _, weight = item.partition("=")
+        if op not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"Unknown operation '{op}', choose from {OPERATIONS}")
+        mix[op] = int(weight or 1)
+    return mix
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="ControlDB concurrent load test (SQLite stand-in)")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--mode", choices=("thread", "process"), default="thread")
+    parser.add_argument("--databases", type=int, default=2)
+    parser.add_argument("--rows", type=int, default=1000, help="rows per database before the run")
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per worker")
+    parser.add_argument("--mix", nargs="+", default=["get=70", "create=10", "merge=15", "get_df_table=5"])
+    parser.add_argument("--retries", type=int, default=3, help="retries per operation on lock errors")
+    parser.add_argument("--backoff", type=float, default=0.01, help="base backoff in seconds")
+    parser.add_argument("--root", help="reuse/keep databases in this folder instead of a temp folder")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    temp_dir = None if args.root else tempfile.TemporaryDirectory()
+    root = args.root or temp_dir.name
+    try:
+        if not os.path.isdir(os.path.join(root, "load")):
+            prepare(root, args.databases, args.rows)
+
+        executor = ThreadPoolExecutor if args.mode == "thread" else ProcessPoolExecutor
+        start = time.perf_counter()
+        with executor(max_workers=args.workers) as pool:
+            futures = [pool.submit(run_worker, root, w, mix, args.duration, args.retries, args.backoff)
+                       for w in range(args.workers)]
+            results = [f.result() for f in futures]
+        report = summarize(results, time.perf_counter() - start)
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    report["config"] = {k: v for k, v in vars(args).items() if k != "output"}
+    print(f"{'operation':<14} {'count':>8} {'ops/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for op, o in report["per_operation"].items():
+        p = [o.get(f"p{q}", float("nan")) * 1000 for q in (50, 95, 99)]
+        print(f"{op:<14} {o['count']:>8} {o['throughput']:>10.1f} {p[0]:>9.3f} {p[1]:>9.3f} {p[2]:>9.3f}")
+    print(f"total {report['operations']} ops, {report['throughput']:.1f} ops/s, "
+          f"errors={report['errors']} lock_errors={report['lock_errors']} retries={report['retries']}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,9 @@ setup(
         "SQLAlchemy>=2.0",
         "pretty_logger>=0.1",  # replace with exact version if pinned
     ],
+    extras_require={
+        "arrow": ["pyarrow>=12"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3.11",
         "License :: OSI Approved :: MIT License",
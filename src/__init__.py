@@ -8,22 +8,60 @@ Exposes:
 - construct_folder_path: Utility for building folder paths
 - ControlDBManager: Manages multiple ControlDB instances
 - ExcelManager: Manages Excel data integration
+- DataGenerator: Synthetic datasets for load and scale testing
+- PartitionedTable: Time-partitioned logical tables over several databases
+- ShardedTable: Hash-sharded logical tables over several databases
+- AsyncControlDB / AsyncControlDBManager: asyncio facade with per-database executors
 """
 # print(" - __Init__: ControlDB ")
-from .excel_manager import ExcelManager
-from .utils import UtilsTable, UtilsRow, require_authorization
+import importlib
 
-from .controldb import ControlDB, construct_folder_path
-from .controldb_manager import ControlDBManager
+# Public names are imported on first access so `import src` does not pull in
+# pandas/numpy/openpyxl or the Access drivers until they are actually used.
+_LAZY = {
+    "ControlDB": ".controldb",
+    "construct_folder_path": ".controldb",
+    "ControlDBManager": ".controldb_manager",
+    "ExcelManager": ".excel_manager",
+    "DataGenerator": ".data_generator",
+    "PartitionedTable": ".partitioned_table",
+    "ShardedTable": ".sharded_table",
+    "AsyncControlDB": ".async_controldb",
+    "AsyncControlDBManager": ".async_controldb",
+    "UtilsTable": ".utils",
+    "UtilsRow": ".utils",
+    "TimeSeriesTable": ".utils",
+    "require_authorization": ".utils",
+    "ROOTBASE": ".models.root",
+    "UserTable": ".models.root",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-from .models.root import ROOTBASE, UserTable
 
 __all__ = [
     "ControlDB",
     "ControlDBManager",
     "ExcelManager",
+    "DataGenerator",
+    "PartitionedTable",
+    "ShardedTable",
+    "AsyncControlDB",
+    "AsyncControlDBManager",
     "construct_folder_path",
     "UtilsTable",
     "UtilsRow",
+    "TimeSeriesTable",
     "require_authorization",
 ]
\ No newline at end of file
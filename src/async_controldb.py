@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+AsyncControlDB
+==============
+
+asyncio facade for ControlDB, UtilsTable/UtilsRow and ControlDBManager.
+
+pyodbc and sqlite3 are blocking, so every call is offloaded to a bounded
+thread pool owned by the database (the event loop only awaits the result).
+Reads run concurrently on that pool; writes are additionally serialised per
+database file with an ``asyncio.Lock``, so coroutines queue on the loop instead
+of blocking worker threads on the file lock.
+
+Cancelling a coroutine drops its job if it has not started yet. A job that is
+already running cannot be stopped: a read finishes in the background and its
+result is discarded, a write keeps the file lock until it has finished so the
+next write never overlaps it.
+
+Usage:
+------
+>>> manager = AsyncControlDBManager("MyDB", rootPath=path, db_type="db")
+>>> await manager.login("admin", password="pw")
+>>> db = manager.get("tenant")
+>>> coins = await db.load_table("CoinTable")
+>>> id = await coins.create(symbol="BTC", total=1.5)
+>>> await coins.merge(id, {"total": 2.0})
+>>> df = await coins.get_df()
+>>> await manager.close()
+"""
+
+import os
+import asyncio
+import functools
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+from pretty_logger import PrettyLogger, prettylog
+
+from .controldb import ControlDB
+from .controldb_manager import ControlDBManager
+from .utils import UtilsTable
+
+
+# One write lock per (event loop, database file); asyncio locks are bound to a loop
+_write_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, asyncio.Lock]]" = weakref.WeakKeyDictionary()
+
+
+def _write_lock(path: str) -> asyncio.Lock:
+    """Return the write lock of a database file for the running loop."""
+    locks = _write_locks.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(os.path.normcase(os.path.abspath(path)), asyncio.Lock())
+
+
+@prettylog
+class AsyncControlDB:
+    """Awaitable wrapper of one ControlDB with its own bounded executor."""
+
+    @property
+    def name(self) -> str:
+        return self.db.name
+
+    @property
+    def id(self) -> int:
+        return self.db.id
+
+    @property
+    def authorized(self) -> bool:
+        return self.db.authorized
+
+    def __init__(self, db: ControlDB, workers: int = 4, logLevel: int = 30):
+        """
+        Wrap a ControlDB.
+
+        Args:
+            db (ControlDB): Database to wrap. Only a database created with
+                ``scoped=True`` gets `workers` threads; a plain session is not
+                thread-safe, so other databases are served by a single thread.
+            workers (int): Maximum number of concurrent calls (default: 4).
+            logLevel (int): Logging level (default: 30).
+        """
+        self.logLevel = logLevel
+        self.logger: PrettyLogger
+        self.db = db
+        if not db.scoped and workers > 1:
+            self.logger.debug(f"ℹ️ '{db.name}' has no scoped sessions, using a single worker thread")
+            workers = 1
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"controldb-{db.name}")
+
+    async def __aenter__(self) -> "AsyncControlDB":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    # ---------------------- 🔹 EXECUTION ----------------------
+
+    def _call(self, fn, *args, **kwargs):
+        """Run fn in a worker thread and release the thread's scoped session afterwards."""
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.db.release_session()
+
+    async def run(self, fn, *args, write: bool = False, **kwargs):
+        """
+        Await a blocking call on the database's executor.
+
+        Args:
+            fn (callable): Function to run, e.g. a bound ControlDB/UtilsTable method.
+            write (bool): Serialise with the other writes to the same file (default: False).
+
+        Returns:
+            Any: Result of fn.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(self._call, fn, *args, **kwargs)
+        if not write:
+            return await loop.run_in_executor(self._executor, call)
+
+        async with _write_lock(self.db.filePath):
+            job = self._executor.submit(call)
+            future = asyncio.wrap_future(job, loop=loop)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Keep the lock until a running write has finished (a queued one is dropped)
+                if not job.cancel():
+                    await asyncio.wait([future])
+                raise
+
+    # ---------------------- 🔹 DATABASE ----------------------
+
+    async def connect(self, password: str = "", base=None) -> bool:
+        """Await ControlDB.connect(); table handles of the old connection must be reloaded."""
+        return await self.run(self.db.connect, password=password, base=base, write=True)
+
+    async def get_table_names(self) -> list[str]:
+        return await self.run(self.db.get_table_names)
+
+    async def load_table(self, table_identity) -> "AsyncTable":
+        """Await ControlDB.load_table() and return its awaitable handle."""
+        table = await self.run(self.db.load_table, table_identity)
+        return AsyncTable(self, table)
+
+    async def create_table(self, table_name: str, column_def: dict) -> "AsyncTable | None":
+        """Await ControlDB.create_table() and return its awaitable handle."""
+        table = await self.run(self.db.create_table, table_name, column_def, write=True)
+        return AsyncTable(self, table) if table is not None else None
+
+    async def detach(self) -> None:
+        await self.run(self.db.detach, write=True)
+
+    async def close(self) -> None:
+        """Detach the database and shut its executor down."""
+        if self.db.authorized:
+            await self.detach()
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+
+class AsyncTable:
+    """Awaitable wrapper of one UtilsTable and its UtilsRow."""
+
+    def __init__(self, owner: AsyncControlDB, table: UtilsTable):
+        self.owner = owner
+        self.table = table
+
+    @property
+    def name(self) -> str:
+        return self.table.table.name
+
+    def _row(self, fn, id):
+        # table.row is per worker thread, so concurrent calls never share the target ID
+        row = self.table.row
+        row.id = id
+        return fn(row)
+
+    # ---------------------- 🔹 ROW CRUD ----------------------
+
+    async def get(self, id: int) -> dict | None:
+        """Await UtilsRow.get(id)."""
+        return await self.owner.run(self._row, lambda row: row.get(), id)
+
+    async def create(self, *args, **kwargs) -> int | None:
+        """Await UtilsRow.create() and return the new row ID (None on failure)."""
+        return await self.owner.run(self._row, lambda row: row.create(*args, **kwargs), None, write=True)
+
+    async def merge(self, id: int | None, data: dict) -> bool:
+        """Await UtilsRow.merge(data) on row `id` (None creates a new row)."""
+        return await self.owner.run(self._row, lambda row: row.merge(data), id, write=True)
+
+    async def replace(self, id: int | None, data: dict) -> bool:
+        """Await UtilsRow.replace(data) on row `id`."""
+        return await self.owner.run(self._row, lambda row: row.replace(dict(data)), id, write=True)
+
+    async def delete(self, id: int) -> bool:
+        """Await UtilsRow.delete() on row `id`."""
+        return await self.owner.run(self._row, lambda row: row.delete(), id, write=True)
+
+    # ---------------------- 🔹 BULK ----------------------
+
+    async def insert_dataframe(self, df, coerce: bool = True, chunk_size: int = 1000) -> int | None:
+        """Await UtilsTable.insert_dataframe()."""
+        return await self.owner.run(self.table.insert_dataframe, df, coerce=coerce,
+                                    chunk_size=chunk_size, write=True)
+
+    async def update_column_value(self, row_id: int, column_name: str, new_value):
+        return await self.owner.run(self.table.update_column_value, row_id, column_name, new_value, write=True)
+
+    # ---------------------- 🔹 READ ----------------------
+
+    async def get_df(self):
+        """Await UtilsTable.get_df_table()."""
+        return await self.owner.run(self.table.get_df_table)
+
+    async def get_column_as_list(self, column_name: str) -> list:
+        return await self.owner.run(self.table.get_column_as_list, column_name)
+
+    async def to_numpy(self, columns=None, where=None, chunk_size: int = 50_000):
+        """Await UtilsTable.to_numpy()."""
+        return await self.owner.run(self.table.to_numpy, columns, where=where, chunk_size=chunk_size)
+
+
+@prettylog
+class AsyncControlDBManager:
+    """Awaitable wrapper of ControlDBManager; databases are wrapped as AsyncControlDB."""
+
+    def __init__(self, dbName: str = "database", rootPath: str = None, db_type: str = "mdb",
+                 logLevel: int = 30, workers: int = 4, instrument: bool = False):
+        """
+        Create the manager with scoped sessions so every database can serve `workers` threads.
+
+        Args:
+            dbName (str): Root database name.
+            rootPath (str): Folder holding the databases (default: cwd).
+            db_type (str): "mdb", "accdb" or "db"/"sqlite".
+            logLevel (int): Logging level (default: 30).
+            workers (int): Executor size per database (default: 4).
+            instrument (bool): Collect query statistics (default: False).
+        """
+        self.logLevel = logLevel
+        self.logger: PrettyLogger
+        self.workers = workers
+        self.manager = ControlDBManager(dbName, rootPath=rootPath, db_type=db_type, logLevel=logLevel,
+                                        instrument=instrument, scoped=True)
+        # The manager's own state (databaseDir, root rows) is not thread-safe: one thread
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="controldb-manager")
+        self._databases: dict[int, AsyncControlDB] = {}
+
+    async def __aenter__(self) -> "AsyncControlDBManager":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def _run(self, fn, *args, **kwargs):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, functools.partial(fn, *args, **kwargs))
+
+    async def setup(self, *args, **kwargs):
+        return await self._run(self.manager.setup, *args, **kwargs)
+
+    async def login(self, userName: str, password: str = "") -> bool:
+        return await self._run(self.manager.login, userName, password=password)
+
+    async def create(self, *args, **kwargs) -> AsyncControlDB:
+        """Await ControlDBManager.create() and return the wrapped database."""
+        db = await self._run(self.manager.create, *args, **kwargs)
+        return self._wrap(db)
+
+    def get(self, identity: int | str) -> AsyncControlDB | None:
+        """Return the wrapped database by ID or name (no I/O)."""
+        db = self.manager.get(identity)
+        return self._wrap(db) if db is not None else None
+
+    def _wrap(self, db: ControlDB) -> AsyncControlDB:
+        handle = self._databases.get(db.id)
+        if handle is None or handle.db is not db:
+            handle = self._databases[db.id] = AsyncControlDB(db, workers=self.workers, logLevel=self.logLevel)
+        return handle
+
+    async def query_all(self, *args, **kwargs):
+        """Await ControlDBManager.query_all(); errors are in ``self.manager.query_errors``."""
+        return await self._run(self.manager.query_all, *args, **kwargs)
+
+    async def close(self) -> None:
+        """Detach all databases and shut every executor down."""
+        for handle in list(self._databases.values()):
+            await handle.close()
+        self._databases.clear()
+        if self.manager.authorized:
+            await self._run(self._detach_unwrapped)
+        await asyncio.get_running_loop().run_in_executor(None, self._executor.shutdown)
+
+    def _detach_unwrapped(self) -> None:
+        # Wrapped databases are already detached and ControlDB.detach() sleeps: skip them
+        for db in self.manager.databaseDir.values():
+            if db.authorized:
+                self.logger.debug(" -> Detach Database: %s", db.name)
+                db.detach()
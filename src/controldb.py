@@ -27,19 +27,19 @@ Usage:
 
 import os, sys, time, gc, stat
 import shutil
+import sqlite3
+import pathlib
 import inspect
 import functools
-import pyodbc
-import msaccessdb
-import urllib
-import pandas as pd
-import win32com.client
+import contextlib
+from typing import TYPE_CHECKING
 
 from sqlalchemy import Table, Column, Integer, String
 from sqlalchemy import inspect, insert, delete, select, text, update
 from sqlalchemy import Engine, MetaData, create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 from sqlalchemy.exc import ProgrammingError
+from sqlalchemy.pool import QueuePool
 from sqlalchemy import (
     Column,
     Integer,      # Whole numbers
@@ -57,7 +57,22 @@ from sqlalchemy import (
 )
 from pretty_logger import PrettyLogger
 from .utils import UtilsTable, UtilsRow, require_authorization
-from .excel_manager import ExcelManager
+from .utils.utils_timeseries import TimeSeriesTable
+from .utils.decorators import profiled, profiler
+from .utils.query_stats import QueryStats
+from .utils.log_registry import get_logger
+from .utils.write_lock import WriteCoordinator
+from .utils.backup import Throttle, copy_file, sqlite_backup, last_modified, settle
+
+# pandas/openpyxl (ExcelManager) and the Access drivers (pyodbc, msaccessdb, win32com)
+# are imported on first use to keep `import src` cheap for short-lived jobs.
+if TYPE_CHECKING:
+    from .excel_manager import ExcelManager
+    from .utils.column_cache import ColumnCache
+
+
+# File extensions handled by the embedded SQLite backend; everything else is MS Access
+SQLITE_TYPES = ("db", "sqlite", "sqlite3")
 
 
 def construct_folder_path(rootPath: str, folderSystem: str | list[str] = None, levels_up: int = 0) -> str:
@@ -181,7 +196,8 @@ class ControlDB():
     """
 
     def __init__(self, fileName: str, rootPath: str = None, folderSystem: str | list[str] = None,
-                 db_type: str = "mdb", logLevel: int = 30):
+                 db_type: str = "mdb", logLevel: int = 30, instrument: bool = False,
+                 scoped: bool = False, pool_size: int = 5, write_deadline: float = None):
         """
         Initialize ControlDB instance.
 
@@ -197,29 +213,54 @@ class ControlDB():
             Database extension (mdb/accdb).
         logLevel : int, optional
             Logger level (default=30).
+        instrument : bool, optional
+            Record query statistics, see ``stats()`` (default=False).
+        scoped : bool, optional
+            Use a thread-local ``scoped_session`` on a pooled engine so one instance
+            can serve concurrent threads; each thread also gets its own ``table.row``
+            helper, so one table handle can be shared (default=False).
+        pool_size : int, optional
+            Connection pool size in scoped mode (default=5).
+        write_deadline : float, optional
+            Coordinate row and bulk writes with other threads and processes through
+            an advisory lock file, retrying lock errors with backoff for up to this
+            many seconds (default=None, uncoordinated).
         """
         self.logLevel: PrettyLogger = logLevel
-        logCtr = PrettyLogger()
         moduleName: str = "ControlDB"
-        self.logger: PrettyLogger = logCtr.get(moduleName)
-        logCtr.add_stream(moduleName, level=logLevel)
+        self.logger: PrettyLogger = get_logger(moduleName, level=logLevel)
 
         # super().__init__()
 
         self.engine: Engine = None
-        self.session: Session = None
+        self.session: Session | scoped_session = None
         self.base: MetaData | list[MetaData] = None
         self.__id: int = None
         self.__authorized: bool = False
-        self.excel = ExcelManager(logLevel=self.logLevel)
+        self.__excel: "ExcelManager" = None
+        self.__tables: dict = {}
+        self.query_stats: QueryStats | None = QueryStats() if instrument else None
+        self.__scoped: bool = scoped
+        self.__pool_size: int = pool_size
+        self.__write_deadline: float | None = write_deadline
+        self.__read_only: bool = False
+        self.__writer: WriteCoordinator | None = None
 
         self.__rootPath = rootPath if rootPath else os.getcwd()
         self.__folderSystem:str = os.path.join(*folderSystem) if isinstance(folderSystem, list) else folderSystem
         self.__fileName: str = fileName
         self.__db_type: str = db_type
 
-        self.logger.debug(f'  - {moduleName} -> __init__')
+        self.logger.debug('  - %s -> __init__', moduleName)
     
+    @property
+    def excel(self) -> "ExcelManager":
+        """Excel handling class, created on first use."""
+        if self.__excel is None:
+            from .excel_manager import ExcelManager
+            self.__excel = ExcelManager(logLevel=self.logLevel)
+        return self.__excel
+
     @property
     def id(self) -> int:
         """Database ID."""
@@ -267,6 +308,73 @@ class ControlDB():
         """Whether user is authorized."""
         return self.__authorized
 
+    @property
+    def scoped(self) -> bool:
+        """Whether sessions are thread-local (``scoped_session``)."""
+        return self.__scoped
+
+    @property
+    def writer(self) -> WriteCoordinator | None:
+        """Write coordinator of the database file (created on connect when ``write_deadline`` is set)."""
+        return self.__writer
+
+    @property
+    def read_only(self) -> bool:
+        """Whether the current connection is read-only (see ``reader()``)."""
+        return self.__read_only
+
+    @property
+    def is_sqlite(self) -> bool:
+        """Whether the database file uses the embedded SQLite backend."""
+        return self.__db_type.lower() in SQLITE_TYPES
+
+    def stats(self) -> dict | None:
+        """
+        Return query statistics collected since the instance was created.
+
+        Returns
+        -------
+        dict or None
+            ``QueryStats.snapshot()`` (query latency histograms and affected rows per
+            statement shape, commits, rollbacks, connection checkout times) plus the write lock
+            metrics under ``"write_lock"`` when writes are coordinated, or None if the
+            instance was created without ``instrument=True`` and ``write_deadline``.
+        """
+        if self.query_stats is None and self.__writer is None:
+            return None
+        snapshot = self.query_stats.snapshot() if self.query_stats is not None else {}
+        if self.__writer is not None:
+            snapshot["write_lock"] = self.__writer.snapshot()
+        return snapshot
+
+    @contextlib.contextmanager
+    def profile(self, cprofile: bool = False, memory: bool = False, top: int = 20):
+        """
+        Profile the @profiled hot paths (UtilsRow/UtilsTable methods, load_table)
+        for the duration of a with-block and log a report when it exits.
+
+        Counters are process-wide: calls on other databases during the block are included.
+
+        Parameters
+        ----------
+        cprofile : bool, optional
+            Also run cProfile over the block (default=False).
+        memory : bool, optional
+            Also record tracemalloc allocation differences (default=False).
+        top : int, optional
+            Number of entries in the logged report (default=20).
+
+        Example
+        -------
+        >>> with db.profile() as report:
+        ...     table.row.merge({"value": 1})
+        >>> report.methods[0]["method"]
+        'UtilsRow.merge'
+        """
+        with profiler.session(cprofile=cprofile, memory=memory) as report:
+            yield report
+        self.logger.info("   -> Hot-path report for %s:\n%s", self.name, report.format(top=top))
+
     @staticmethod
     def get_folders(path: str) -> list[str]:
         """Return list of folders in a directory."""
@@ -291,6 +399,8 @@ class ControlDB():
         -------
         >>> db.__set_mdb_password("MyDB.mdb", "newpassword123")
         """
+        import win32com.client
+
         engine = win32com.client.Dispatch("DAO.DBEngine.120")
         # Open in EXCLUSIVE mode: (Exclusive=True, ReadOnly=False)
         db = engine.OpenDatabase(filepath, True, False, ";PWD=")
@@ -313,19 +423,19 @@ class ControlDB():
         >>> print(folder_path)
         """
         self.logger.info("   -> Create Folder Path")
-        self.logger.debug(f"     => Root Path:      {self.rootPath}")
-        self.logger.debug(f"     => File Folder:    {self.fileFolder}")
-        self.logger.debug(f"     => File Path:      {self.filePath}")
+        self.logger.debug("     => Root Path:      %s", self.rootPath)
+        self.logger.debug("     => File Folder:    %s", self.fileFolder)
+        self.logger.debug("     => File Path:      %s", self.filePath)
 
         if not os.path.exists(self.rootPath):
             os.makedirs(self.rootPath, exist_ok=True)
-            self.logger.info(f"     => Root Path created.")
+            self.logger.info("     => Root Path created.")
 
         if not os.path.exists(self.fileFolder):
             os.makedirs(self.fileFolder, exist_ok=True)
-            self.logger.info(f"     => Folder Path created.")
+            self.logger.info("     => Folder Path created.")
         else:
-            self.logger.info(f"     => Folder Path present.")
+            self.logger.info("     => Folder Path present.")
 
         return self.rootPath
 
@@ -352,13 +462,19 @@ class ControlDB():
         self.__create_path()
 
         fileNameOnly = os.path.basename(self.filePath)
-        self.logger.info(f"   -> Create File {fileNameOnly}")
-        self.logger.debug(f"     => File Path: {self.filePath}")
+        self.logger.info("   -> Create File %s", fileNameOnly)
+        self.logger.debug("     => File Path: %s", self.filePath)
         
 
         if not os.path.exists(self.filePath):
-            msaccessdb.create(self.filePath)
-            self.__set_mdb_password(self.filePath, password)
+            if self.is_sqlite:
+                sqlite3.connect(self.filePath).close()
+                if password:
+                    self.logger.warning("     => SQLite databases are not password protected; password ignored.")
+            else:
+                import msaccessdb
+                msaccessdb.create(self.filePath)
+                self.__set_mdb_password(self.filePath, password)
             self.logger.info("     => File created.")
             return True
         else:
@@ -415,7 +531,7 @@ class ControlDB():
 
         return True
 
-    def connect(self, password: str = "", base: MetaData | list[MetaData] = None) -> bool:
+    def connect(self, password: str = "", base: MetaData | list[MetaData] = None, read_only: bool = False) -> bool:
         """
         Connect to an MS Access database and initialize SQLAlchemy session.
 
@@ -425,6 +541,9 @@ class ControlDB():
             Database password (default="").
         base : MetaData or list[MetaData], optional
             Metadata or declarative bases for table creation.
+        read_only : bool, optional
+            Open the file read-only (Access ``ReadOnly=1``, SQLite ``mode=ro``), e.g.
+            for reporting next to a writing instance; see ``reader()`` (default=False).
 
         Returns
         -------
@@ -447,13 +566,20 @@ class ControlDB():
         True
         """
         if not os.path.exists(self.filePath):
-            self.logger.error(f"    ❌ - Database file not found: {self.filePath}")
+            self.logger.error("    ❌ - Database file not found: %s", self.filePath)
             raise FileNotFoundError(f"Database file does not exist: {self.filePath}")
 
+        self.__read_only = read_only
+        if self.is_sqlite:
+            return self.__connect_sqlite(base=base)
+
+        import pyodbc
+        from urllib.parse import quote_plus
+
         msa_drivers = [x for x in pyodbc.drivers() if "ACCESS" in x.upper()]
         if "Microsoft Access Driver (*.mdb, *.accdb)" not in msa_drivers:
             self.logger.critical("=! Wrong engine installed. Please install 64-bit MS Access Driver.")
-            self.logger.info(f"   => Available MS-ACCESS Drivers: {msa_drivers}")
+            self.logger.info("   => Available MS-ACCESS Drivers: %s", msa_drivers)
             raise ConnectionRefusedError("No valid MS Access ODBC driver found!")
 
         try:
@@ -466,11 +592,15 @@ class ControlDB():
                     con_parts.append(f"Pwd={password};")
                 else:
                     self.logger.warning(" -> ACCDB database not password protected")
+            if read_only:
+                con_parts.append("ReadOnly=1;")
 
             con_string = "".join(con_parts)
-            connection_url = f"access+pyodbc:///?odbc_connect={urllib.parse.quote_plus(con_string)}"
+            connection_url = f"access+pyodbc:///?odbc_connect={quote_plus(con_string)}"
 
-            self.engine = create_engine(connection_url)
+            self.engine = create_engine(connection_url, **self.__engine_options())
+            if self.query_stats is not None:
+                self.query_stats.attach(self.engine)
             with self.engine.connect():
                 pass
         except pyodbc.Error as e:
@@ -485,22 +615,216 @@ class ControlDB():
 
         self.__authorized = True
         self.base = base if base else MetaData()
-        _Session = sessionmaker(bind=self.engine)
-        self.session = _Session()
+        self.session = self.__make_session()
+        self.__tables.clear()
+        if self.__write_deadline is not None and self.__writer is None and not self.__read_only:
+            self.__writer = WriteCoordinator(self.filePath, deadline=self.__write_deadline)
 
-        self.logger.info(f"   -> Connect to database: {self.name} => Connection established successfully.")
-        self.logger.debug(f"     => File path of database: {self.filePath}")
+        self.logger.info("   -> Connect to database: %s => Connection established successfully.", self.name)
+        self.logger.debug("     => File path of database: %s", self.filePath)
 
         return True
     
+    def __connect_sqlite(self, base: MetaData | list[MetaData] = None) -> bool:
+        """
+        Connect to an SQLite database file and initialize SQLAlchemy session.
+
+        SQLite has no password; it is used as an embedded stand-in for MS Access
+        (benchmarks, load tests, platforms without the Access ODBC driver).
+        Read-only instances open the file as ``file:...?mode=ro`` URI.
+        """
+        if self.__read_only:
+            uri = pathlib.Path(self.filePath).resolve().as_uri() + "?mode=ro"
+            self.engine = create_engine(
+                "sqlite://", creator=lambda: sqlite3.connect(uri, uri=True, check_same_thread=False),
+                poolclass=QueuePool, **self.__engine_options())
+        else:
+            self.engine = create_engine(f"sqlite:///{self.filePath}", **self.__engine_options())
+        if self.query_stats is not None:
+            self.query_stats.attach(self.engine)
+        with self.engine.connect():
+            pass
+
+        self.__authorized = True
+        self.base = base if base else MetaData()
+        self.session = self.__make_session()
+        self.__tables.clear()
+        if self.__write_deadline is not None and self.__writer is None and not self.__read_only:
+            self.__writer = WriteCoordinator(self.filePath, deadline=self.__write_deadline)
+
+        self.logger.info("   -> Connect to database: %s => Connection established successfully.", self.name)
+        self.logger.debug("     => File path of database: %s", self.filePath)
+        return True
+
+    def reader(self, password: str = "") -> "ControlDB":
+        """
+        Open a separate read-only connection to the same database file.
+
+        Reporting queries on the reader do not share the engine, session or
+        transactions of this (writing) instance. SQLite files are switched to WAL
+        journaling first, so readers see the last committed snapshot while writers
+        keep committing; Access readers use a ``ReadOnly=1`` connection.
+
+        The switch to WAL is persistent: it is stored in the database file and
+        outlives the reader, this instance and later connections, and adds the
+        ``<file>-wal`` and ``<file>-shm`` files next to it while connections are
+        open. Run ``PRAGMA journal_mode=DELETE`` on the writer once no reader is
+        open to return to the default rollback journal.
+
+        Parameters
+        ----------
+        password : str, optional
+            Database password (Access only, default="").
+
+        Returns
+        -------
+        ControlDB
+            Connected read-only instance; call ``detach()`` when done.
+
+        Example
+        -------
+        >>> reporting = db.reader(password="pw")
+        >>> df = reporting.load_table("CoinTable").get_df_table()
+        >>> reporting.detach()
+        """
+        if self.is_sqlite and self.authorized and not self.__read_only:
+            with self.engine.connect() as conn:
+                conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+
+        reader = ControlDB(self.__fileName, rootPath=self.__rootPath, folderSystem=self.__folderSystem,
+                           db_type=self.__db_type, logLevel=self.logLevel, instrument=self.query_stats is not None,
+                           scoped=self.__scoped, pool_size=self.__pool_size)
+        if self.__id is not None:
+            reader.id = self.__id
+        reader.connect(password=password, base=self.base, read_only=True)
+        return reader
+
+    @require_authorization
+    def backup(self, dest: str, incremental: bool = False, max_bytes_per_sec: float = None,
+               pages: int = 1024, throttle: Throttle = None) -> dict:
+        """
+        Copy the database file while it stays online.
+
+        SQLite files are switched to WAL journaling (as for ``reader()``) and
+        copied with the online backup API from one read snapshot, `pages` pages
+        per step, so writers keep committing during the copy. Access files are copied
+        while holding the ``<file>.lock`` write lock (the instance's coordinator, or a
+        temporary one without ``write_deadline``) after closing this instance's session
+        and pooled connections, so coordinated writers pause for the copy; writers
+        that bypass the lock must be paused by the caller. The copy is written next to
+        `dest` and renamed into place, so `dest` is always a complete file. Its modification time is set to the last change of the
+        database when the snapshot started, so an incremental run copies again
+        after any commit the snapshot missed.
+
+        Parameters
+        ----------
+        dest : str
+            Destination file, or an existing directory (the file keeps its name).
+        incremental : bool, optional
+            Skip the copy when the snapshot in `dest` is not older than the last change
+            of the database (default=False).
+        max_bytes_per_sec : float, optional
+            Bandwidth limit for this copy (default=None, unlimited).
+        pages : int, optional
+            SQLite pages copied per step (default=1024).
+        throttle : Throttle, optional
+            Shared bandwidth limiter (overrides `max_bytes_per_sec`), e.g. from ``backup_all``.
+
+        Returns
+        -------
+        dict
+            ``{"database", "path", "bytes", "seconds", "skipped"}``.
+
+        Example
+        -------
+        >>> db.backup("backups/", incremental=True, max_bytes_per_sec=50e6)
+        """
+        if os.path.isdir(dest):
+            dest = os.path.join(dest, os.path.basename(self.filePath))
+        os.makedirs(os.path.dirname(os.path.abspath(dest)), exist_ok=True)
+        throttle = throttle if throttle is not None else Throttle(max_bytes_per_sec)
+        started = time.perf_counter()
+        report = {"database": self.name, "path": dest, "bytes": 0, "seconds": 0.0, "skipped": False}
+
+        if incremental and os.path.exists(dest) and os.path.getmtime(dest) >= last_modified(self.filePath):
+            report.update(bytes=os.path.getsize(dest), skipped=True)
+            self.logger.info(" => Backup of '%s' is up to date: %s", self.name, dest)
+            return report
+
+        partial = dest + ".partial"
+        with contextlib.suppress(OSError):
+            os.remove(partial)  # leftover of an interrupted backup
+        try:
+            if self.is_sqlite:
+                if not self.__read_only:
+                    with self.engine.connect() as conn:
+                        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+                raw = self.engine.raw_connection()
+                try:
+                    # Taken before the snapshot is pinned: later commits are newer than it.
+                    # The first read opens the WAL files (touching -wal), so read once before.
+                    raw.driver_connection.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+                    snapshot = last_modified(self.filePath)
+                    settle(snapshot)
+                    sqlite_backup(raw.driver_connection, partial, pages=pages, throttle=throttle)
+                finally:
+                    raw.close()
+            else:
+                writer = self.__writer if self.__writer is not None else WriteCoordinator(self.filePath)
+                with writer.hold():
+                    # This instance's own connections must not change the file mid-copy
+                    self.session.close()
+                    self.engine.dispose()
+                    snapshot = last_modified(self.filePath)
+                    copy_file(self.filePath, partial, throttle=throttle)
+            os.replace(partial, dest)
+            os.utime(dest, (snapshot, snapshot))
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.remove(partial)
+            self.logger.error("❌ Backup of '%s' to %s failed", self.name, dest, exc_info=True)
+            raise
+
+        report.update(bytes=os.path.getsize(dest), seconds=time.perf_counter() - started)
+        self.logger.info(" => Backup of '%s': %s bytes in %.2fs -> %s",
+                         self.name, report["bytes"], report["seconds"], dest)
+        return report
+
+    def __engine_options(self) -> dict:
+        """Engine keyword arguments; scoped mode gets a pool sized for concurrent threads."""
+        if not self.__scoped:
+            return {}
+        return {"pool_size": self.__pool_size, "max_overflow": self.__pool_size, "pool_pre_ping": True}
+
+    def __make_session(self) -> Session | scoped_session:
+        """Return a plain Session, or a thread-local scoped_session registry in scoped mode."""
+        _Session = sessionmaker(bind=self.engine)
+        return scoped_session(_Session) if self.__scoped else _Session()
+
+    def release_session(self) -> None:
+        """
+        Close the calling thread's session in scoped mode (no-op otherwise).
+
+        Call at the end of each request/task so its connection returns to the pool;
+        the next use in that thread transparently opens a fresh session.
+        """
+        if isinstance(self.session, scoped_session):
+            self.session.remove()
+
     def detach(self)->None:
+        self.__tables.clear()
         try:
             if hasattr(self, "session") and self.session:
-                self.session.close()
+                if isinstance(self.session, scoped_session):
+                    self.session.remove()
+                else:
+                    self.session.close()
                 self.session = None
                 self.logger.debug(" -> Session closed.")
 
             if self.engine:
+                if self.query_stats is not None:
+                    self.query_stats.detach(self.engine)
                 self.engine.dispose()
                 self.engine = None
                 self.logger.debug(" -> Engine disposed.")
@@ -511,7 +835,7 @@ class ControlDB():
             self.__authorized = False
             time.sleep(0.4)  # Let OS flush handles
         except Exception as e:
-            self.logger.error(f"Error while fully closing database: {e}")
+            self.logger.error("Error while fully closing database: %s", e)
   
     def remove_folder(self, exec: bool = False, retries: int = 5, delay: float = 0.5) -> bool:
         """
@@ -533,15 +857,15 @@ class ControlDB():
         """
         # Check if database file still exists
         if os.path.exists(getattr(self, "filePath", "")):
-            self.logger.error(f"Cannot remove folder because database file still exists: {self.filePath}")
+            self.logger.error("Cannot remove folder because database file still exists: %s", self.filePath)
             return False
 
         if not exec:
-            self.logger.info(f"[DRYRUN] Would remove folder: {self.rootPath}")
+            self.logger.info("[DRYRUN] Would remove folder: %s", self.rootPath)
             return False
 
         if not os.path.exists(self.rootPath):
-            self.logger.warning(f"⚠️ Folder does not exist: {self.rootPath}")
+            self.logger.warning("⚠️ Folder does not exist: %s", self.rootPath)
             return False
 
         def _handle_remove_readonly(func, path, _):
@@ -550,20 +874,20 @@ class ControlDB():
                 os.chmod(path, stat.S_IWRITE)
                 func(path)
             except Exception as e:
-                self.logger.warning(f"⚠️ Could not remove {path}: {e}")
+                self.logger.warning("⚠️ Could not remove %s: %s", path, e)
 
         for attempt in range(1, retries + 1):
             try:
                 shutil.rmtree(self.rootPath, onerror=_handle_remove_readonly)
-                self.logger.info(f"✅ Folder successfully removed: {self.rootPath}")
+                self.logger.info("✅ Folder successfully removed: %s", self.rootPath)
                 return True
             except PermissionError as e:
-                self.logger.warning(f"⛔ Permission denied (attempt {attempt}/{retries}): {e}")
+                self.logger.warning("⛔ Permission denied (attempt %s/%s): %s", attempt, retries, e)
             except OSError as e:
-                self.logger.warning(f"⚠️ OS error during remove (attempt {attempt}/{retries}): {e}")
+                self.logger.warning("⚠️ OS error during remove (attempt %s/%s): %s", attempt, retries, e)
             time.sleep(delay)
 
-        self.logger.error(f"❌ Could not remove folder after {retries} attempts: {self.rootPath}")
+        self.logger.error("❌ Could not remove folder after %s attempts: %s", retries, self.rootPath)
         return False
   
     @require_authorization
@@ -597,7 +921,7 @@ class ControlDB():
         >>> db.remove(exec=True)
         True
         """
-        self.logger.debug(f"  - ControlDB -> remove: {self.filePath}")
+        self.logger.debug("  - ControlDB -> remove: %s", self.filePath)
 
         if not exec or not os.path.isfile(self.filePath):
             return False
@@ -607,19 +931,22 @@ class ControlDB():
             try:
                 self.detach()
             except Exception as e:
-                self.logger.warning(f"  -> Could not fully close connections: {e}")
+                self.logger.warning("  -> Could not fully close connections: %s", e)
 
             ldb_file = self.filePath[:-3] + "ldb"
 
             try:
                 if os.path.exists(ldb_file):
-                    self.logger.warning(f" -> LDB lock file exists: {ldb_file}")
+                    self.logger.warning(" -> LDB lock file exists: %s", ldb_file)
                     # Optional: os.remove(ldb_file)  # only if safe
                 os.remove(self.filePath)
-                self.logger.info(f"    ✅ - Database file successfully removed: {self.filePath}")
+                for suffix in (".lock", "-wal", "-shm"):  # WriteCoordinator lock file, SQLite WAL files
+                    with contextlib.suppress(OSError):
+                        os.remove(self.filePath + suffix)
+                self.logger.info("    ✅ - Database file successfully removed: %s", self.filePath)
                 return True
             except PermissionError:
-                self.logger.warning(f"    ⛔ - Retry {attempt}/{retries}")
+                self.logger.warning("    ⛔ - Retry %s/%s", attempt, retries)
                 time.sleep(delay)
 
         raise PermissionError(
@@ -650,40 +977,193 @@ class ControlDB():
         # ✅ Check if table already exists
         existing_tables = self.get_table_names()
         if table_name in existing_tables:
-            self.logger.warning(f"⚠️ Table '{table_name}' already exists. Returning None.")
+            self.logger.warning("⚠️ Table '%s' already exists. Returning None.", table_name)
             return None
         
         table = UtilsTable(logLevel=self.logLevel)
         table.create(table_name, column_def, self.engine, session=self.session, metadata = metadata)
+        table.writer = self.__writer
+        self.__tables[table_name] = table.handle()
 
-        self.logger.info(f"✅ - Table '{table_name}' created successfully with standardized ID column")
+        self.logger.info("✅ - Table '%s' created successfully with standardized ID column", table_name)
         return table
 
+    @profiled
     @require_authorization
     def load_table(self, table_identity: any) -> UtilsTable:
         """
-        Create a UtilsTable object from an existing database table.
+        Return the UtilsTable handle of an existing database table.
+
+        The mapped table is memoised per table for the lifetime of the connection:
+        repeated calls share the Core table, engine, session, resolved ID column and
+        prebuilt row statements, but every call returns its own handle, so row
+        state (row.id, row.last_error) and rejected_rows are never shared between
+        callers. The cache is cleared on connect() and detach().
 
         Args:
             table_identity (str | object): Existing table name (str) or ORM Table/Class (object).
         Returns:
             UtilsTable: Wrapped UtilsTable instance for the existing table.
         """
-        table = UtilsTable(logLevel=self.logLevel)
-        table.load(table_identity, self.engine, session=self.session)
-
-        self.logger.debug(f" => Table '{table_identity}' mapped from existing database")
-        return table
+        table = self.__tables.get(table_identity)
+        if table is None or table.engine is not self.engine:
+            table = UtilsTable(logLevel=self.logLevel)
+            table.load(table_identity, self.engine, session=self.session)
+            table.writer = self.__writer
+            self.__tables[table_identity] = table
+            self.logger.debug(" => Table '%s' mapped from existing database", table_identity)
+
+        return table.handle()
     
+    @require_authorization
+    def create_timeseries(self, table_name: str, keys: dict = None, columns: dict = None,
+                          time_column: str = "time", metadata: MetaData = None) -> TimeSeriesTable | None:
+        """
+        Create an append-optimised time-series (OHLCV) table.
+
+        The primary key is (keys..., time), which acts as the clustered time index.
+
+        Parameters
+        ----------
+        table_name : str
+            Name of the table to create.
+        keys : dict, optional
+            Series key columns leading the primary key, e.g. ``{"symbol": String(16)}``.
+        columns : dict, optional
+            Value columns (default=open/high/low/close/volume as Float).
+        time_column : str, optional
+            Name of the DateTime column (default="time").
+        metadata : MetaData, optional
+            SQLAlchemy MetaData object.
+
+        Returns
+        -------
+        TimeSeriesTable or None
+            The table handle, or None if the table already exists.
+
+        Example
+        -------
+        >>> candles = db.create_timeseries("Kline1m", keys={"symbol": String(16)})
+        >>> candles.append(df)
+        >>> candles.downsample("1h", start=datetime(2024, 1, 1), symbol="BTC")
+        """
+        if table_name in self.get_table_names():
+            self.logger.warning("⚠️ Table '%s' already exists. Returning None.", table_name)
+            return None
+
+        metadata = metadata if metadata is not None else MetaData()
+        table = TimeSeriesTable.build(table_name, metadata, keys=keys, columns=columns, time_column=time_column)
+        table.create(self.engine)
+
+        series = TimeSeriesTable(table, self.engine, session=self.session, time_column=time_column,
+                                 logLevel=self.logLevel)
+        series.writer = self.__writer
+        self.__tables[("timeseries", table_name)] = series
+        self.logger.info("✅ - Time-series table '%s' created", table_name)
+        return series
+
+    @profiled
+    @require_authorization
+    def load_timeseries(self, table_identity: str | Table, time_column: str = "time") -> TimeSeriesTable:
+        """
+        Return the (memoised) TimeSeriesTable handle of an existing time-series table.
+
+        Parameters
+        ----------
+        table_identity : str or Table
+            Table name (reflected from the database) or Core Table.
+        time_column : str, optional
+            Name of the DateTime column (default="time").
+
+        Returns
+        -------
+        TimeSeriesTable
+            Table handle; key columns are the primary key columns other than time.
+        """
+        name = table_identity if isinstance(table_identity, str) else table_identity.name
+        series = self.__tables.get(("timeseries", name))
+        if series is not None and series.engine is self.engine:
+            return series
+
+        table = table_identity if isinstance(table_identity, Table) else \
+            Table(name, MetaData(), autoload_with=self.engine)
+        series = TimeSeriesTable(table, self.engine, session=self.session, time_column=time_column,
+                                 logLevel=self.logLevel)
+        series.writer = self.__writer
+        self.__tables[("timeseries", name)] = series
+        return series
+
+    @require_authorization
+    def column_cache(self, table_identity: any, columns: list[str] = None, cache_dir: str = None) -> "ColumnCache":
+        """
+        Return a memory-mapped columnar cache of numeric table columns.
+
+        Parameters
+        ----------
+        table_identity : str or object
+            Table name or ORM class/Core Table.
+        columns : list[str], optional
+            Columns to cache (default=all numeric non-key columns).
+        cache_dir : str, optional
+            Cache location (default=``.column_cache`` next to the database file).
+
+        Returns
+        -------
+        ColumnCache
+            Cache handle; call ``refresh()`` to pull newly appended rows.
+
+        Example
+        -------
+        >>> cache = db.column_cache("Strategy1Table", columns=["close", "rsi"])
+        >>> cache.refresh()
+        >>> closes = cache.column("close")   # read-only np.memmap
+        """
+        from .utils.column_cache import ColumnCache
+
+        cache_dir = cache_dir or os.path.join(self.fileFolder, ".column_cache")
+        return ColumnCache(self.load_table(table_identity), cache_dir, columns=columns, logLevel=self.logLevel)
+
+    @require_authorization
+    def import_excel(self, table_identity: any, full_path: str, sheet_name: str | int = 0,
+                     chunk_size: int = 1000) -> int | None:
+        """
+        Bulk load an Excel sheet into a table through the shared coercion stage.
+
+        Parameters
+        ----------
+        table_identity : str or object
+            Table name or ORM class/Core Table.
+        full_path : str
+            Path to the Excel file.
+        sheet_name : str or int, optional
+            Sheet to load (default=first sheet).
+        chunk_size : int, optional
+            Rows per executemany batch (default=1000).
+
+        Returns
+        -------
+        int or None
+            Number of rows inserted, or None if reading or inserting failed.
+            Rows that fail type coercion are skipped and logged.
+        """
+        df = self.excel.read_file(full_path, sheet_name=sheet_name)
+        if df is None:
+            return None
+
+        table = self.load_table(table_identity)
+        return table.insert_dataframe(df, chunk_size=chunk_size)
+
     @require_authorization
     def get_table_names(self) -> list[str]:
         """Return a list of non-system table names."""
         try:
+            if self.is_sqlite:
+                return inspect(self.engine).get_table_names()
             with self.engine.connect() as conn:
                 cursor = conn.connection.cursor()
                 names = [n.table_name for n in cursor.tables() if "MSys" not in n.table_name]
                 return names
         except Exception as e:
-            self.logger.warning(f"⚠️ - Could not fetch table names: {e}")
+            self.logger.warning("⚠️ - Could not fetch table names: %s", e)
             return []
         
\ No newline at end of file
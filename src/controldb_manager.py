@@ -1,10 +1,17 @@
 import os, sys, time, gc
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pretty_logger import PrettyLogger, prettylog
-from sqlalchemy import Engine, create_engine, MetaData
+from sqlalchemy import Engine, create_engine, MetaData, select, func
 from sqlalchemy.exc import IntegrityError  # Assuming SQLAlchemy is used
 
 from .controldb import ControlDB, remove_folder, construct_folder_path, construct_file_path, require_authorization
-from .models.root import ROOTBASE, UserTable, DatabaseTable
+from .utils.query_stats import stats_to_json, stats_to_prometheus
+from .utils.backup import Throttle
+from .models.root import ROOTBASE, UserTable, DatabaseTable, LogicalTable, ShardTable
+from .partitioned_table import PartitionedTable, PERIODS, dump_columns
+from .sharded_table import ShardedTable
 
 
 @prettylog
@@ -25,10 +32,14 @@ class ControlDBManager():
     def authorized(self)->dict:          
         return self.__authorized   
     
-    def __init__(self, dbName:str="database", rootPath:str=None, db_type: str = "mdb", logLevel: int = 30):    
+    def __init__(self, dbName:str="database", rootPath:str=None, db_type: str = "mdb", logLevel: int = 30,
+                 instrument: bool = False, scoped: bool = False, write_deadline: float = None):    
         self.__dbName:str= dbName  
         self.__db_type:str= db_type   
         self.logLevel:int= logLevel   
+        self.instrument:bool= instrument
+        self.scoped:bool= scoped
+        self.write_deadline:float= write_deadline
         self.logger:PrettyLogger 
          
         self.__userName:str
@@ -43,10 +54,13 @@ class ControlDBManager():
         self.__rootPath = construct_folder_path(rootPath, folderSystem=dbName)
 
         self.databaseDir:dict[int:ControlDB]={}    
+        self.query_errors:dict[str, str]={}
      
     def __create(self, fileName, password="", folderSystem: str = None, base: MetaData|list[MetaData] = None)->ControlDB:
 
-        db = ControlDB(fileName, rootPath=self.rootPath, folderSystem=folderSystem, db_type=self.__db_type, logLevel=self.logLevel)
+        db = ControlDB(fileName, rootPath=self.rootPath, folderSystem=folderSystem, db_type=self.__db_type,
+                       logLevel=self.logLevel, instrument=self.instrument, scoped=self.scoped,
+                       write_deadline=self.write_deadline)
         db.setup(password=password, base=base)
         
         dbRoot:ControlDB = self.databaseDir.get(1)
@@ -55,10 +69,13 @@ class ControlDBManager():
         else:
             dbExec = db
 
-        id = dbExec.row_create(DatabaseTable, name=db.name, rootPath=self.rootPath, 
-                               folderSystem=folderSystem, fileName=fileName, db_type=self.__db_type, 
-                               base=str(base) if base is not None else None, 
-                               logLevel=self.logLevel)
+        id = dbExec.load_table(DatabaseTable).row.create(
+            name=db.name, rootPath=self.rootPath,
+            folderSystem=folderSystem, fileName=fileName, db_type=self.__db_type,
+            base=str(base) if base is not None else None,
+            logLevel=self.logLevel)
+        if id is None:
+            raise RuntimeError(f"Could not register database '{db.name}' in DatabaseTable")
         
         db.id = id
         return db
@@ -78,7 +95,7 @@ class ControlDBManager():
         """
 
         # Construct the path to the root database file
-        root_file_path = os.path.join(self.rootPath, "root.db")  # adjust to your actual root file name
+        root_file_path = construct_file_path(self.rootPath, "root", db_type=self.__db_type)
 
         # Check if the root folder and root database file already exist
         if os.path.isdir(self.rootPath) and os.path.isfile(root_file_path):
@@ -90,17 +107,18 @@ class ControlDBManager():
 
         # Create the database (this also initializes internal tables)
         db: ControlDB = self.__create("root", password=password, base=ROOTBASE)
+        self.databaseDir[db.id] = db
         self.__setup = True  # Flag that setup is in progress
 
         # Login with the root user
         self.login(username, password=password)
 
         # Attempt to create the root user row in the UserTable
-        try:
-            db.row_create(UserTable, username=username, fullname=fullname, password=password, email=email)
+        # (UtilsRow.create rolls back and returns None on the unique constraint)
+        userID = db.load_table(UserTable).row.create(username=username, fullname=fullname, password=password, email=email)
+        if userID is not None:
             self.logger.info(f"✅ Root user '{username}' created successfully.")
-        except IntegrityError:
-            # This occurs if the username already exists due to the unique constraint
+        else:
             self.logger.info(f"ℹ️ Root user '{username}' already exists — skipping creation.")
 
         # Reset the setup flag
@@ -155,12 +173,13 @@ class ControlDBManager():
             dbRoot = self.__load_root(password=password)
 
             # Validate user in UserTable
-            userIDs = dbRoot.get.ids(UserTable, "username", userName)
+            users = dbRoot.load_table(UserTable)
+            userIDs = users.session.execute(select(UserTable.ID).where(UserTable.username == userName)).scalars().all()
             if not userIDs:
                 raise NameError(f"User '{userName}' not found in UserTable")
 
             userID = userIDs[0]
-            row = dbRoot.get.row(UserTable, userID)
+            row = users.get_row_dict(userID)
 
             # Explicit validation of both username and password
             if row["username"] != userName:
@@ -217,7 +236,10 @@ class ControlDBManager():
             "root",
             rootPath=self.rootPath,
             db_type=self.__db_type,
-            logLevel=self.logLevel
+            logLevel=self.logLevel,
+            instrument=self.instrument,
+            scoped=self.scoped,
+            write_deadline=self.write_deadline
         )
         dbRoot.id = 1
         dbRoot.connect(password=password)
@@ -248,17 +270,21 @@ class ControlDBManager():
         """
         dbRoot = self.__load_root(password=password)
 
-        for id in dbRoot.get.column_as_list(DatabaseTable, "ID"):
-            if id == 1:
-                continue  # Skip root itself
+        databases = dbRoot.load_table(DatabaseTable)
+        for id in databases.get_column_as_list("ID"):
+            if id == 1 or id in self.databaseDir:
+                continue  # Skip root itself and databases already loaded
 
-            row = dbRoot.get.row(DatabaseTable, id)
+            row = databases.get_row_dict(id)
             dbX = ControlDB(
                 row["fileName"],
                 rootPath=row["rootPath"],
                 folderSystem=row["folderSystem"],
                 db_type=row["db_type"],
-                logLevel=row["logLevel"]
+                logLevel=row["logLevel"],
+                instrument=self.instrument,
+                scoped=self.scoped,
+                write_deadline=self.write_deadline
             )
             dbX.connect(password=password, base=row["base"])
             dbX.id = id
@@ -285,13 +311,303 @@ class ControlDBManager():
             return self.databaseDir.get(indentity, None)
 
         # If 'indentity' is a string, treat it as the database name
-        for db in self.databaseDir:
+        for db in self.databaseDir.values():
             if db.name == indentity:
                 return db
 
         # Return None if no matching database is found
         return None
         
+    @require_authorization
+    def _register_logical(self, name: str, kind: str, options: dict) -> int:
+        """Register a logical table (partitioned/sharded) in the root database and return its ID."""
+        dbRoot = self.__load_root(password=self.__password)
+        # Root databases created before logical tables existed get the new tables here
+        ROOTBASE.metadata.create_all(bind=dbRoot.engine)
+
+        id = dbRoot.load_table(LogicalTable).row.create(name=name, kind=kind, options=json.dumps(options))
+        if id is None:
+            raise ValueError(f"Logical table '{name}' already exists")
+        return id
+
+    @require_authorization
+    def create_partitioned(self, name: str, period: str | None = "month", max_bytes: int | None = None,
+                           keys: dict = None, columns: dict = None, time_column: str = "time",
+                           workers: int = 4) -> PartitionedTable:
+        """
+        Create a time-partitioned logical table.
+
+        Every period (and, with ``max_bytes``, every size rollover) is a separate
+        ControlDB file registered in ``DatabaseTable``, created on the first append
+        that needs it.
+
+        Parameters
+        ----------
+        name : str
+            Logical table name (also the table name inside every partition).
+        period : str or None
+            "day", "month", "year", or None to roll over on size only (default="month").
+        max_bytes : int, optional
+            Start a new file once the current partition file reaches this size
+            (e.g. ``1_800_000_000`` to stay below the 2 GB Access limit).
+        keys : dict, optional
+            Series key columns, e.g. ``{"symbol": String(16)}``.
+        columns : dict, optional
+            Value columns (default=OHLCV).
+        time_column : str, optional
+            Name of the DateTime column (default="time").
+        workers : int, optional
+            Threads used to scan partitions in parallel (default=4).
+
+        Returns
+        -------
+        PartitionedTable
+        """
+        if period not in (*PERIODS, None):
+            raise ValueError(f"Unknown period '{period}', choose from {PERIODS} or None")
+
+        options = {
+            "period": period,
+            "max_bytes": max_bytes,
+            "time_column": time_column,
+            "keys": dump_columns(keys),
+            "columns": dump_columns(columns) if columns is not None else None,
+        }
+        self._register_logical(name, "partitioned", options)
+        self.logger.info(f"✅ Partitioned table '{name}' registered (period={period}, max_bytes={max_bytes})")
+        return self.partitioned(name, workers=workers)
+
+    @require_authorization
+    def partitioned(self, name: str, workers: int = 4) -> PartitionedTable:
+        """Open a registered partitioned logical table."""
+        return PartitionedTable(self, name, password=self.__password, workers=workers, logLevel=self.logLevel)
+
+    @require_authorization
+    def create_sharded(self, name: str, shard_key: str, shards: int, columns: dict,
+                       workers: int = 4) -> ShardedTable:
+        """
+        Create a hash-sharded logical table over `shards` new databases.
+
+        Parameters
+        ----------
+        name : str
+            Logical table name (also the table name inside every shard).
+        shard_key : str
+            Column whose value picks the shard (CRC32 of its string form).
+        shards : int
+            Number of shard databases.
+        columns : dict
+            Column name -> SQLAlchemy type; must include `shard_key`. An ``ID`` key is added.
+        workers : int, optional
+            Threads used for concurrent inserts and scans (default=4).
+
+        Returns
+        -------
+        ShardedTable
+        """
+        if shard_key not in columns:
+            raise ValueError(f"Shard key '{shard_key}' must be one of the columns")
+        columns = {c: t for c, t in columns.items() if c.lower() != "id"}
+
+        options = {"shard_key": shard_key, "shards": shards, "columns": dump_columns(columns)}
+        logicalID = self._register_logical(name, "sharded", options)
+
+        dbRoot = self.__load_root(password=self.__password)
+        for number in range(shards):
+            db = self.create(f"{name}_shard{number}", password=self.__password,
+                             folderSystem=os.path.join("shards", name))
+            db.create_table(name, columns)
+            if dbRoot.load_table(ShardTable).row.create(logicalID=logicalID, shard=number, databaseID=db.id) is None:
+                raise RuntimeError(f"Could not register shard {number} of '{name}'")
+
+        self.logger.info(f"✅ Sharded table '{name}' created with {shards} shards on '{shard_key}'")
+        return self.sharded(name, workers=workers)
+
+    @require_authorization
+    def sharded(self, name: str, workers: int = 4) -> ShardedTable:
+        """Open a registered hash-sharded logical table."""
+        return ShardedTable(self, name, workers=workers, logLevel=self.logLevel)
+
+    @require_authorization
+    def query_all(self, table: any, columns: list[str] = None, aggregate: dict = None, where=None,
+                  workers: int = 4, timeout: float = None, databases: list[int | str] = None):
+        """
+        Run the same query against every loaded database concurrently.
+
+        Databases without the table are skipped. Failed or timed out databases do
+        not abort the others: their rows are missing from the result and the
+        reason is stored in ``self.query_errors`` (database name -> message).
+
+        Parameters
+        ----------
+        table : str or object
+            Table name or ORM class.
+        columns : list[str], optional
+            Columns to return; with `aggregate` they are the GROUP BY columns.
+        aggregate : dict, optional
+            Output label -> (function, column), e.g. ``{"total": ("sum", "total")}``;
+            use column "*" for ``count``.
+        where : callable or ColumnElement, optional
+            Filter; a callable receives the database's Core Table, e.g. ``lambda t: t.c.total > 0``.
+        workers : int, optional
+            Maximum number of databases queried at the same time (default=4).
+        timeout : float, optional
+            Seconds a single database query may run before it is interrupted.
+        databases : list[int | str], optional
+            Database IDs or names to query (default=all loaded databases).
+
+        Returns
+        -------
+        pd.DataFrame
+            Rows of all databases, prefixed by ``_db_id`` and ``_db_name`` columns.
+
+        Example
+        -------
+        >>> manager.query_all("CoinTable", aggregate={"total": ("sum", "total")}, timeout=5)
+        """
+        import pandas as pd
+
+        name = table if isinstance(table, str) else getattr(table, "__tablename__", getattr(table, "name", None))
+        targets = list(self.databaseDir.values()) if databases is None else [self.get(d) for d in databases]
+        targets = [db for db in targets if db is not None and db.authorized and name in db.get_table_names()]
+
+        def run(db: ControlDB):
+            core = db.load_table(table).table
+            if aggregate:
+                cols = [core.c[c] for c in columns or []]
+                stmt = select(*cols, *[
+                    (func.count() if column == "*" else getattr(func, fn)(core.c[column])).label(label)
+                    for label, (fn, column) in aggregate.items()
+                ]).select_from(core).group_by(*cols)
+            else:
+                stmt = select(*[core.c[c] for c in columns]) if columns else select(core)
+            if where is not None:
+                stmt = stmt.where(where(core) if callable(where) else where)
+
+            with db.engine.connect() as conn:
+                raw = conn.connection.dbapi_connection
+                timer = None
+                if timeout and hasattr(raw, "interrupt"):   # sqlite3
+                    timer = threading.Timer(timeout, raw.interrupt)
+                    timer.start()
+                elif timeout and hasattr(raw, "timeout"):   # pyodbc query timeout
+                    raw.timeout = max(1, round(timeout))
+                try:
+                    result = conn.execute(stmt)
+                    frame = pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+                finally:
+                    if timer is not None:
+                        timer.cancel()
+                    elif timeout and hasattr(raw, "timeout"):
+                        raw.timeout = 0
+            frame.insert(0, "_db_name", db.name)
+            frame.insert(0, "_db_id", db.id)
+            return frame
+
+        def guarded(db: ControlDB):
+            started = time.perf_counter()
+            try:
+                return run(db)
+            except Exception as e:
+                elapsed = time.perf_counter() - started
+                if timeout and elapsed >= timeout:
+                    e = TimeoutError(f"timed out after {elapsed:.2f}s: {e}")
+                self.logger.error(f"❌ query_all on '{db.name}' failed: {e}")
+                return e
+
+        results = []
+        if targets:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets)))) as pool:
+                results = list(pool.map(guarded, targets))
+
+        self.query_errors = {db.name: str(r) for db, r in zip(targets, results) if isinstance(r, Exception)}
+        frames = [r for r in results if not isinstance(r, Exception)]
+        if not frames:
+            return pd.DataFrame(columns=["_db_id", "_db_name", *(columns or []), *(aggregate or {})])
+        return pd.concat(frames, ignore_index=True)
+
+    @require_authorization
+    def backup_all(self, dest: str, incremental: bool = False, workers: int = 4,
+                   max_bytes_per_sec: float = None) -> dict[str, dict]:
+        """
+        Back up all loaded databases online and in parallel.
+
+        Every database is copied with ``ControlDB.backup()`` into `dest`, mirroring
+        its folder structure. All copies share one bandwidth limit, so a backup run
+        does not saturate the disk or network used by the writers.
+
+        Parameters
+        ----------
+        dest : str
+            Backup root folder.
+        incremental : bool, optional
+            Skip databases unchanged since their last backup (default=False).
+        workers : int, optional
+            Databases copied at the same time (default=4).
+        max_bytes_per_sec : float, optional
+            Combined bandwidth limit of all copies (default=None, unlimited).
+
+        Returns
+        -------
+        dict
+            Database name -> ``{"database", "path", "bytes", "seconds", "skipped"}``;
+            failed backups have an ``"error"`` entry instead of a copy.
+        """
+        throttle = Throttle(max_bytes_per_sec)
+        started = time.perf_counter()
+
+        def run(db: ControlDB) -> dict:
+            target = os.path.join(dest, db.folderSystem or "", os.path.basename(db.filePath))
+            try:
+                return db.backup(target, incremental=incremental, throttle=throttle)
+            except Exception as e:
+                return {"database": db.name, "path": target, "bytes": 0, "seconds": 0.0,
+                        "skipped": False, "error": str(e)}
+
+        databases = [db for db in self.databaseDir.values() if db.authorized]
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(databases) or 1))) as pool:
+            reports = {r["database"]: r for r in pool.map(run, databases)}
+
+        failed = [name for name, r in reports.items() if "error" in r]
+        total = sum(r["bytes"] for r in reports.values() if not r["skipped"])
+        self.logger.info(f"💾 Backup of {len(reports)} databases: {total} bytes in "
+                         f"{time.perf_counter() - started:.2f}s, {len(failed)} failed")
+        if failed:
+            self.logger.error(f"❌ Backup failed for {failed}")
+        return reports
+
+    def stats(self) -> dict[str, dict]:
+        """
+        Collect query statistics of all loaded databases.
+
+        Returns
+        -------
+        dict
+            Database name -> ``ControlDB.stats()`` snapshot, for instrumented or
+            write-coordinated databases only.
+        """
+        result = {}
+        for db in self.databaseDir.values():
+            snapshot = db.stats()
+            if snapshot is not None:
+                result[db.name] = snapshot
+        return result
+
+    def export_stats(self, fmt: str = "json") -> str:
+        """
+        Export the statistics of all loaded databases.
+
+        Parameters
+        ----------
+        fmt : str
+            "json" or "prometheus" (text exposition format for scraping).
+        """
+        if fmt == "json":
+            return stats_to_json(self.stats())
+        if fmt == "prometheus":
+            return stats_to_prometheus(self.stats())
+        raise ValueError(f"Unknown stats format: {fmt}")
+
     @require_authorization
     def detach_all(self, exec: bool = False, retries: int = 5, delay: float = 0.5): 
         self.logger.info("⚠️  Detach all databases")
@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+DataGenerator
+===============
+
+Synthetic datasets for load and scale testing.
+
+Generates pandas DataFrames column-wise with NumPy from SQLAlchemy models
+(ORM classes or Core Tables) and bulk loads them into ControlDB tables
+through UtilsTable.insert_dataframe.
+
+Usage:
+------
+>>> gen = DataGenerator(seed=42)
+>>> df = gen.frame(UserTable, 1000)
+>>> candles = gen.ohlcv(100_000, start="2024-01-01", freq="1min")
+>>> gen.populate(db, KlineTable, 1_000_000, spec={"time": {"distribution": "sequence", "freq": "1min"}})
+"""
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import Table, Boolean, Integer, Float, Numeric, String, Date, DateTime, Time
+from pretty_logger import PrettyLogger, prettylog
+
+
+def _table_of(table_identity) -> Table:
+    """Return the Core Table of an ORM class, Core Table or UtilsTable."""
+    if hasattr(table_identity, "table_class"):
+        table_identity = table_identity.table_class
+    return table_identity if hasattr(table_identity, "c") else table_identity.__table__
+
+
+@prettylog
+class DataGenerator:
+    """
+    Vectorized synthetic data for ControlDB tables.
+
+    Column specs (``spec={column: {...}}``) override the defaults picked from the column type:
+
+    - ``values`` (list) with optional ``weights``: draw from a fixed set
+    - ``cardinality`` (int) with optional ``skew`` (>1, Zipf exponent): strings "<column>_<k>"
+    - ``distribution``: one of
+        "uniform" (low, high), "normal" (mean, std), "lognormal" (mean, sigma),
+        "walk" (start, step), "sequence" (start, step or freq), "constant" (value)
+    - ``null_fraction`` (float): share of missing values
+    """
+
+    def __init__(self, seed: int | None = None, logLevel: int = 30):
+        self.logLevel = logLevel
+        self.logger: PrettyLogger
+        self.rng = np.random.default_rng(seed)
+
+    # ---------------------- 🔹 COLUMNS ----------------------
+
+    def _default_spec(self, column) -> dict:
+        col_type = type(column.type)
+        if issubclass(col_type, Boolean):
+            return {"values": [True, False]}
+        if issubclass(col_type, Integer):
+            return {"distribution": "sequence"} if column.unique else {"distribution": "uniform", "low": 0, "high": 1000}
+        if issubclass(col_type, (Float, Numeric)):
+            return {"distribution": "normal", "mean": 0.0, "std": 1.0}
+        if issubclass(col_type, DateTime):
+            return {"distribution": "sequence", "start": "2024-01-01", "freq": "1min"}
+        if issubclass(col_type, Date):
+            return {"distribution": "sequence", "start": "2024-01-01", "freq": "1D"}
+        if issubclass(col_type, Time):
+            return {"distribution": "uniform", "low": 0, "high": 86400}
+        # String/Text and anything else: strings; unique columns get unique values
+        return {"distribution": "sequence"} if column.unique else {"cardinality": 100}
+
+    def column(self, name: str, col_type: type, rows: int, spec: dict, offset: int = 0) -> np.ndarray | pd.Series:
+        """
+        Generate one column.
+
+        Args:
+            name (str): Column name (used as string prefix).
+            col_type (type): SQLAlchemy type class.
+            rows (int): Number of values.
+            spec (dict): Column spec, see class docstring.
+            offset (int): Position of the first row, so chunked sequences continue.
+
+        Returns:
+            np.ndarray | pd.Series: Generated values.
+        """
+        is_string = issubclass(col_type, String) or not issubclass(
+            col_type, (Boolean, Integer, Float, Numeric, Date, DateTime, Time))
+
+        if "values" in spec:
+            weights = spec.get("weights")
+            if weights is not None:
+                weights = np.asarray(weights, dtype=float) / np.sum(weights)
+            values = np.asarray(spec["values"], dtype=object)
+            result = values[self.rng.choice(len(values), size=rows, p=weights)]
+
+        elif "cardinality" in spec:
+            k = spec["cardinality"]
+            skew = spec.get("skew")
+            if skew:
+                codes = (self.rng.zipf(skew, size=rows) - 1) % k
+            else:
+                codes = self.rng.integers(0, k, size=rows)
+            result = np.char.add(f"{name}_", codes.astype(str)).astype(object)
+
+        else:
+            dist = spec.get("distribution", "uniform")
+            if dist == "uniform":
+                low, high = spec.get("low", 0), spec.get("high", 1)
+                if issubclass(col_type, Integer):
+                    result = self.rng.integers(low, high, size=rows, endpoint=True)
+                else:
+                    result = self.rng.uniform(low, high, size=rows)
+            elif dist == "normal":
+                result = self.rng.normal(spec.get("mean", 0.0), spec.get("std", 1.0), size=rows)
+            elif dist == "lognormal":
+                result = self.rng.lognormal(spec.get("mean", 0.0), spec.get("sigma", 1.0), size=rows)
+            elif dist == "walk":
+                steps = self.rng.normal(0.0, spec.get("step", 1.0), size=rows)
+                result = spec.get("start", 0.0) + steps.cumsum()
+            elif dist == "sequence":
+                if issubclass(col_type, (Date, DateTime)):
+                    freq = spec.get("freq", "1min")
+                    first = pd.Timestamp(spec.get("start", "2024-01-01")) + offset * pd.Timedelta(freq)
+                    result = pd.date_range(first, periods=rows, freq=freq)
+                    result = result.date if issubclass(col_type, Date) and not issubclass(col_type, DateTime) else result
+                else:
+                    start, step = spec.get("start", 1), spec.get("step", 1)
+                    result = start + step * np.arange(offset, offset + rows)
+                    if is_string:
+                        result = np.char.add(f"{name}_", result.astype(str)).astype(object)
+            elif dist == "constant":
+                result = np.full(rows, spec.get("value"), dtype=object)
+            else:
+                raise ValueError(f"Unknown distribution '{dist}' for column '{name}'")
+
+            if issubclass(col_type, Integer) and not is_string:
+                result = np.rint(result).astype(np.int64)
+            elif issubclass(col_type, Time) and dist == "uniform":
+                result = (pd.Timestamp(0) + pd.to_timedelta(np.asarray(result) % 86400, unit="s")).time
+            elif is_string and dist != "sequence":
+                result = np.asarray(result).astype(str).astype(object)
+
+        null_fraction = spec.get("null_fraction", 0.0)
+        if null_fraction:
+            result = pd.Series(result).mask(self.rng.random(rows) < null_fraction)
+        return result
+
+    # ---------------------- 🔹 FRAMES ----------------------
+
+    def frame(self, table_identity, rows: int, spec: dict | None = None, offset: int = 0) -> pd.DataFrame:
+        """
+        Generate rows for a table; autoincrement primary keys are left to the database.
+
+        Args:
+            table_identity: ORM class, Core Table or UtilsTable.
+            rows (int): Number of rows.
+            spec (dict, optional): Column name → column spec overrides.
+            offset (int): Row offset for chunked generation (keeps sequences and unique values going).
+
+        Returns:
+            pd.DataFrame: Generated rows.
+        """
+        spec = spec or {}
+        table = _table_of(table_identity)
+        data = {}
+        for column in table.columns:
+            if column.primary_key and column.name not in spec:
+                continue
+            col_spec = spec.get(column.name) or self._default_spec(column)
+            data[column.name] = self.column(column.name, type(column.type), rows, col_spec, offset=offset)
+        return pd.DataFrame(data)
+
+    def ohlcv(self, rows: int, start: str = "2024-01-01", freq: str = "1min", price: float = 100.0,
+              volatility: float = 0.001, volume: float = 10.0, time_as_string: bool = False) -> pd.DataFrame:
+        """
+        Generate consistent OHLCV candles (KlineTable-style) from a geometric random walk.
+
+        Args:
+            rows (int): Number of candles.
+            start (str): Time of the first candle.
+            freq (str): Candle interval as pandas frequency (e.g. "1min", "1h").
+            price (float): Opening price of the first candle.
+            volatility (float): Standard deviation of log returns per candle.
+            volume (float): Mean volume per candle.
+            time_as_string (bool): Return time as ISO strings (KlineTable stores time as String).
+
+        Returns:
+            pd.DataFrame: Columns time, open, high, low, close, volume.
+        """
+        log_returns = self.rng.normal(0.0, volatility, size=rows)
+        close = price * np.exp(log_returns.cumsum())
+        open_ = np.concatenate(([price], close[:-1]))
+        spread = np.abs(self.rng.normal(0.0, volatility, size=(2, rows))) * close
+        time = pd.date_range(start, periods=rows, freq=freq)
+        return pd.DataFrame({
+            "time": time.strftime("%Y-%m-%d %H:%M:%S") if time_as_string else time,
+            "open": open_,
+            "high": np.maximum(open_, close) + spread[0],
+            "low": np.minimum(open_, close) - spread[1],
+            "close": close,
+            "volume": self.rng.gamma(2.0, volume / 2.0, size=rows),
+        })
+
+    # ---------------------- 🔹 BULK LOADING ----------------------
+
+    def populate(self, db, table_identity, rows: int, spec: dict | None = None,
+                 chunk_size: int = 100_000, frame_fn=None) -> int:
+        """
+        Generate and bulk insert rows into a ControlDB table in chunks.
+
+        Args:
+            db (ControlDB): Connected database.
+            table_identity: Table name, ORM class or Core Table.
+            rows (int): Total rows to insert.
+            spec (dict, optional): Column spec overrides (see frame()).
+            chunk_size (int): Rows generated and inserted per chunk.
+            frame_fn (callable, optional): ``frame_fn(rows, offset) -> DataFrame`` to use instead
+                of frame(), e.g. ``lambda n, off: gen.ohlcv(n, ...)``.
+
+        Returns:
+            int: Number of rows inserted.
+        """
+        table = db.load_table(table_identity)
+        inserted = 0
+        for offset in range(0, rows, chunk_size):
+            n = min(chunk_size, rows - offset)
+            df = frame_fn(n, offset) if frame_fn else self.frame(table, n, spec=spec, offset=offset)
+            # Generated data already matches the column types
+            count = table.insert_dataframe(df, coerce=False, chunk_size=n)
+            if count is None:
+                raise RuntimeError(f"Bulk insert into '{table.table.name}' failed at row {offset}")
+            inserted += count
+        self.logger.info(f"✅ - Generated {inserted} rows into '{table.table.name}' of {db.name}")
+        return inserted
+
+    def populate_manager(self, manager, databases: int, tables: dict, base=None,
+                         password: str = "", prefix: str = "synthetic", spec: dict | None = None) -> list:
+        """
+        Create `databases` new databases in a ControlDBManager and fill them.
+
+        Args:
+            manager (ControlDBManager): Logged-in manager.
+            databases (int): Number of databases to create.
+            tables (dict): Table (ORM class or Core Table) → rows per database.
+            base (MetaData | list[MetaData], optional): Metadata/declarative base creating the tables.
+            password (str): Database password.
+            prefix (str): File name prefix; databases are named "<prefix>_<i>".
+            spec (dict, optional): Table name → column spec overrides.
+
+        Returns:
+            list[ControlDB]: Created databases.
+        """
+        spec = spec or {}
+        created = []
+        for i in range(databases):
+            db = manager.create(f"{prefix}_{i}", password=password, base=base)
+            for table_identity, rows in tables.items():
+                self.populate(db, table_identity, rows, spec=spec.get(_table_of(table_identity).name))
+            created.append(db)
+        return created
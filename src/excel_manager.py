@@ -1,19 +1,108 @@
 import os
+import hashlib
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
 from pretty_logger import PrettyLogger, prettylog
 
+
+def _read_workbook(full_path: str, sheet_name, index_column: str | None) -> pd.DataFrame | dict:
+    """Parse one workbook. Module level so it can be pickled into worker processes."""
+    return pd.read_excel(full_path, sheet_name=sheet_name, index_col=index_column)
+
+
 @prettylog
 class ExcelManager:
-    def __init__(self, logLevel: int = 30) -> None:
+    def __init__(self, logLevel: int = 30, cache_size: int = 0, sidecar_dir: str | None = None) -> None:
         """
         Initialize ExcelManager with logging.
 
         Input:
         - logLevel: int, logging level (default=30, INFO)
+        - cache_size: int, number of parsed sheets kept in memory (default=0, cache disabled)
+        - sidecar_dir: str, optional folder for Parquet copies of parsed sheets
         """
         self.logLevel = logLevel
         self.logger: PrettyLogger
 
+        self.cache_size: int = cache_size
+        self.sidecar_dir: str | None = sidecar_dir
+        self._cache: OrderedDict = OrderedDict()
+        self.read_errors: dict[str, str] = {}
+
+    # -----------------------
+    # Parsed workbook cache
+    # -----------------------
+    @property
+    def cache_enabled(self) -> bool:
+        """Whether parsed sheets are cached in memory or on disk."""
+        return self.cache_size > 0 or self.sidecar_dir is not None
+
+    @staticmethod
+    def _fingerprint(full_path: str, sheet_name, index_column: str | None = None) -> tuple:
+        """
+        Build the cache key of a workbook sheet.
+
+        The key changes whenever the file is rewritten (size or mtime), so stale
+        entries are never returned and need no explicit invalidation.
+        """
+        st = os.stat(full_path)
+        return (os.path.abspath(full_path), st.st_size, st.st_mtime_ns, sheet_name, index_column)
+
+    @staticmethod
+    def _copy(data: pd.DataFrame | dict) -> pd.DataFrame | dict:
+        """Return a copy so callers cannot mutate cached frames."""
+        if isinstance(data, dict):
+            return {k: v.copy() for k, v in data.items()}
+        return data.copy()
+
+    def _sidecar_path(self, key: tuple) -> str:
+        """Return the Parquet sidecar path for a cache key."""
+        digest = hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.sidecar_dir, f"{digest}.parquet")
+
+    def _cache_get(self, key: tuple) -> pd.DataFrame | dict | None:
+        """Look up a parsed sheet in memory, then in the sidecar folder."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        # Sidecars only hold single sheets: dict results stay memory-only
+        if self.sidecar_dir is None or key[3] is None:
+            return None
+
+        path = self._sidecar_path(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            df = pd.read_parquet(path)
+        except Exception:
+            self.logger.warning(f"Failed to read cache sidecar {path}", exc_info=True)
+            return None
+        self._cache_put(key, df, sidecar=False)
+        return df
+
+    def _cache_put(self, key: tuple, data: pd.DataFrame | dict, sidecar: bool = True) -> None:
+        """Store a parsed sheet, evicting the least recently used entries."""
+        if self.cache_size > 0:
+            self._cache[key] = data
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        if sidecar and self.sidecar_dir is not None and isinstance(data, pd.DataFrame):
+            try:
+                os.makedirs(self.sidecar_dir, exist_ok=True)
+                data.to_parquet(self._sidecar_path(key))
+            except Exception:
+                # Parquet needs pyarrow/fastparquet and string column labels
+                self.logger.debug(f"Skipped cache sidecar for {key[0]}", exc_info=True)
+
+    def clear_cache(self) -> None:
+        """Drop all in-memory cache entries (sidecar files are left on disk)."""
+        self._cache.clear()
+
     # -----------------------
     # File creation
     # -----------------------
@@ -110,13 +199,139 @@ class ExcelManager:
                 self.logger.error(f"File not found: {full_path}")
                 return None
 
+            if not self.cache_enabled:
+                df = pd.read_excel(full_path, sheet_name=sheet_name, index_col=index_column)
+                self.logger.info(f"Read Excel file {full_path} (sheet: {sheet_name or 'all'})")
+                return df
+
+            key = self._fingerprint(full_path, sheet_name, index_column)
+            df = self._cache_get(key)
+            if df is not None:
+                self.logger.debug(f"Cache hit for {full_path} (sheet: {sheet_name or 'all'})")
+                return self._copy(df)
+
             df = pd.read_excel(full_path, sheet_name=sheet_name, index_col=index_column)
+            self._cache_put(key, df)
             self.logger.info(f"Read Excel file {full_path} (sheet: {sheet_name or 'all'})")
-            return df
+            return self._copy(df)
         except Exception:
             self.logger.error(f"Failed to read Excel file: {full_path}", exc_info=True)
             return None
 
+    # -----------------------
+    # Read many Excel files
+    # -----------------------
+    def iter_many(
+        self,
+        paths: Iterable[str],
+        sheet_name: str | int | None = 0,
+        index_column: str | None = None,
+        workers: int | None = None
+    ) -> Iterator[tuple[str, pd.DataFrame | dict]]:
+        """
+        Parse workbooks in a process pool and yield them as they complete.
+
+        Input:
+        - paths: iterable of Excel file paths
+        - sheet_name: str | int, sheet name or position (default=0, first sheet; None for all sheets)
+        - index_column: str, optional column to set as index
+        - workers: int, number of worker processes (default=os.cpu_count())
+
+        Return:
+        - generator of (path, DataFrame or dict of DataFrames), in completion order
+
+        Files that are missing or fail to parse are skipped and recorded in
+        self.read_errors (path -> error message), which is reset on every call.
+        """
+        self.read_errors = {}
+        pending = {}
+
+        for full_path in paths:
+            if not os.path.exists(full_path):
+                self.read_errors[full_path] = "File not found"
+                continue
+            if self.cache_enabled:
+                key = self._fingerprint(full_path, sheet_name, index_column)
+                cached = self._cache_get(key)
+                if cached is not None:
+                    yield full_path, self._copy(cached)
+                    continue
+            else:
+                key = None
+            pending[full_path] = key
+
+        if not pending:
+            return
+
+        parsed = 0
+        pool = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                pool.submit(_read_workbook, full_path, sheet_name, index_column): full_path
+                for full_path in pending
+            }
+            for future in as_completed(futures):
+                full_path = futures[future]
+                try:
+                    df = future.result()
+                except Exception as e:
+                    self.read_errors[full_path] = f"{type(e).__name__}: {e}"
+                    self.logger.warning(f"Failed to read Excel file: {full_path} ({e})")
+                    continue
+                if pending[full_path] is not None:
+                    self._cache_put(pending[full_path], df)
+                    df = self._copy(df)
+                parsed += 1
+                yield full_path, df
+        finally:
+            # If the caller stops early (GeneratorExit), drop the queued parses instead of waiting for them
+            pool.shutdown(wait=True, cancel_futures=True)
+
+        self.logger.info(f"Read {parsed}/{len(pending)} Excel files with {workers or os.cpu_count()} workers")
+
+    def read_many(
+        self,
+        paths: Iterable[str],
+        sheet_name: str | int | None = 0,
+        index_column: str | None = None,
+        workers: int | None = None,
+        concat: bool = False,
+        source_column: str = "source"
+    ) -> dict[str, pd.DataFrame] | pd.DataFrame:
+        """
+        Read many Excel files in parallel (see iter_many).
+
+        Input:
+        - paths: iterable of Excel file paths
+        - sheet_name: str | int, sheet name or position (default=0, first sheet)
+        - index_column: str, optional column to set as index
+        - workers: int, number of worker processes
+        - concat: bool, return one DataFrame instead of a dict per file
+        - source_column: str, column holding the file path when concat=True
+
+        Return:
+        - dict of path -> DataFrame, in input order
+        - or one concatenated DataFrame if concat=True (empty if nothing was read)
+
+        Per-file failures do not abort the batch; see self.read_errors.
+        Raises ValueError before reading anything if concat=True is combined
+        with sheet_name=None or a list of sheets.
+        """
+        if concat and (sheet_name is None or isinstance(sheet_name, (list, tuple))):
+            raise ValueError("concat=True requires a single sheet_name")
+
+        paths = list(paths)
+        results = dict(self.iter_many(paths, sheet_name=sheet_name, index_column=index_column, workers=workers))
+        ordered = {p: results[p] for p in paths if p in results}
+
+        if not concat:
+            return ordered
+
+        frames = [df.assign(**{source_column: p}) for p, df in ordered.items()]
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, ignore_index=index_column is None)
+
     # -----------------------
     # Update DataFrame
     # -----------------------
@@ -162,6 +377,142 @@ class ExcelManager:
             self.logger.error(f"Failed to update sheet '{sheet_name}' in {full_path}", exc_info=True)
             return False
 
+    # -----------------------
+    # Incremental update
+    # -----------------------
+    @staticmethod
+    def _cell_value(value):
+        """Convert a pandas/NumPy scalar into a value openpyxl can store."""
+        if value is None or (not isinstance(value, (list, tuple, dict)) and pd.isna(value)):
+            return None
+        return value.item() if hasattr(value, "item") else value
+
+    def sync_dataframe(
+        self,
+        full_path: str,
+        df: pd.DataFrame,
+        index_column: str,
+        sheet_name: str = "Sheet1"
+    ) -> dict | None:
+        """
+        Update a sheet in place so it matches a DataFrame, keyed by index_column.
+
+        Only cells whose value differs are rewritten, rows with new keys are
+        appended and rows whose key is missing from df are deleted. Columns that
+        exist only in the sheet are left untouched; new columns are added at the end.
+        Creates the file/sheet if missing.
+
+        Input:
+        - full_path: str, Excel file path
+        - df: pd.DataFrame with the desired sheet content
+        - index_column: str, column with unique row keys
+        - sheet_name: str, sheet name
+
+        Return:
+        - dict with counts: updated_rows, updated_cells, inserted, deleted
+        - None if failed
+        """
+        try:
+            if index_column not in df.columns:
+                self.logger.error(f"Key column '{index_column}' not in DataFrame")
+                return None
+            if df[index_column].duplicated().any():
+                self.logger.error(f"Key column '{index_column}' contains duplicate values")
+                return None
+
+            summary = {"updated_rows": 0, "updated_cells": 0, "inserted": 0, "deleted": 0}
+
+            if not os.path.exists(full_path):
+                if self.upload_dataframe(full_path, df, sheet_name=sheet_name):
+                    summary["inserted"] = len(df)
+                    return summary
+                return None
+
+            from openpyxl import load_workbook
+
+            wb = load_workbook(full_path)
+            if sheet_name in wb.sheetnames:
+                ws = wb[sheet_name]
+            else:
+                ws = wb.create_sheet(sheet_name)
+
+            rows = ws.iter_rows(values_only=True)
+            header = list(next(rows, ()))
+            while header and header[-1] is None:
+                header.pop()
+            existing = pd.DataFrame([r[:len(header)] for r in rows], columns=header)
+
+            if header and index_column not in header:
+                self.logger.error(f"Key column '{index_column}' not in sheet '{sheet_name}'")
+                return None
+
+            # Map DataFrame columns to sheet positions, adding new headers at the end
+            positions = {name: i + 1 for i, name in enumerate(header)}
+            for name in df.columns:
+                if name not in positions:
+                    positions[name] = len(positions) + 1
+                    ws.cell(row=1, column=positions[name], value=name)
+
+            # Sheet row numbers by key (header is row 1); blank key rows are ignored
+            existing["_row"] = range(2, len(existing) + 2)
+            if index_column in existing.columns:
+                existing = existing[existing[index_column].notna()]
+                if existing[index_column].duplicated().any():
+                    self.logger.error(f"Sheet '{sheet_name}' contains duplicate keys in '{index_column}'")
+                    return None
+                existing = existing.set_index(index_column)
+            else:
+                existing = pd.DataFrame(columns=["_row"])
+
+            incoming = df.set_index(index_column)
+            value_columns = list(incoming.columns)
+            common = incoming.index.intersection(existing.index)
+
+            # Vectorized comparison of all shared rows; only differing cells are written
+            if len(common) and value_columns:
+                new = incoming.loc[common, value_columns]
+                old = existing.reindex(index=common, columns=value_columns)
+                new_values, old_values = new.to_numpy(dtype=object), old.to_numpy(dtype=object)
+                changed = ~((new_values == old_values) | (pd.isna(new_values) & pd.isna(old_values)))
+
+                row_numbers = existing.loc[common, "_row"].to_numpy()
+                col_numbers = [positions[c] for c in value_columns]
+                for i, j in zip(*changed.nonzero()):
+                    ws.cell(row=int(row_numbers[i]), column=col_numbers[j],
+                            value=self._cell_value(new_values[i, j]))
+                summary["updated_cells"] = int(changed.sum())
+                summary["updated_rows"] = int(changed.any(axis=1).sum())
+
+            # Delete bottom-up in contiguous blocks so earlier row numbers stay valid
+            removed = sorted(existing.loc[existing.index.difference(incoming.index), "_row"], reverse=True)
+            i = 0
+            while i < len(removed):
+                start, count = removed[i], 1
+                while i + count < len(removed) and removed[i + count] == start - count:
+                    count += 1
+                ws.delete_rows(start - count + 1, count)
+                i += count
+            summary["deleted"] = len(removed)
+
+            added = incoming.loc[incoming.index.difference(existing.index, sort=False)]
+            next_row = max(ws.max_row, 1) + 1
+            for key, values in zip(added.index, added.itertuples(index=False, name=None)):
+                ws.cell(row=next_row, column=positions[index_column], value=self._cell_value(key))
+                for name, value in zip(value_columns, values):
+                    ws.cell(row=next_row, column=positions[name], value=self._cell_value(value))
+                next_row += 1
+            summary["inserted"] = len(added)
+
+            wb.save(full_path)
+            self.logger.info(
+                f"Synced sheet '{sheet_name}' in {full_path}: "
+                f"{summary['updated_rows']} updated, {summary['inserted']} inserted, {summary['deleted']} deleted"
+            )
+            return summary
+        except Exception:
+            self.logger.error(f"Failed to sync sheet '{sheet_name}' in {full_path}", exc_info=True)
+            return None
+
     # -----------------------
     # Merge DataFrame
     # -----------------------
@@ -211,6 +562,92 @@ class ExcelManager:
             self.logger.error(f"Failed to merge DataFrame into {full_path}", exc_info=True)
             return False
 
+    # -----------------------
+    # Metadata probe
+    # -----------------------
+    @staticmethod
+    def _header_labels(values: tuple) -> list:
+        """Turn raw header cells into column labels the way pandas names them."""
+        values = list(values)
+        while values and values[-1] is None:
+            values.pop()
+
+        labels, seen = [], {}
+        for i, value in enumerate(values):
+            label = f"Unnamed: {i}" if value is None else value
+            if label in seen:
+                seen[label] += 1
+                label = f"{label}.{seen[label]}"
+            else:
+                seen[label] = 0
+            labels.append(label)
+        return labels
+
+    def probe(self, full_path: str, sheet_name: str | int = None) -> dict | None:
+        """
+        Read workbook metadata and the header row without parsing the sheet body.
+
+        Opens the workbook in openpyxl read-only mode and stops after the first
+        row, so the cost does not grow with the number of data rows.
+
+        Input:
+        - full_path: str, path to .xlsx/.xlsm file
+        - sheet_name: str or int, optional sheet name or position (default=first sheet)
+
+        Return:
+        - dict with keys:
+            sheet_names: list of all sheet names
+            sheet: name of the probed sheet
+            columns: list of header labels
+            dimensions: used range as reported by the file (e.g. "A1:C100"), or None
+            max_row / max_column: size of the used range, or None if unknown
+            row_count: number of data rows below the header, or None if unknown
+        - None if file missing or read fails
+        """
+        try:
+            if not os.path.exists(full_path):
+                self.logger.warning(f"File not found: {full_path}")
+                return None
+
+            from openpyxl import load_workbook
+
+            wb = load_workbook(full_path, read_only=True, data_only=True)
+            try:
+                sheet_names = wb.sheetnames
+                if sheet_name is None:
+                    sheet_name = 0
+                ws = wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+
+                first_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+                max_row, max_column = ws.max_row, ws.max_column
+                try:
+                    dimensions = ws.calculate_dimension()
+                except ValueError:
+                    dimensions = None  # Sheet written without a <dimension> tag
+            finally:
+                wb.close()
+
+            columns = self._header_labels(first_row)
+            if not columns:
+                row_count = 0
+            elif max_row is not None:
+                row_count = max_row - 1
+            else:
+                row_count = None
+
+            return {
+                "sheet_names": sheet_names,
+                "sheet": ws.title,
+                "columns": columns,
+                "dimensions": dimensions,
+                "max_row": max_row,
+                "max_column": max_column,
+                "row_count": row_count,
+            }
+        except Exception:
+            self.logger.warning(f"Failed to probe {full_path}", exc_info=True)
+            return None
+
     # -----------------------
     # Get Columns
     # -----------------------
@@ -231,6 +668,16 @@ class ExcelManager:
                 self.logger.warning(f"File not found: {full_path}")
                 return None
 
+            if self.cache_size > 0:
+                cached = self._cache_get(self._fingerprint(full_path, sheet_name))
+                if isinstance(cached, pd.DataFrame):
+                    return cached.columns.tolist()
+
+            # Only OOXML workbooks can be probed; other formats fall back to pandas
+            if os.path.splitext(full_path)[1].lower() in (".xlsx", ".xlsm"):
+                info = self.probe(full_path, sheet_name=sheet_name)
+                return info["columns"] if info is not None else None
+
             df = pd.read_excel(full_path, sheet_name=sheet_name or 0, nrows=0)
             if isinstance(df, dict):
                 df = next(iter(df.values()))
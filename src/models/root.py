@@ -1,7 +1,7 @@
 
 from sqlalchemy.orm import declarative_base, sessionmaker
 from sqlalchemy import Table, Column
-from sqlalchemy import Integer, Numeric, String, Boolean, Float
+from sqlalchemy import Integer, Numeric, String, Boolean, Float, DateTime
 
 ROOTBASE = declarative_base()
 
@@ -68,4 +68,68 @@ class DatabaseTable(ROOTBASE):
             f"db_type='{self.db_type}', "
             f"base='{self.base}', "
             f"logLevel={self.logLevel})>"
-        )
\ No newline at end of file
+        )
+
+class LogicalTable(ROOTBASE):
+    """A logical table spread over several registered databases (partitioned or sharded)."""
+    __tablename__ = "LogicalTable"
+    __table_args__ = {'extend_existing': True}
+
+    ID = Column(Integer, primary_key=True, autoincrement=True)
+    name = Column(String, unique=True, nullable=False)
+    kind = Column(String, nullable=False)
+    options = Column(String)
+
+    def __init__(self, name: str, kind: str, options: str = None):
+        """Initialize all LogicalTable attributes (options is a JSON string)."""
+        self.name = name
+        self.kind = kind
+        self.options = options
+
+    def __repr__(self) -> str:
+        return f"<LogicalTable(ID={self.ID}, name='{self.name}', kind='{self.kind}')>"
+
+
+class PartitionTable(ROOTBASE):
+    """One time range [period_start, period_end) of a partitioned logical table, stored in databaseID."""
+    __tablename__ = "PartitionTable"
+    __table_args__ = {'extend_existing': True}
+
+    ID = Column(Integer, primary_key=True, autoincrement=True)
+    logicalID = Column(Integer, nullable=False)
+    databaseID = Column(Integer, nullable=False)
+    period_start = Column(DateTime)
+    period_end = Column(DateTime)
+
+    def __init__(self, logicalID: int, databaseID: int, period_start=None, period_end=None):
+        """Initialize all PartitionTable attributes (None bounds are open-ended)."""
+        self.logicalID = logicalID
+        self.databaseID = databaseID
+        self.period_start = period_start
+        self.period_end = period_end
+
+    def __repr__(self) -> str:
+        return (
+            f"<PartitionTable(ID={self.ID}, logicalID={self.logicalID}, databaseID={self.databaseID}, "
+            f"period_start={self.period_start}, period_end={self.period_end})>"
+        )
+
+
+class ShardTable(ROOTBASE):
+    """Shard number → database of a hash-sharded logical table."""
+    __tablename__ = "ShardTable"
+    __table_args__ = {'extend_existing': True}
+
+    ID = Column(Integer, primary_key=True, autoincrement=True)
+    logicalID = Column(Integer, nullable=False)
+    shard = Column(Integer, nullable=False)
+    databaseID = Column(Integer, nullable=False)
+
+    def __init__(self, logicalID: int, shard: int, databaseID: int):
+        """Initialize all ShardTable attributes."""
+        self.logicalID = logicalID
+        self.shard = shard
+        self.databaseID = databaseID
+
+    def __repr__(self) -> str:
+        return f"<ShardTable(ID={self.ID}, logicalID={self.logicalID}, shard={self.shard}, databaseID={self.databaseID})>"
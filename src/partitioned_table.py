@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+PartitionedTable
+================
+
+A time-series table split over several ControlDB files, one per period
+(day/month/year) and/or size threshold, managed by ControlDBManager.
+
+Every partition is a regular database registered in ``DatabaseTable`` and
+holding one ``TimeSeriesTable``; the partition map (time range → database) is
+stored in ``PartitionTable`` of the root database. Appends are routed by time,
+range queries only open partitions overlapping the requested range and scan
+them in parallel.
+
+Usage:
+------
+>>> history = manager.create_partitioned("Kline1m", period="month", keys={"symbol": String(16)})
+>>> history.append(df)
+>>> history.range(datetime(2024, 3, 1), datetime(2024, 5, 1), symbol="BTC")
+"""
+
+import os
+import json
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import select, types as sqltypes
+from pretty_logger import PrettyLogger, prettylog
+
+from .models.root import LogicalTable, PartitionTable
+from .utils.utils_timeseries import TimeSeriesTable
+
+PERIODS = ("day", "month", "year")
+
+
+def period_bounds(moment, period: str | None) -> tuple[datetime | None, datetime | None]:
+    """Return the [start, end) period containing `moment` (open-ended for period None)."""
+    import pandas as pd
+
+    if period is None:
+        return None, None
+    ts = pd.Timestamp(moment)
+    if period == "day":
+        start = ts.normalize()
+        end = start + pd.DateOffset(days=1)
+    elif period == "month":
+        start = ts.normalize().replace(day=1)
+        end = start + pd.DateOffset(months=1)
+    elif period == "year":
+        start = pd.Timestamp(ts.year, 1, 1)
+        end = start + pd.DateOffset(years=1)
+    else:
+        raise ValueError(f"Unknown period '{period}', choose from {PERIODS} or None")
+    return start.to_pydatetime(), end.to_pydatetime()
+
+
+def dump_columns(columns: dict) -> dict:
+    """Serialize {name: SQLAlchemy type} as {name: [type name, length]} for the root database."""
+    result = {}
+    for name, col_type in (columns or {}).items():
+        instance = col_type() if isinstance(col_type, type) else col_type
+        result[name] = [type(instance).__name__, getattr(instance, "length", None)]
+    return result
+
+
+def load_columns(columns: dict) -> dict:
+    """Inverse of dump_columns()."""
+    result = {}
+    for name, (type_name, length) in (columns or {}).items():
+        col_type = getattr(sqltypes, type_name)
+        result[name] = col_type(length) if length else col_type
+    return result
+
+
+@prettylog
+class PartitionedTable:
+    """Time-partitioned logical table; see module docstring."""
+
+    def __init__(self, manager, name: str, password: str = "", workers: int = 4, logLevel: int = 30):
+        """
+        Open a partitioned logical table registered in the manager's root database.
+
+        Args:
+            manager (ControlDBManager): Logged-in manager.
+            name (str): Logical table name.
+            password (str): Password for newly created partition databases.
+            workers (int): Threads used to scan partitions in parallel.
+            logLevel (int): Logging level (default: 30).
+        """
+        self.logLevel = logLevel
+        self.logger: PrettyLogger
+        self.manager = manager
+        self.name = name
+        self.password = password
+        self.workers = workers
+
+        root = manager.get(1)
+        logical = root.session.execute(select(LogicalTable).where(LogicalTable.name == name)).scalar_one_or_none()
+        if logical is None or logical.kind != "partitioned":
+            raise KeyError(f"Partitioned table '{name}' is not registered")
+        options = json.loads(logical.options)
+
+        self.id: int = logical.ID
+        self.period: str | None = options["period"]
+        self.max_bytes: int | None = options["max_bytes"]
+        self.time_column: str = options["time_column"]
+        self.keys: dict = load_columns(options["keys"])
+        self.columns: dict | None = load_columns(options["columns"]) if options["columns"] is not None else None
+        self.partitions: list[dict] = []
+        self.rejected_rows = None
+        self.refresh()
+
+    # ---------------------- 🔹 PARTITION MAP ----------------------
+
+    def refresh(self) -> list[dict]:
+        """Reload the partition map from the root database."""
+        root = self.manager.get(1)
+        rows = root.session.execute(
+            select(PartitionTable).where(PartitionTable.logicalID == self.id)
+        ).scalars().all()
+        self.partitions = sorted(
+            ({"ID": r.ID, "databaseID": r.databaseID, "start": r.period_start, "end": r.period_end} for r in rows),
+            key=lambda p: p["start"] or datetime.min,
+        )
+        return self.partitions
+
+    def prune(self, start=None, end=None) -> list[dict]:
+        """Return partitions overlapping [start, end) in time order."""
+        return [
+            p for p in self.partitions
+            if (end is None or p["start"] is None or p["start"] < end)
+            and (start is None or p["end"] is None or p["end"] > start)
+        ]
+
+    def series(self, partition: dict) -> TimeSeriesTable:
+        """Return the TimeSeriesTable of one partition."""
+        db = self.manager.get(partition["databaseID"])
+        if db is None:
+            raise KeyError(f"Partition database {partition['databaseID']} of '{self.name}' is not loaded")
+        return db.load_timeseries(self.name, time_column=self.time_column)
+
+    def _create_partition(self, start: datetime | None, end: datetime | None) -> dict:
+        """Create a partition database for [start, end) and register it in the root database."""
+        label = start.strftime("%Y%m%d%H%M%S") if start is not None else "all"
+        db = self.manager.create(f"{self.name}_{label}", password=self.password,
+                                 folderSystem=os.path.join("partitions", self.name))
+        db.create_timeseries(self.name, keys=self.keys, columns=self.columns, time_column=self.time_column)
+
+        root = self.manager.get(1)
+        id = root.load_table(PartitionTable).row.create(
+            logicalID=self.id, databaseID=db.id, period_start=start, period_end=end)
+        if id is None:
+            raise RuntimeError(f"Could not register partition {label} of '{self.name}'")
+        self.logger.info(f"➕ Partition '{db.name}' [{start}, {end}) created for '{self.name}'")
+
+        partition = {"ID": id, "databaseID": db.id, "start": start, "end": end}
+        self.partitions = sorted(self.partitions + [partition], key=lambda p: p["start"] or datetime.min)
+        return partition
+
+    def _split(self, partition: dict, at: datetime) -> dict:
+        """Close `partition` at `at` and continue its range in a new partition (size rollover)."""
+        root = self.manager.get(1)
+        row = root.load_table(PartitionTable).row
+        row.id = partition["ID"]
+        if not row.merge({"period_end": at}):
+            raise RuntimeError(f"Could not close partition {partition['ID']} of '{self.name}'")
+        old_end, partition["end"] = partition["end"], at
+        return self._create_partition(at, old_end)
+
+    # ---------------------- 🔹 WRITE ----------------------
+
+    def append(self, df, chunk_size: int = 10_000) -> int | None:
+        """
+        Route rows to their partitions by time and append them.
+
+        Partitions are created on demand. When ``max_bytes`` is set and the file
+        of the newest partition of a period has reached it, that partition is
+        closed at the first new timestamp and a new file continues the period.
+        Rows without a time cannot be routed: they are skipped and, with the
+        rows rejected by the partitions, kept in ``self.rejected_rows`` (with a
+        '_reason' column).
+
+        Args:
+            df (pd.DataFrame): Rows with the time, key and value columns.
+            chunk_size (int): Rows per executemany batch.
+
+        Returns:
+            int | None: Rows appended, or None if a partition append failed (earlier
+                partitions stay committed).
+        """
+        import pandas as pd
+        from .utils.utils_frame import REASON_COLUMN
+
+        times = pd.to_datetime(df[self.time_column])
+        missing = times.isna()
+        pending = ~missing
+        inserted = 0
+        rejected = [df[missing].assign(**{REASON_COLUMN: f"{self.time_column}: missing time"})]
+        if missing.any():
+            self.logger.warning("⚠️ - %s rows without '%s' rejected for '%s'", int(missing.sum()),
+                                self.time_column, self.name)
+
+        # Group rows without a partition by period and create the missing partitions
+        unrouted = times[~self._routed(times)]
+        if len(unrouted):
+            bounds = {period_bounds(t, self.period) for t in unrouted.dt.to_pydatetime()}
+            for start, end in sorted(bounds, key=lambda b: b[0] or datetime.min):
+                self._create_partition(start, end)
+
+        for partition in list(self.partitions):
+            mask = pending & self._in(times, partition)
+            if not mask.any():
+                continue
+            pending &= ~mask
+            if self.max_bytes and self._full(partition) and partition is self._last_of_period(partition):
+                first = times[mask].min().to_pydatetime()
+                latest = self.series(partition).latest(1)
+                if latest is not None and len(latest) and first > latest[self.time_column].iloc[0]:
+                    partition = self._split(partition, first)
+
+            series = self.series(partition)
+            count = series.append(df[mask], chunk_size=chunk_size)
+            if series.rejected_rows is not None and len(series.rejected_rows):
+                rejected.append(series.rejected_rows)
+            if count is None:
+                self.logger.error(f"❌ Append to partition {partition['ID']} of '{self.name}' failed")
+                self.rejected_rows = pd.concat(rejected)
+                return None
+            inserted += count
+        self.rejected_rows = pd.concat(rejected)
+        return inserted
+
+    def _in(self, times, partition: dict):
+        mask = times.notna()
+        if partition["start"] is not None:
+            mask &= times >= partition["start"]
+        if partition["end"] is not None:
+            mask &= times < partition["end"]
+        return mask
+
+    def _routed(self, times):
+        routed = times.isna()
+        for partition in self.partitions:
+            routed |= self._in(times, partition)
+        return routed
+
+    def _full(self, partition: dict) -> bool:
+        db = self.manager.get(partition["databaseID"])
+        return os.path.getsize(db.filePath) >= self.max_bytes
+
+    def _last_of_period(self, partition: dict) -> dict:
+        """Newest partition sharing `partition`'s period end (the one size rollover continues)."""
+        same = [p for p in self.partitions if p["end"] == partition["end"]]
+        return max(same, key=lambda p: p["start"] or datetime.min)
+
+    # ---------------------- 🔹 READ ----------------------
+
+    def _scan(self, fn, start=None, end=None) -> list:
+        """Run fn(TimeSeriesTable) on all partitions overlapping [start, end) in parallel."""
+        partitions = self.prune(start, end)
+        if not partitions:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(partitions))) as pool:
+            return list(pool.map(lambda p: fn(self.series(p)), partitions))
+
+    def range(self, start=None, end=None, columns: list[str] | None = None, **keys):
+        """
+        Return rows with start <= time < end, scanning only overlapping partitions.
+
+        Args:
+            start (datetime, optional): Inclusive lower bound.
+            end (datetime, optional): Exclusive upper bound.
+            columns (list[str], optional): Columns to return (default: all).
+            **keys: Series key filters, e.g. symbol="BTC".
+
+        Returns:
+            pd.DataFrame | None: Rows in time order (per key), or None if a partition query failed.
+        """
+        import pandas as pd
+
+        frames = self._scan(lambda s: s.range(start, end, columns=columns, **keys), start, end)
+        if any(f is None for f in frames):
+            return None
+        if not frames:
+            return pd.DataFrame(columns=columns or [])
+        df = pd.concat(frames, ignore_index=True)
+        order = [c for c in [*self.keys, self.time_column] if c in df.columns]
+        return df.sort_values(order, kind="stable", ignore_index=True) if order else df
+
+    def downsample(self, interval, start=None, end=None, **keys):
+        """
+        Aggregate OHLCV candles per partition in the databases, then merge buckets
+        that span a partition boundary.
+
+        Returns:
+            pd.DataFrame | None: Columns (keys..., time, open, high, low, close, volume).
+        """
+        import pandas as pd
+
+        frames = self._scan(lambda s: s.downsample(interval, start, end, **keys), start, end)
+        if any(f is None for f in frames):
+            return None
+        frames = [f for f in frames if len(f)]
+        if not frames:
+            return pd.DataFrame(columns=[*self.keys, self.time_column, "open", "high", "low", "close", "volume"])
+        group = [*self.keys, self.time_column]
+        return (
+            pd.concat(frames, ignore_index=True)
+            .groupby(group, sort=True)
+            .agg(open=("open", "first"), high=("high", "max"), low=("low", "min"),
+                 close=("close", "last"), volume=("volume", "sum"))
+            .reset_index()
+        )
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+ShardedTable
+============
+
+One logical table spread over N ControlDB files by a hash of a shard key
+(e.g. ``symbol`` or ``pairID``), managed by ControlDBManager.
+
+Shards are regular databases registered in ``DatabaseTable``; the shard map
+(shard number → database) is stored in ``ShardTable`` of the root database.
+Inserts are split per shard and written concurrently (every shard is its own
+file, so writers do not contend on one file lock), point lookups on the shard
+key open a single shard, and scans fan out over all shards and are merged.
+
+Usage:
+------
+>>> trades = manager.create_sharded("Trades", shard_key="symbol", shards=8,
+...                                 columns={"symbol": String(16), "price": Float, "qty": Float})
+>>> trades.insert(df)
+>>> trades.get("BTC")
+>>> trades.scan(where=lambda t: t.c.price > 100)
+"""
+
+import os
+import json
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import Table, Column, Integer, MetaData, select
+from pretty_logger import PrettyLogger, prettylog
+
+from .models.root import LogicalTable, ShardTable
+from .partitioned_table import load_columns
+from .utils import UtilsTable
+
+
+def shard_of(value, shards: int) -> int:
+    """Stable shard number of a key value (CRC32 of its string form, identical in every process)."""
+    return zlib.crc32(str(value).encode("utf-8")) % shards
+
+
+@prettylog
+class ShardedTable:
+    """Hash-sharded logical table; see module docstring."""
+
+    def __init__(self, manager, name: str, workers: int = 4, logLevel: int = 30):
+        """
+        Open a sharded logical table registered in the manager's root database.
+
+        Args:
+            manager (ControlDBManager): Logged-in manager.
+            name (str): Logical table name.
+            workers (int): Threads used for concurrent inserts and scans.
+            logLevel (int): Logging level (default: 30).
+        """
+        self.logLevel = logLevel
+        self.logger: PrettyLogger
+        self.manager = manager
+        self.name = name
+        self.workers = workers
+        self.errors: dict[int, str] = {}
+
+        root = manager.get(1)
+        logical = root.session.execute(select(LogicalTable).where(LogicalTable.name == name)).scalar_one_or_none()
+        if logical is None or logical.kind != "sharded":
+            raise KeyError(f"Sharded table '{name}' is not registered")
+        options = json.loads(logical.options)
+
+        self.id: int = logical.ID
+        self.shard_key: str = options["shard_key"]
+        self.shards: int = options["shards"]
+        self.columns: dict = load_columns(options["columns"])
+
+        rows = root.session.execute(select(ShardTable).where(ShardTable.logicalID == self.id)).scalars().all()
+        self.databases: dict[int, int] = {r.shard: r.databaseID for r in rows}
+        if sorted(self.databases) != list(range(self.shards)):
+            raise RuntimeError(f"Shard map of '{name}' is incomplete: {sorted(self.databases)}")
+
+        # One Core definition shared by all shards (typed, unlike reflection by name)
+        self.table = Table(
+            name, MetaData(),
+            Column("ID", Integer, primary_key=True, autoincrement=True),
+            *[Column(c, t) for c, t in self.columns.items()],
+        )
+
+    # ---------------------- 🔹 ROUTING ----------------------
+
+    def shard_of(self, value) -> int:
+        """Shard number holding rows with shard key `value`."""
+        return shard_of(value, self.shards)
+
+    def shard(self, number: int) -> UtilsTable:
+        """Return the table handle of one shard."""
+        db = self.manager.get(self.databases[number])
+        if db is None:
+            raise KeyError(f"Shard database {self.databases[number]} of '{self.name}' is not loaded")
+        return db.load_table(self.table)
+
+    def _fan_out(self, fn, shards=None) -> dict:
+        """Run fn(shard number) concurrently; return shard → result."""
+        shards = list(range(self.shards)) if shards is None else list(shards)
+        if not shards:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(shards))) as pool:
+            return dict(zip(shards, pool.map(fn, shards)))
+
+    # ---------------------- 🔹 WRITE ----------------------
+
+    def insert(self, df, chunk_size: int = 1000) -> int | None:
+        """
+        Split rows by shard and bulk insert every batch into its shard concurrently.
+
+        Args:
+            df (pd.DataFrame): Rows including the shard key column.
+            chunk_size (int): Rows per executemany batch.
+
+        Returns:
+            int | None: Rows inserted, or None if any shard failed; failed shards are
+                listed in ``self.errors`` (other shards stay committed).
+        """
+        if self.shard_key not in df.columns:
+            raise KeyError(f"Shard key '{self.shard_key}' missing from the rows")
+
+        numbers = df[self.shard_key].map(self.shard_of)
+        groups = {n: part for n, part in df.groupby(numbers.to_numpy(), sort=False)}
+        counts = self._fan_out(lambda n: self.shard(n).insert_dataframe(groups[n], chunk_size=chunk_size), groups)
+
+        self.errors = {n: "insert failed" for n, count in counts.items() if count is None}
+        if self.errors:
+            self.logger.error(f"❌ Insert into '{self.name}' failed on shards {sorted(self.errors)}")
+            return None
+        return sum(counts.values())
+
+    # ---------------------- 🔹 READ ----------------------
+
+    def _select(self, shard: int, where=None, columns: list[str] | None = None):
+        import pandas as pd
+
+        table = self.shard(shard)
+        core = table.table
+        stmt = select(*[core.c[c] for c in columns]) if columns else select(core)
+        if where is not None:
+            stmt = stmt.where(where(core) if callable(where) else where)
+        with table.engine.connect() as conn:
+            result = conn.execute(stmt)
+            return pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+
+    def get(self, value, columns: list[str] | None = None):
+        """
+        Point lookup: rows whose shard key equals `value`, read from one shard.
+
+        Returns:
+            pd.DataFrame: Matching rows.
+        """
+        key = self.shard_key
+        return self._select(self.shard_of(value), where=lambda t: t.c[key] == value, columns=columns)
+
+    def scan(self, where=None, columns: list[str] | None = None):
+        """
+        Read matching rows from all shards concurrently and merge them.
+
+        Args:
+            where (callable | ColumnElement, optional): Filter; a callable receives the
+                shard's Core Table, e.g. ``lambda t: t.c.price > 100``.
+            columns (list[str], optional): Columns to return (default: all).
+
+        Returns:
+            pd.DataFrame | None: Rows of all shards with a ``_shard`` column, or None if
+                any shard failed (see ``self.errors``).
+        """
+        import pandas as pd
+
+        def read(n):
+            try:
+                return self._select(n, where=where, columns=columns).assign(_shard=n)
+            except Exception as e:
+                self.logger.error(f"❌ Scan of shard {n} of '{self.name}' failed: {e}")
+                return e
+
+        frames = self._fan_out(read)
+        self.errors = {n: str(f) for n, f in frames.items() if isinstance(f, Exception)}
+        if self.errors:
+            return None
+        return pd.concat(frames.values(), ignore_index=True)
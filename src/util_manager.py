@@ -7,6 +7,7 @@ from pretty_logger import PrettyLogger, prettylog
 from sqlalchemy import update
 
 from src import UtilsRow
+from src.utils.log_registry import get_logger
 
 
 
@@ -36,11 +37,9 @@ class UtilManager:
 
     def __init__(self) -> None:
         """Initialize the UtilManager with PrettyLogger and internal UtilGetManager."""
-        logCtr = PrettyLogger()
         moduleName = "UtilManager"
-        self.logger: PrettyLogger = logCtr.get(moduleName)
-        self.logLevel:int
-        logCtr.add_stream(moduleName, level=self.logLevel)
+        self.logLevel: int = getattr(self, "logLevel", 30)
+        self.logger: PrettyLogger = get_logger(moduleName, level=self.logLevel)
         self.logger.debug("  - UtilManager -> __init__")
 
         # Database attributes
@@ -6,10 +6,37 @@ Exposes:
 - UtilsTable: SQLAlchemy helper class
 - UtilsRow: Data row helper class
 - require_authorization: Decorator for authorization checks
+- profiled / profiler: Opt-in method-level profiling
+- coerce_dataframe: Vectorized type coercion for bulk loads
+- QueryStats: Opt-in query instrumentation for an engine
+- get_logger: Shared logger registry with idempotent handler setup
+- TimeSeriesTable: Append-optimised OHLCV table with range/latest/downsample
+- ColumnCache: Memory-mapped NumPy cache of numeric table columns
+- WriteCoordinator: Cross-process write lock with retry/backoff on lock errors
+- Throttle: Shared bandwidth limit for online backups
 """
 
 from .utils_table import UtilsTable
 from .utils_row import UtilsRow
-from .decorators import require_authorization
+from .decorators import require_authorization, profiled, profiler
+from .query_stats import QueryStats
+from .log_registry import get_logger
+from .utils_timeseries import TimeSeriesTable
+from .write_lock import WriteCoordinator, is_lock_error
+from .backup import Throttle
 
-__all__ = ["UtilsTable", "UtilsRow", "require_authorization"]
+
+def __getattr__(name: str):
+    """Import pandas/NumPy-backed helpers on first use."""
+    if name == "coerce_dataframe":
+        from .utils_frame import coerce_dataframe
+        return coerce_dataframe
+    if name == "ColumnCache":
+        from .column_cache import ColumnCache
+        return ColumnCache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ["UtilsTable", "UtilsRow", "require_authorization", "profiled", "profiler", "coerce_dataframe", "QueryStats", "get_logger",
+           "TimeSeriesTable", "ColumnCache", "WriteCoordinator", "is_lock_error",
+           "Throttle"]
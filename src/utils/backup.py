@@ -0,0 +1,120 @@
+# backup.py
+
+import os
+import time
+import sqlite3
+import threading
+from typing import Optional
+
+
+class Throttle:
+    """
+    Thread-safe bandwidth limiter shared by concurrent copies.
+
+    ``consume(n)`` sleeps just long enough to keep the combined rate of all
+    callers at or below ``bytes_per_sec``.
+    """
+
+    def __init__(self, bytes_per_sec: Optional[float] = None):
+        """
+        Args:
+            bytes_per_sec (Optional[float]): Combined rate limit (default: None, unlimited).
+        """
+        self.bytes_per_sec = bytes_per_sec
+        self._lock = threading.Lock()
+        self._next = time.monotonic()
+
+    def consume(self, nbytes: int) -> None:
+        """Account for `nbytes` transferred and wait until they fit the rate."""
+        if not self.bytes_per_sec or nbytes <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(self._next, now)
+            self._next = start + nbytes / self.bytes_per_sec
+            wait = self._next - now
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Upper bound of the file system's timestamp granularity (coarse kernel clock ticks)
+MTIME_RESOLUTION = 0.05
+
+
+def last_modified(path: str) -> float:
+    """Latest modification time of a database file, including its SQLite WAL file."""
+    times = [os.path.getmtime(p) for p in (path, path + "-wal") if os.path.exists(p)]
+    return max(times)
+
+
+def settle(mtime: float) -> None:
+    """
+    Wait until writes get a modification time later than `mtime`.
+
+    File timestamps come from a coarse clock, so a commit right after a change
+    can carry the same mtime; call before pinning a snapshot whose last change
+    is `mtime`, so later commits are always newer than it.
+    """
+    wait = mtime + MTIME_RESOLUTION - time.time()
+    if wait > 0:
+        time.sleep(wait)
+
+
+def copy_file(src: str, dst: str, throttle: Optional[Throttle] = None, chunk_size: int = 1 << 20) -> int:
+    """
+    Copy a file in chunks, throttled.
+
+    Args:
+        src (str): Source path.
+        dst (str): Destination path (overwritten).
+        throttle (Optional[Throttle]): Shared bandwidth limiter.
+        chunk_size (int): Bytes per read/write (default: 1 MiB).
+
+    Returns:
+        int: Bytes copied.
+    """
+    copied = 0
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        while chunk := fin.read(chunk_size):
+            fout.write(chunk)
+            copied += len(chunk)
+            if throttle is not None:
+                throttle.consume(len(chunk))
+    return copied
+
+
+def sqlite_backup(source: sqlite3.Connection, dst: str, pages: int = 1024,
+                  throttle: Optional[Throttle] = None) -> None:
+    """
+    Copy a live SQLite database with the online backup API.
+
+    The copy runs inside one read transaction on `source`, so it is a
+    consistent snapshot and is never restarted by concurrent commits. In WAL
+    mode writers keep committing during the copy; with a rollback journal they
+    wait for it. Copying `pages` pages per step lets the throttle pace the I/O.
+
+    Args:
+        source (sqlite3.Connection): Open connection to the source database.
+        dst (str): Destination path (overwritten).
+        pages (int): Pages per step (default: 1024).
+        throttle (Optional[Throttle]): Shared bandwidth limiter.
+    """
+    page_size = source.execute("PRAGMA page_size").fetchone()[0]
+    done = 0
+
+    def progress(status, remaining, total):
+        nonlocal done
+        copied = total - remaining
+        if throttle is not None:
+            throttle.consume(max(0, copied - done) * page_size)
+        done = copied
+
+    target = sqlite3.connect(dst)
+    if not source.in_transaction:
+        source.execute("BEGIN")
+    try:
+        source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()  # pin the snapshot
+        source.backup(target, pages=pages, progress=progress)
+    finally:
+        source.rollback()
+        target.close()
@@ -0,0 +1,209 @@
+# column_cache.py
+
+from __future__ import annotations
+
+import os
+import json
+import shutil
+import threading
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+from sqlalchemy import select, Integer, Float, Numeric, Boolean
+
+from pretty_logger import PrettyLogger
+
+from .decorators import profiled
+from .log_registry import sharedlog
+
+if TYPE_CHECKING:
+    from .utils_table import UtilsTable
+
+
+META_FILE = "meta.json"
+ID_FILE = "ID.i8"
+
+
+@sharedlog
+class ColumnCache:
+    """
+    Memory-mapped columnar cache of the numeric columns of one table.
+
+    Every column is a raw float64 file (IDs are int64) next to a small
+    ``meta.json`` holding the committed row count. ``refresh()`` appends rows
+    with an ID above the last cached one and only then bumps the row count, so
+    readers in other processes always map a consistent prefix. Reads return
+    read-only ``np.memmap`` views backed by the OS page cache (zero-copy,
+    shared between processes).
+
+    Rows are cached in ID order as they are appended; updates to rows that are
+    already cached are not picked up until ``rebuild()``. Use one refreshing
+    process per cache directory.
+    """
+
+    __slots__ = ("logger", "logLevel", "table", "columns", "path", "_lock", "_meta", "_maps")
+
+    def __init__(self, table: UtilsTable, cache_dir: str, columns: Optional[list[str]] = None,
+                 logLevel: int = 30):
+        """
+        Initialize the cache (no data is read until refresh()).
+
+        Args:
+            table (UtilsTable): Connected table with an integer ID column.
+            cache_dir (str): Directory holding one sub folder per cached table.
+            columns (Optional[list[str]]): Columns to cache (default: all numeric non-key columns).
+            logLevel (int): Logging level (default: 30).
+        """
+        self.logger: PrettyLogger
+        self.logLevel = logLevel
+        self.table = table
+        core = table.table
+        if columns is None:
+            columns = [
+                c.name for c in core.columns
+                if not c.primary_key and isinstance(c.type, (Integer, Float, Numeric, Boolean))
+            ]
+        missing = [c for c in columns if c not in core.c]
+        if missing:
+            raise KeyError(f"❌ Columns {missing} not found in '{core.name}'")
+
+        self.columns: list[str] = list(columns)
+        self.path = os.path.join(cache_dir, core.name)
+        self._lock = threading.Lock()
+        self._meta: dict = {}
+        self._maps: dict = {}
+        os.makedirs(self.path, exist_ok=True)
+        self._load_meta()
+
+    def __len__(self) -> int:
+        return self._load_meta()["rows"]
+
+    @property
+    def last_id(self) -> Optional[int]:
+        """Highest cached ID, or None when the cache is empty."""
+        return self._load_meta()["last_id"]
+
+    def _id_column(self):
+        """Key column of the table: ``ID``/``id``/``Id``, else its single-column primary key."""
+        core = self.table.table
+        for name in ("ID", "id", "Id"):
+            if name in core.c:
+                return core.c[name]
+        primary_key = list(core.primary_key.columns)
+        if len(primary_key) != 1:
+            raise KeyError(f"❌ No ID column found in '{core.name}'")
+        return primary_key[0]
+
+    # ---------------------- 🔹 FILES ----------------------
+
+    def _file(self, column: str) -> str:
+        return os.path.join(self.path, ID_FILE if column == "ID" else f"{column}.f8")
+
+    def _load_meta(self) -> dict:
+        meta_path = os.path.join(self.path, META_FILE)
+        try:
+            with open(meta_path) as f:
+                meta = json.load(f)
+        except FileNotFoundError:
+            meta = {"rows": 0, "last_id": None, "columns": self.columns}
+        if meta["rows"] != self._meta.get("rows"):
+            self._maps.clear()
+        self._meta = meta
+        return meta
+
+    def _write_meta(self, meta: dict) -> None:
+        tmp = os.path.join(self.path, META_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(meta, f)
+        os.replace(tmp, os.path.join(self.path, META_FILE))
+
+    # ---------------------- 🔹 REFRESH ----------------------
+
+    @profiled
+    def refresh(self, chunk_size: int = 50_000) -> int:
+        """
+        Append rows with an ID above the last cached ID.
+
+        Args:
+            chunk_size (int): Rows fetched and written per batch (default: 50 000).
+
+        Returns:
+            int: Number of rows appended.
+        """
+        with self._lock:
+            meta = self._load_meta()
+            if meta["columns"] != self.columns:
+                raise ValueError(f"⛔ - Cache at {self.path} holds columns {meta['columns']}; call rebuild()")
+
+            core = self.table.table
+            id_col = self._id_column()
+            stmt = select(id_col, *[core.c[c] for c in self.columns]).order_by(id_col)
+            if meta["last_id"] is not None:
+                stmt = stmt.where(id_col > meta["last_id"])
+
+            rows, last_id = meta["rows"], meta["last_id"]
+            # Truncate leftovers of an interrupted refresh before appending
+            for column in ["ID", *self.columns]:
+                with open(self._file(column), "ab") as f:
+                    f.truncate(rows * 8)
+
+            handles = {c: open(self._file(c), "ab") for c in ["ID", *self.columns]}
+            try:
+                with self.table.engine.connect() as conn:
+                    # Numeric columns need no result processing: fetch plain tuples from the DBAPI cursor
+                    cursor = conn.execute(stmt).cursor
+                    while batch := cursor.fetchmany(chunk_size):
+                        ids = np.fromiter((r[0] for r in batch), dtype=np.int64, count=len(batch))
+                        values = np.array([r[1:] for r in batch], dtype=np.float64).reshape(len(batch), -1)
+                        handles["ID"].write(ids.tobytes())
+                        for i, column in enumerate(self.columns):
+                            handles[column].write(np.ascontiguousarray(values[:, i]).tobytes())
+                        rows += len(batch)
+                        last_id = int(ids[-1])
+            finally:
+                for f in handles.values():
+                    f.close()
+
+            appended = rows - meta["rows"]
+            if appended:
+                self._write_meta({"rows": rows, "last_id": last_id, "columns": self.columns})
+                self._load_meta()
+                self.logger.debug("🔄 - Column cache '%s' +%s rows (%s total)", core.name, appended, rows)
+            return appended
+
+    def rebuild(self, chunk_size: int = 50_000) -> int:
+        """Drop the cached files and read the whole table again."""
+        with self._lock:
+            self._maps.clear()
+            shutil.rmtree(self.path, ignore_errors=True)
+            os.makedirs(self.path, exist_ok=True)
+            self._meta = {}
+        return self.refresh(chunk_size=chunk_size)
+
+    # ---------------------- 🔹 READ ----------------------
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return a read-only memory-mapped view of a cached column.
+
+        Args:
+            name (str): Cached column name, or "ID".
+
+        Returns:
+            np.ndarray: float64 values (int64 for "ID"); NULLs are NaN.
+        """
+        if name != "ID" and name not in self.columns:
+            raise KeyError(f"❌ Column '{name}' is not cached")
+        rows = self._load_meta()["rows"]
+        view = self._maps.get(name)
+        if view is None:
+            if rows == 0:
+                return np.empty(0, dtype=np.int64 if name == "ID" else np.float64)
+            view = np.memmap(self._file(name), dtype=np.int64 if name == "ID" else np.float64,
+                             mode="r", shape=(rows,))
+            self._maps[name] = view
+        return view
+
+    def ids(self) -> np.ndarray:
+        """Return the cached IDs (int64, ascending)."""
+        return self.column("ID")
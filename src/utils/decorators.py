@@ -1,5 +1,10 @@
-
+import os
+import time
 import functools
+import threading
+import contextlib
+
+
 def require_authorization(func):
     """Decorator to enforce authorization before method execution."""
     @functools.wraps(func)
@@ -9,3 +14,150 @@ def require_authorization(func):
         return func(self, *args, **kwargs)
     return wrapper
 
+
+PROFILE_ENV = "CONTROLDB_PROFILE"
+
+
+class ProfileReport:
+    """Result of a Profiler.session(): per-method timings and optional cProfile/tracemalloc data."""
+
+    def __init__(self):
+        self.methods: list[dict] = []
+        self.cprofile: "pstats.Stats | None" = None
+        self.memory: list = []
+
+    def format(self, top: int = 20) -> str:
+        """Return the hot-path report as text, slowest methods (by total time) first."""
+        lines = [f"{'method':<40} {'calls':>8} {'total s':>10} {'mean ms':>10} {'max ms':>10}"]
+        for m in self.methods[:top]:
+            lines.append(
+                f"{m['method']:<40} {m['calls']:>8} {m['total']:>10.4f} "
+                f"{m['mean'] * 1000:>10.3f} {m['max'] * 1000:>10.3f}"
+            )
+        if self.memory:
+            lines.append("")
+            lines.append("memory (allocated during session):")
+            lines += [f"  {stat}" for stat in self.memory[:top]]
+        return "\n".join(lines)
+
+
+class Profiler:
+    """
+    Process-wide call statistics for methods decorated with @profiled.
+
+    Disabled by default; enable with the CONTROLDB_PROFILE=1 environment
+    variable, by setting ``profiler.enabled = True`` or inside ``session()``.
+    """
+
+    def __init__(self):
+        self.enabled: bool = os.environ.get(PROFILE_ENV, "").lower() not in ("", "0", "false", "no")
+        self._lock = threading.Lock()
+        self._calls: dict[str, list] = {}
+
+    def record(self, name: str, elapsed: float) -> None:
+        """Add one call of `elapsed` seconds to method `name`."""
+        with self._lock:
+            entry = self._calls.get(name)
+            if entry is None:
+                self._calls[name] = [1, elapsed, elapsed]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+                if elapsed > entry[2]:
+                    entry[2] = elapsed
+
+    def reset(self) -> None:
+        """Clear all recorded calls."""
+        with self._lock:
+            self._calls.clear()
+
+    def report(self, since: dict[str, list] | None = None) -> list[dict]:
+        """
+        Return call statistics sorted by total time.
+
+        Args:
+            since (dict, optional): Earlier snapshot() to subtract (max is not subtracted).
+        """
+        with self._lock:
+            calls = {k: list(v) for k, v in self._calls.items()}
+
+        rows = []
+        for name, (count, total, max_) in calls.items():
+            if since and name in since:
+                count -= since[name][0]
+                total -= since[name][1]
+            if count <= 0:
+                continue
+            rows.append({"method": name, "calls": count, "total": total, "mean": total / count, "max": max_})
+        return sorted(rows, key=lambda r: r["total"], reverse=True)
+
+    def snapshot(self) -> dict[str, list]:
+        """Return a copy of the raw counters."""
+        with self._lock:
+            return {k: list(v) for k, v in self._calls.items()}
+
+    @contextlib.contextmanager
+    def session(self, cprofile: bool = False, memory: bool = False):
+        """
+        Enable profiling for the duration of a with-block.
+
+        Args:
+            cprofile (bool): Also run cProfile over the block.
+            memory (bool): Also compare tracemalloc snapshots taken before and after the block.
+
+        Yields:
+            ProfileReport: Filled in when the block exits.
+        """
+        report = ProfileReport()
+        was_enabled, self.enabled = self.enabled, True
+        before = self.snapshot()
+
+        prof = None
+        if cprofile:
+            import cProfile
+            prof = cProfile.Profile()
+        if memory:
+            import tracemalloc
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start()
+            mem_before = tracemalloc.take_snapshot()
+
+        if prof is not None:
+            prof.enable()
+        try:
+            yield report
+        finally:
+            if prof is not None:
+                import pstats
+                prof.disable()
+                report.cprofile = pstats.Stats(prof).sort_stats("cumulative")
+            if memory:
+                report.memory = tracemalloc.take_snapshot().compare_to(mem_before, "lineno")
+                if started_tracing:
+                    tracemalloc.stop()
+            self.enabled = was_enabled
+            report.methods = self.report(since=before)
+
+
+profiler = Profiler()
+
+
+def profiled(func):
+    """
+    Decorator recording call count and wall time of a method in `profiler`.
+
+    When profiling is disabled the only overhead is one attribute check.
+    """
+    name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not profiler.enabled:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.record(name, time.perf_counter() - start)
+    return wrapper
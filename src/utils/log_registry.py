@@ -0,0 +1,102 @@
+# log_registry.py
+
+import inspect
+import logging
+import functools
+import threading
+
+from pretty_logger import PrettyLogger
+
+_lock = threading.Lock()
+_loggers: dict[str, logging.Logger] = {}
+_adapters: dict[tuple[str, int], "LevelAdapter"] = {}
+
+
+class LevelAdapter(logging.LoggerAdapter):
+    """
+    View of a shared logger with its own level.
+
+    Records below `level` are dropped before they reach the shared logger, which
+    (with its handler) passes everything, so instances created with different
+    levels do not override each other. Adapters are shared per (name, level).
+    """
+
+    def __init__(self, logger: logging.Logger, level: int):
+        super().__init__(logger, None)
+        self.level = level
+
+    def setLevel(self, level: int) -> None:
+        self.level = level
+
+    def getEffectiveLevel(self) -> int:
+        return self.level
+
+    def isEnabledFor(self, level: int) -> bool:
+        return level >= self.level
+
+
+def get_logger(name: str, level: int = 30) -> LevelAdapter:
+    """
+    Return a logger for `name` at `level`, adding its stream handler only once.
+
+    All levels share one underlying logger and handler, so creating many
+    databases or tables neither stacks handlers nor duplicates log lines; the
+    level is applied per returned adapter, not on the shared logger.
+
+    Args:
+        name (str): Logger name (usually the class name).
+        level (int): Logging level (default: 30).
+
+    Returns:
+        LevelAdapter: Adapter on the shared logger (``.logger``) with its own level.
+    """
+    adapter = _adapters.get((name, level))
+    if adapter is not None:
+        return adapter
+    with _lock:
+        logger = _loggers.get(name)
+        if logger is None:
+            logCtr = PrettyLogger()
+            logger = logCtr.get(name)
+            logCtr.add_stream(name, level=level)
+            # Filtering happens in the adapters: the shared logger and handler pass everything
+            logger.setLevel(1)
+            for handler in logger.handlers:
+                handler.setLevel(logging.NOTSET)
+            _loggers[name] = logger
+        return _adapters.setdefault((name, level), LevelAdapter(logger, level))
+
+
+def registered_loggers() -> list[str]:
+    """Names of all loggers set up through the registry."""
+    return sorted(_loggers)
+
+
+def sharedlog(cls):
+    """
+    Class decorator assigning ``self.logger`` from the shared registry.
+
+    Drop-in replacement for ``@prettylog`` on classes created in bulk: the
+    logger is looked up by class name instead of being configured per instance.
+    The level is taken from the ``logLevel`` argument of ``__init__``.
+    """
+    init = cls.__init__
+    params = list(inspect.signature(init).parameters.values())
+    names = [p.name for p in params]
+    position = names.index("logLevel") - 1 if "logLevel" in names else None
+    default = params[position + 1].default if position is not None else 30
+    name = cls.__name__
+
+    @functools.wraps(init)
+    def __init__(self, *args, **kwargs):
+        if "logLevel" in kwargs:
+            level = kwargs["logLevel"]
+        elif position is not None and len(args) > position:
+            level = args[position]
+        else:
+            level = default
+        self.logger = get_logger(name, level)
+        init(self, *args, **kwargs)
+
+    cls.__init__ = __init__
+    return cls
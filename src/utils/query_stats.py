@@ -0,0 +1,251 @@
+# QueryStats.py
+
+import re
+import json
+import time
+import threading
+import functools
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+# Upper bounds in seconds, Prometheus style; the last bucket is +Inf
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w\]])[-+]?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=1024)
+def normalize_statement(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape, so executions with different
+    literals or IN-list lengths are counted together.
+    """
+    shape = _STRING_LITERAL.sub("?", statement)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?)", shape)
+    return _WHITESPACE.sub(" ", shape).strip()
+
+
+class Histogram:
+    """Cumulative latency histogram with fixed bucket bounds."""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: tuple = LATENCY_BUCKETS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation in seconds."""
+        for i, bound in enumerate(self.bounds):
+            if value <= bound:
+                break
+        else:
+            i = len(self.bounds)
+        self.counts[i] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile as the upper bound of the bucket holding it."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return self.bounds[i] if i < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable summary."""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "max": self.max,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([*map(str, self.bounds), "+Inf"], self.counts)),
+        }
+
+
+class QueryStats:
+    """
+    Opt-in query instrumentation for one SQLAlchemy engine.
+
+    Hooks the engine's cursor, transaction and pool events and records
+    per-statement-shape latency histograms, affected row counts, commits/rollbacks
+    and how long pooled connections are checked out.
+
+    ``rows_affected`` is the DBAPI ``cursor.rowcount`` summed per shape: rows
+    inserted, updated or deleted. Drivers report -1 for SELECT, and rows fetched
+    later are not visible to the cursor events, so reads count 0.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._engines: list[Engine] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear all collected statistics."""
+        with self._lock:
+            self.statements: dict[str, dict] = {}
+            self.commits = 0
+            self.rollbacks = 0
+            self.checkouts = Histogram()
+
+    # ---------------------- 🔹 ENGINE HOOKS ----------------------
+
+    def attach(self, engine: Engine) -> None:
+        """Start recording statistics for an engine."""
+        if engine in self._engines:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "commit", self._on_commit)
+        event.listen(engine, "rollback", self._on_rollback)
+        event.listen(engine.pool, "checkout", self._on_checkout)
+        event.listen(engine.pool, "checkin", self._on_checkin)
+        self._engines.append(engine)
+
+    def detach(self, engine: Engine) -> None:
+        """Stop recording statistics for an engine."""
+        if engine not in self._engines:
+            return
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.remove(engine, "commit", self._on_commit)
+        event.remove(engine, "rollback", self._on_rollback)
+        event.remove(engine.pool, "checkout", self._on_checkout)
+        event.remove(engine.pool, "checkin", self._on_checkin)
+        self._engines.remove(engine)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("_query_stats_start", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["_query_stats_start"].pop()
+        shape = normalize_statement(statement)
+        # rowcount is -1 for SELECT (rows are fetched after this event)
+        rows = cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else 0
+
+        with self._lock:
+            entry = self.statements.get(shape)
+            if entry is None:
+                entry = self.statements[shape] = {"latency": Histogram(), "rows_affected": 0, "executemany": 0}
+            entry["latency"].observe(elapsed)
+            entry["rows_affected"] += rows
+            entry["executemany"] += bool(executemany)
+
+    def _on_commit(self, conn):
+        with self._lock:
+            self.commits += 1
+
+    def _on_rollback(self, conn):
+        with self._lock:
+            self.rollbacks += 1
+
+    def _on_checkout(self, dbapi_conn, conn_record, conn_proxy):
+        conn_record.info["_query_stats_checkout"] = time.perf_counter()
+
+    def _on_checkin(self, dbapi_conn, conn_record):
+        start = conn_record.info.pop("_query_stats_checkout", None)
+        if start is not None:
+            with self._lock:
+                self.checkouts.observe(time.perf_counter() - start)
+
+    # ---------------------- 🔹 REPORTING ----------------------
+
+    def snapshot(self) -> dict:
+        """
+        Return a JSON-serialisable copy of the current statistics.
+
+        Returns:
+            dict: {"queries", "commits", "rollbacks", "checkouts", "statements": {shape: {...}}}
+        """
+        with self._lock:
+            statements = {
+                shape: {**entry["latency"].to_dict(), "rows_affected": entry["rows_affected"],
+                        "executemany": entry["executemany"]}
+                for shape, entry in self.statements.items()
+            }
+            return {
+                "queries": sum(s["count"] for s in statements.values()),
+                "commits": self.commits,
+                "rollbacks": self.rollbacks,
+                "checkouts": self.checkouts.to_dict(),
+                "statements": statements,
+            }
+
+
+# ---------------------- 🔹 EXPORT ----------------------
+
+def stats_to_json(stats: dict[str, dict], indent: int = None) -> str:
+    """Serialise {database name: QueryStats.snapshot()} to JSON."""
+    return json.dumps(stats, indent=indent)
+
+
+def _label(value) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _histogram_lines(name: str, labels: str, hist: dict) -> list[str]:
+    lines, cumulative = [], 0
+    for bound, n in hist["buckets"].items():
+        cumulative += n
+        lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+    lines.append(f"{name}_sum{{{labels}}} {hist['sum']}")
+    lines.append(f"{name}_count{{{labels}}} {hist['count']}")
+    return lines
+
+
+def stats_to_prometheus(stats: dict[str, dict], prefix: str = "controldb") -> str:
+    """Render {database name: QueryStats.snapshot()} in the Prometheus text exposition format."""
+    duration, rows, commits, rollbacks, checkouts = [], [], [], [], []
+    lock_wait, lock_retries, lock_timeouts = [], [], []
+
+    for database, snap in stats.items():
+        db_label = f'database="{_label(database)}"'
+        for shape, entry in snap.get("statements", {}).items():
+            labels = f'{db_label},statement="{_label(shape)}"'
+            duration += _histogram_lines(f"{prefix}_query_duration_seconds", labels, entry)
+            rows.append(f"{prefix}_query_rows_affected_total{{{labels}}} {entry['rows_affected']}")
+        if "commits" in snap:
+            commits.append(f"{prefix}_commits_total{{{db_label}}} {snap['commits']}")
+            rollbacks.append(f"{prefix}_rollbacks_total{{{db_label}}} {snap['rollbacks']}")
+            checkouts += _histogram_lines(f"{prefix}_connection_checkout_seconds", db_label, snap["checkouts"])
+        if "write_lock" in snap:
+            lock = snap["write_lock"]
+            lock_wait += _histogram_lines(f"{prefix}_write_lock_wait_seconds", db_label, lock["wait"])
+            lock_retries.append(f"{prefix}_write_lock_retries_total{{{db_label}}} {lock['retries']}")
+            lock_timeouts.append(f"{prefix}_write_lock_timeouts_total{{{db_label}}} {lock['timeouts']}")
+
+    lines = [
+        f"# TYPE {prefix}_query_duration_seconds histogram", *duration,
+        f"# TYPE {prefix}_query_rows_affected_total counter", *rows,
+        f"# TYPE {prefix}_commits_total counter", *commits,
+        f"# TYPE {prefix}_rollbacks_total counter", *rollbacks,
+        f"# TYPE {prefix}_connection_checkout_seconds histogram", *checkouts,
+    ]
+    if lock_wait:
+        lines += [
+            f"# TYPE {prefix}_write_lock_wait_seconds histogram", *lock_wait,
+            f"# TYPE {prefix}_write_lock_retries_total counter", *lock_retries,
+            f"# TYPE {prefix}_write_lock_timeouts_total counter", *lock_timeouts,
+        ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,118 @@
+# UtilsFrame.py
+
+import pandas as pd
+from typing import Iterable, Optional
+
+from sqlalchemy import Boolean, Integer, Float, Numeric, String, Date, DateTime, Time
+
+
+REASON_COLUMN = "_reason"
+
+_TRUE_VALUES = {"true", "t", "yes", "y", "1", "1.0"}
+_FALSE_VALUES = {"false", "f", "no", "n", "0", "0.0"}
+
+
+def _type_class(col_type) -> type:
+    """Accept both SQLAlchemy type classes and instances."""
+    return col_type if isinstance(col_type, type) else type(col_type)
+
+
+def _coerce_series(series: pd.Series, col_type: type) -> pd.Series:
+    """
+    Convert one column to the pandas dtype matching a SQLAlchemy type.
+
+    Values that cannot be converted become missing; the caller compares the
+    result with the input to find them.
+    """
+    if issubclass(col_type, Boolean):
+        if pd.api.types.is_bool_dtype(series):
+            return series.astype("boolean")
+        normalized = series.astype("string").str.strip().str.lower()
+        result = pd.Series(pd.NA, index=series.index, dtype="boolean")
+        result[normalized.isin(_TRUE_VALUES).fillna(False)] = True
+        result[normalized.isin(_FALSE_VALUES).fillna(False)] = False
+        return result
+
+    if issubclass(col_type, Integer):
+        numeric = pd.to_numeric(series, errors="coerce")
+        # Non-integral floats (2.5) are invalid, integral ones (2.0) are fine
+        return numeric.where(numeric % 1 == 0).astype("Int64")
+
+    if issubclass(col_type, (Float, Numeric)):
+        return pd.to_numeric(series, errors="coerce").astype("float64")
+
+    if issubclass(col_type, DateTime):
+        return pd.to_datetime(series, errors="coerce", format="mixed")
+
+    if issubclass(col_type, Date):
+        return pd.to_datetime(series, errors="coerce", format="mixed").dt.date
+
+    if issubclass(col_type, Time):
+        return pd.to_datetime(series.astype("string"), errors="coerce", format="mixed").dt.time
+
+    if issubclass(col_type, String):  # Text is a String subclass
+        return series.where(series.isna(), series.astype(str)).astype(object)
+
+    return series
+
+
+def coerce_dataframe(
+    df: pd.DataFrame,
+    column_definitions: dict[str, type],
+    required: Optional[Iterable[str]] = None,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Validate and convert a DataFrame column-wise before a bulk insert.
+
+    Every column listed in column_definitions is converted in one vectorized
+    pass. Rows holding a value that cannot be converted, or missing a required
+    value, are split out instead of failing the whole insert later.
+
+    Args:
+        df (pd.DataFrame): Input data.
+        column_definitions (dict[str, type]): Column name → SQLAlchemy type,
+            as returned by UtilsTable.get_column_definitions().
+        required (Iterable[str], optional): Columns that may not be missing.
+
+    Returns:
+        tuple[pd.DataFrame, pd.DataFrame]:
+            - converted rows that passed validation
+            - rejected rows (original values) with a '_reason' column
+    """
+    converted = df.copy()
+    reasons = pd.Series("", index=df.index, dtype=object)
+
+    for name, col_type in column_definitions.items():
+        if name not in df.columns:
+            continue
+        type_cls = _type_class(col_type)
+        original = df[name]
+        result = _coerce_series(original, type_cls)
+
+        bad = original.notna() & pd.isna(result)
+        if bad.any():
+            reasons[bad] += f"{name}: invalid {type_cls.__name__}; "
+        converted[name] = result
+
+    for name in required or ():
+        missing = df[name].isna() if name in df.columns else pd.Series(True, index=df.index)
+        if missing.any():
+            reasons[missing] += f"{name}: missing required value; "
+
+    rejected_mask = reasons != ""
+    rejected = df[rejected_mask].copy()
+    rejected[REASON_COLUMN] = reasons[rejected_mask].str.rstrip("; ")
+    return converted[~rejected_mask], rejected
+
+
+def dataframe_to_records(df: pd.DataFrame) -> list[dict]:
+    """
+    Convert a DataFrame to insert parameters with native Python values.
+
+    Missing values (NaN, NaT, pd.NA) become None so drivers bind them as NULL;
+    datetime columns become ``datetime.datetime`` (drivers reject pd.Timestamp).
+    """
+    records = df.astype(object)
+    for name in df.columns[[pd.api.types.is_datetime64_any_dtype(t) for t in df.dtypes]]:
+        records[name] = pd.Series(list(df[name].dt.to_pydatetime()), index=df.index, dtype=object)
+    return records.where(df.notna(), None).to_dict("records")
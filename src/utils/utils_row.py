@@ -1,20 +1,29 @@
 # UtilsRow.py
 
-import pandas as pd
 from typing import Optional, Dict, Any
 
 from sqlalchemy import Engine, MetaData, Table, Column, Integer, String
-from sqlalchemy import insert, select, delete, text, update, inspect
+from sqlalchemy import insert, select, delete, text, update, inspect, bindparam
 from sqlalchemy.orm import Session
 
-from pretty_logger import prettylog, PrettyLogger
+from pretty_logger import PrettyLogger
 
-from .decorators import require_authorization
+from .decorators import require_authorization, profiled
+from .log_registry import sharedlog
+from .write_lock import coordinated
 
-@prettylog
+@sharedlog
 class UtilsRow:
     """CRUD helper class for managing rows in ORM classes and Core Tables."""
 
+    # One helper per table handle and thread (see fork()); slots keep them compact
+    __slots__ = ("logger", "engine", "session", "base", "table_class", "logLevel",
+                 "_authorized", "last_error", "is_core", "_id_column", "_statements", "writer",
+                 "_UtilsRow__id")
+
+    # Bind parameter name of the row ID in prebuilt statements (must not clash with a column name)
+    ID_PARAM = "_row_id"
+
     @property
     def authorized(self) -> bool:
         """Check if the manager is authorized."""
@@ -47,6 +56,11 @@ class UtilsRow:
         self.id = row_id
         self.logLevel = logLevel
         self._authorized = True
+        self.last_error: Optional[Exception] = None
+        # Optional WriteCoordinator set by ControlDB: serialises writes and retries lock errors
+        self.writer = None
+        self._id_column = None
+        self._statements: dict = {}
 
         # Detect whether table_class is Core Table or ORM
         self.is_core = hasattr(self.table_class, "c")
@@ -69,6 +83,8 @@ class UtilsRow:
         self.table_class = table_class
         self.engine = engine
         self.session = session
+        self._id_column = None
+        self._statements = {}
 
         # Detect Core table vs ORM class
         if hasattr(table_class, "columns"):
@@ -78,17 +94,41 @@ class UtilsRow:
             self.is_core = False
             kind = "ORM Class"
 
-        self.logger.debug(f"UtilsRow initialized with {kind}")
+        self.logger.debug("UtilsRow initialized with %s", kind)
         self.logger.debug(" -> UtilsRow connected")
 
+    def fork(self) -> "UtilsRow":
+        """
+        Return a new row helper on the same table, engine, session and writer.
+
+        The resolved ID column and prebuilt statements are shared with this
+        helper; the target ID and last_error are not, so forks can be used
+        independently (one per table handle or thread).
+
+        Returns:
+            UtilsRow: New row helper.
+        """
+        row = UtilsRow(self.table_class, logLevel=self.logLevel)
+        row.engine = self.engine
+        row.session = self.session
+        row.base = self.base
+        row.is_core = self.is_core
+        row._authorized = self._authorized
+        row.writer = self.writer
+        row._id_column = self._id_column
+        row._statements = self._statements
+        return row
+
     def _get_id_column(self) -> object:
         """
-        Detect the ID column in the stored table_class.
+        Detect the ID column in the stored table_class (resolved once per connect).
 
         Returns:
             Column | attribute: ID column or attribute.
         """
-        if not hasattr(self, "table_class") or self.table_class is None:
+        if self._id_column is not None:
+            return self._id_column
+        if self.table_class is None:
             raise ValueError("⛔ - table_class is not set")
         
         id_column = None
@@ -106,8 +146,75 @@ class UtilsRow:
         if id_column is None:
             raise KeyError("❌ No ID column found")
 
+        self._id_column = id_column
         return id_column
 
+    def _statement(self, kind: str):
+        """
+        Return a prebuilt, parameterised Core statement for the stored table.
+
+        Statements are built once per connect and reused, so per-row calls skip
+        statement construction and hit SQLAlchemy's compiled cache directly.
+        The row ID is bound through the ``_row_id`` parameter; insert/update values
+        are passed as execution parameters.
+
+        Args:
+            kind (str): "select", "insert", "insert_returning", "update" or "delete".
+
+        Returns:
+            Executable: Cached statement.
+        """
+        stmt = self._statements.get(kind)
+        if stmt is not None:
+            return stmt
+
+        table = self.table_class
+        if kind == "insert":
+            stmt = insert(table)
+        elif kind == "insert_returning":
+            pk_col = next((c for c in table.columns if c.primary_key), None)
+            stmt = insert(table).returning(pk_col) if pk_col is not None else None
+        else:
+            where = self._get_id_column() == bindparam(self.ID_PARAM)
+            if kind == "select":
+                stmt = select(table).where(where)
+            elif kind == "update":
+                stmt = update(table).where(where)
+            elif kind == "delete":
+                stmt = delete(table).where(where)
+            else:
+                raise ValueError(f"⛔ - Unknown statement kind '{kind}'")
+
+        self._statements[kind] = stmt
+        return stmt
+
+    def _check_columns(self, data: Dict[str, Any], action: str, allow_empty: bool = True) -> bool:
+        """
+        Check Core row data against the table's columns before executing.
+
+        Prebuilt statements take their values as execution parameters, which
+        SQLAlchemy silently drops when they do not name a column.
+
+        Args:
+            data (Dict[str, Any]): Column-value mapping.
+            action (str): Operation name for the log message.
+            allow_empty (bool): Accept an empty mapping (default: True).
+
+        Returns:
+            bool: True if every key is a column, else ``last_error`` is set to a
+            KeyError and False is returned.
+        """
+        if not self.is_core:
+            return True
+        unknown = [k for k in data if k not in self.table_class.c]
+        if unknown or not (data or allow_empty):
+            self.last_error = KeyError(
+                f"Unknown columns for '{self.table_class.name}': {unknown}" if unknown else "No column values given")
+            self.logger.error("❌ row_%s failed: %s", action, self.last_error)
+            return False
+        return True
+
+    @profiled
     @require_authorization
     def get(self, id: Optional[int] = None) -> Optional[Dict[str, Any]]:
         """
@@ -127,11 +234,10 @@ class UtilsRow:
             self.logger.warning("⚠️ - No row_id provided for get")
             return None
 
-        id_column = self._get_id_column()
         if self.is_core:
-            result = self.session.execute(select(self.table_class).where(id_column == self.id)).first()
+            result = self.session.execute(self._statement("select"), {self.ID_PARAM: self.id}).first()
         else:
-            result = self.session.query(self.table_class).filter(id_column == self.id).first()
+            result = self.session.query(self.table_class).filter(self._get_id_column() == self.id).first()
 
         if not result:
             return None
@@ -153,9 +259,11 @@ class UtilsRow:
         if row_id is None:
             raise ValueError("⛔ - row_id cannot be None")
         self.id = row_id
-        self.logger.debug(f"🟢 - row_id set to {row_id}")
+        self.logger.debug("🟢 - row_id set to %s", row_id)
 
+    @profiled
     @require_authorization
+    @coordinated(failure=None)
     def create(self, *args, **kwargs) -> int | None:
         """
         Insert a new row into the stored table_class.
@@ -169,6 +277,9 @@ class UtilsRow:
         if self.engine is None or self.session is None:
             raise RuntimeError("⛔ - Manager is not connected")
 
+        self.last_error = None
+        if not self._check_columns(kwargs, "create"):
+            return None
         try:
             if not self.is_core:
                 row = self.table_class(*args, **kwargs)
@@ -177,32 +288,33 @@ class UtilsRow:
                 self.id = getattr(row, "ID", getattr(row, "id", getattr(row, "Id", None)))
                 return self.id
             else:
-                stmt = insert(self.table_class).values(**kwargs)
                 inserted_id = None
                 with self.engine.begin() as conn:
                     if "access" in str(self.engine.url).lower():
-                        conn.execute(stmt)
+                        conn.execute(self._statement("insert"), kwargs)
                         result = conn.execute(text("SELECT @@IDENTITY AS last_id"))
                         inserted_id = result.scalar()
                     else:
-                        pk_col = next((c for c in self.table_class.columns if c.primary_key), None)
-                        if pk_col is not None:
-                            stmt_return = stmt.returning(pk_col)
-                            result = conn.execute(stmt_return)
+                        stmt_return = self._statement("insert_returning")
+                        if stmt_return is not None:
+                            result = conn.execute(stmt_return, kwargs)
                             inserted_id = result.scalar()
                         else:
-                            conn.execute(stmt)
+                            conn.execute(self._statement("insert"), kwargs)
 
                 self.id = inserted_id
-                self.logger.info(f"✅ Core row added to '{self.table_class.name}' with ID={inserted_id}")
+                self.logger.info("✅ Core row added to '%s' with ID=%s", self.table_class.name, inserted_id)
                 return self.id
 
         except Exception as e:
             self.session.rollback()
-            self.logger.error(f"❌ row_create failed: {e}")
+            self.last_error = e
+            self.logger.error("❌ row_create failed: %s", e)
             return None
 
+    @profiled
     @require_authorization
+    @coordinated(failure=False)
     def merge(self, data: Dict[str, Any]) -> bool:
         """
         Update specified columns in a row, or insert if not exists.
@@ -219,38 +331,46 @@ class UtilsRow:
             new_id = self.create(**data)
             return new_id is not None
 
+        self.last_error = None
+        if not self._check_columns(data, "merge", allow_empty=False):
+            return False
         try:
-            id_column = self._get_id_column()
             if self.is_core:
-                sel = select(self.table_class).where(id_column == self.id)
-                existing = self.session.execute(sel).fetchone()
-                if existing:
-                    stmt = self.table_class.update().where(id_column == self.id).values(**data)
-                    self.session.execute(stmt)
-                    self.logger.info(f"✅ - Row ID={self.id} updated successfully")
+                # UPDATE first; only insert when no row matched (one round trip for the common case)
+                result = self.session.execute(self._statement("update"), {self.ID_PARAM: self.id, **data})
+                if result.rowcount:
+                    self.logger.info("✅ - Row ID=%s updated successfully", self.id)
                 else:
-                    new_data = {"ID": self.id, **data}
-                    self.session.execute(insert(self.table_class).values(**new_data))
-                    self.logger.info(f"✅ - Row ID={self.id} inserted successfully")
+                    # Unknown keys are dropped silently: key the ID by the table's own column name
+                    new_data = {self._get_id_column().key: self.id, **data}
+                    if not self._check_columns(new_data, "merge"):
+                        self.session.rollback()
+                        return False
+                    self.session.execute(self._statement("insert"), new_data)
+                    self.logger.info("✅ - Row ID=%s inserted successfully", self.id)
             else:
+                id_column = self._get_id_column()
                 row = self.session.query(self.table_class).filter(id_column == self.id).first()
                 if row:
                     for k, v in data.items():
                         if hasattr(row, k):
                             setattr(row, k, v)
-                    self.logger.info(f"✅ - ORM Row ID={self.id} updated successfully")
+                    self.logger.info("✅ - ORM Row ID=%s updated successfully", self.id)
                 else:
-                    new_data = {"ID": self.id, **data}
+                    new_data = {id_column.key: self.id, **data}
                     self.session.add(self.table_class(**new_data))
-                    self.logger.info(f"✅ - ORM Row ID={self.id} inserted successfully")
+                    self.logger.info("✅ - ORM Row ID=%s inserted successfully", self.id)
             self.session.commit()
             return True
         except Exception as e:
             self.session.rollback()
-            self.logger.error(f"❌ row_merge failed: {e}")
+            self.last_error = e
+            self.logger.error("❌ row_merge failed: %s", e)
             return False
     
+    @profiled
     @require_authorization
+    @coordinated(failure=False)
     def replace(self, new_data: Dict[str, Any]) -> bool:
         """
         Fully replace a row for Core or ORM tables.
@@ -270,30 +390,22 @@ class UtilsRow:
             new_id = self.create(**new_data)
             return new_id is not None
 
+        self.last_error = None
         try:
             id_column = self._get_id_column()
+            # Ensure ID is kept (under the table's own ID column name)
+            if id_column.key not in new_data:
+                new_data = {**new_data, id_column.key: self.id}
+            if not self._check_columns(new_data, "replace"):
+                return False
 
             # -------------------------
             # CORE TABLE BEHAVIOR
             # -------------------------
             if self.is_core:
-                existing = (
-                    self.session.execute(
-                        select(self.table_class).where(id_column == self.id)
-                    ).fetchone()
-                )
-
-                # Delete → Re-insert
-                if existing:
-                    self.session.execute(
-                        delete(self.table_class).where(id_column == self.id)
-                    )
-
-                # Ensure ID is kept
-                if not any(k.lower() == "id" for k in new_data.keys()):
-                    new_data["ID"] = self.id
-
-                self.session.execute(insert(self.table_class).values(**new_data))
+                # Delete → Re-insert (deleting a missing row is a no-op)
+                self.session.execute(self._statement("delete"), {self.ID_PARAM: self.id})
+                self.session.execute(self._statement("insert"), new_data)
 
             # -------------------------
             # ORM TABLE BEHAVIOR
@@ -325,21 +437,23 @@ class UtilsRow:
                             setattr(row, k, v)
 
                 else:
-                    # If row does not exist → create one using row_id
-                    new_data["ID"] = self.id
+                    # If row does not exist → create one using row_id (ID is in new_data)
                     row = self.table_class(**new_data)
                     self.session.add(row)
 
             self.session.commit()
-            self.logger.info(f"✅ Row ID={self.id} replaced successfully")
+            self.logger.info("✅ Row ID=%s replaced successfully", self.id)
             return True
 
         except Exception as e:
             self.session.rollback()
-            self.logger.error(f"❌ row_replace failed: {type(e).__name__}: {e}")
+            self.last_error = e
+            self.logger.error("❌ row_replace failed: %s: %s", type(e).__name__, e)
             return False
     
+    @profiled
     @require_authorization
+    @coordinated(failure=False)
     def delete(self) -> bool:
         """
         Delete the stored row by ID.
@@ -351,19 +465,20 @@ class UtilsRow:
             self.logger.warning("⚠️ - No row_id provided for delete")
             return False
 
+        self.last_error = None
         try:
-            id_column = self._get_id_column()
             if self.is_core:
-                self.session.execute(delete(self.table_class).where(id_column == self.id))
+                self.session.execute(self._statement("delete"), {self.ID_PARAM: self.id})
             else:
-                row = self.session.query(self.table_class).filter(id_column == self.id).first()
+                row = self.session.query(self.table_class).filter(self._get_id_column() == self.id).first()
                 if row:
                     self.session.delete(row)
             self.session.commit()
-            self.logger.info(f"✅ Row ID={self.id} deleted successfully")
+            self.logger.info("✅ Row ID=%s deleted successfully", self.id)
             self.id = None
             return True
         except Exception as e:
             self.session.rollback()
-            self.logger.error(f"❌ row_delete failed: {type(e).__name__}: {e}")
+            self.last_error = e
+            self.logger.error("❌ row_delete failed: %s: %s", type(e).__name__, e)
             return False
@@ -1,20 +1,36 @@
-import pandas as pd
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 from sqlalchemy import Engine, MetaData, Table, Column, Integer, String
-from sqlalchemy import insert, select, delete, text, update, Table, Column, Integer, MetaData
+from sqlalchemy import insert, select, delete, text, update, func, Table, Column, Integer, MetaData
+from sqlalchemy import Boolean, Float, Numeric, DateTime
 from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from pretty_logger import prettylog, PrettyLogger
+from pretty_logger import PrettyLogger
 
-from .decorators import require_authorization
+from .decorators import require_authorization, profiled
+from .log_registry import sharedlog
 from .utils_row import UtilsRow
+from .write_lock import coordinated
+
+# pandas/numpy are imported on first use (DataFrame/array methods) to keep package import cheap
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
 
 
-@prettylog
+@sharedlog
 class UtilsTable:
     """CRUD helper class for managing ORM and Core SQLAlchemy Tables."""
+
+    # ControlDB.load_table hands out a cheap handle() per call; slots keep them compact
+    __slots__ = ("logger", "table_class", "logLevel", "row_id", "rejected_rows", "_authorized",
+                 "engine", "session", "base", "is_core", "last_error", "_writer", "_rows",
+                 "_UtilsTable__row")
+
     @property
     def authorized(self) -> bool:
         """Check if the manager is authorized."""
@@ -22,8 +38,27 @@ class UtilsTable:
     
     @property
     def row(self) -> UtilsRow:
-        """Database ID."""
-        return self.__row
+        """Row helper of the calling thread (its ID and last_error are not shared between threads)."""
+        row = getattr(self._rows, "row", None)
+        if row is None:
+            row = self._rows.row = self.__row.fork()
+        return row
+
+    @property
+    def writer(self):
+        """WriteCoordinator of the database file (shared with the row helper), or None."""
+        return self._writer
+
+    @writer.setter
+    def writer(self, value) -> None:
+        self._writer = value
+        self.__row.writer = value
+        self._reset_rows()
+
+    @property
+    def table(self) -> Table:
+        """Underlying Core Table, for both Core tables and ORM classes."""
+        return self.table_class if self.is_core else self.table_class.__table__
 
     def __init__(self,
         table_class: object = None,
@@ -47,14 +82,19 @@ class UtilsTable:
 
         self.logger: PrettyLogger
         self.row_id: int = None
+        self.rejected_rows: Optional[pd.DataFrame] = None
+        self.last_error: Optional[Exception] = None
+        self._writer = None
         
         self._authorized = False
-        self.engine: Optional[Engine]
-        self.session: Optional[Session]
+        self.engine: Optional[Engine] = None
+        self.session: Optional[Session] = None
+        self.is_core: bool = hasattr(table_class, "c")
         self.base: Optional[MetaData | list[MetaData]] = base
 
-        # Initialize UtilsRow (temporary, will reconnect if needed)
+        # Initialize UtilsRow (temporary, will reconnect if needed); other threads get forks of it
         self.__row: UtilsRow = UtilsRow(self.table_class, logLevel=logLevel)
+        self._reset_rows()
 
         # Auto-connect if engine is provided
         if engine is not None:
@@ -65,11 +105,44 @@ class UtilsTable:
                 table_class=table_class,
                 engine=engine,
                 session=session,
-                base=base,
             )
             
     # ---------------------- 🔹 CONNECTION ----------------------
 
+    def _reset_rows(self) -> None:
+        """Drop the per-thread row helpers; the calling thread uses the primary one."""
+        self._rows = threading.local()
+        self._rows.row = self.__row
+
+    def handle(self) -> UtilsTable:
+        """
+        Return a new handle on the same connected table.
+
+        The handle shares the table, engine, session, writer and the row helper's
+        resolved ID column and prebuilt statements. Row state (row.id,
+        row.last_error) and rejected_rows are its own.
+
+        Returns:
+            UtilsTable: New handle.
+        """
+        # Skip __init__: its logger lookup and throwaway UtilsRow would be discarded anyway
+        other = object.__new__(UtilsTable)
+        other.logger = self.logger
+        other.logLevel = self.logLevel
+        other.table_class = self.table_class
+        other.engine = self.engine
+        other.session = self.session
+        other.base = self.base
+        other.is_core = self.is_core
+        other._authorized = self._authorized
+        other._writer = self._writer
+        other.row_id = None
+        other.rejected_rows = None
+        other.last_error = None
+        other.__row = self.__row.fork()
+        other._reset_rows()
+        return other
+
     def _detect_kind_and_name(self, table_class: object):
         """Return a tuple (is_core, kind_str, name) for logging purposes."""
         is_core = hasattr(table_class, "c")
@@ -101,9 +174,10 @@ class UtilsTable:
 
         # Reconnect UtilsRow
         self.__row.connect(table_class, engine, session)
+        self._reset_rows()
 
         self._authorized = True
-        self.logger.debug(f"✅ UtilsTable connected for {kind}: {name}")
+        self.logger.debug("✅ UtilsTable connected for %s: %s", kind, name)
     
     def create(self, 
                table_name: str, 
@@ -160,7 +234,7 @@ class UtilsTable:
         table = Table(table_name, metadata, *column_objs)
         metadata.create_all(engine)
         self.connect(table, engine, session=session)
-        self.logger.info(f"✅ - Table '{table_name}' created successfully with standardized ID column")
+        self.logger.info("✅ - Table '%s' created successfully with standardized ID column", table_name)
         return table
     
     def load(self,
@@ -176,16 +250,15 @@ class UtilsTable:
             UtilsTable: Wrapped UtilsTable instance for the existing table.
         """
         def create_core_table() -> Table:
-            meta = MetaData()  # altijd nieuw MetaData object
-            with engine.connect() as conn:
-                stmt = text(f"SELECT * FROM [{table_identity}] WHERE 1=0")
-                result = conn.execute(stmt)
-                column_names = result.keys()
-            columns = [
-                Column(name, Integer, primary_key=True, autoincrement=True) if name.lower() == "id" else Column(name, String)
-                for name in column_names
-            ]
-            return Table(table_identity, meta, *columns)
+            # Reflect the real column types so coercion follows the database schema
+            table = Table(table_identity, MetaData(), autoload_with=engine)
+            id_name = next((c.name for c in table.columns if c.name.lower() == "id"), None)
+            if id_name is None or table.primary_key.columns:
+                return table
+            # No declared key: treat the ID column as the autoincrement key, as create() does
+            return Table(table_identity, MetaData(),
+                         Column(id_name, Integer, primary_key=True, autoincrement=True),
+                         autoload_with=engine)
         
         # ORM class of Table object
         if isinstance(table_identity, str):
@@ -195,7 +268,7 @@ class UtilsTable:
             table_class = table_identity
 
         self.connect(table_class, engine, session=session)
-        self.logger.debug(f" => Table '{table_identity}' mapped from existing database")
+        self.logger.debug(" => Table '%s' mapped from existing database", table_identity)
         return True
     
     # ---------------------- 🔹 COLUMN INFO ----------------------
@@ -237,23 +310,25 @@ class UtilsTable:
         cols = self.table_class.columns if self.is_core else self.table_class.__table__.columns
         return {c.name: type(c.type) for c in cols}
 
+    @profiled
     def get_column_as_list(self, column_name: str) -> list:
         """Return all values from a given column."""
         if self.is_core:
             column = self.table_class.columns.get(column_name)
-            if not column:
+            if column is None:
                 raise ValueError(f"Column '{column_name}' not found in {self.table_class.name}")
             with self.engine.connect() as conn:
                 result = conn.execute(select(column))
                 return [row[0] for row in result]
         else:
             column = getattr(self.table_class, column_name, None)
-            if not column:
+            if column is None:
                 raise ValueError(f"Column '{column_name}' not found in {self.table_class.__tablename__}")
             return [row[0] for row in self.session.query(column).all()]
 
     # ---------------------- 🔹 IDS & ROWS ----------------------
 
+    @profiled
     def get_first_free_id(self, pk: str = "ID") -> int:
         """Find the first available (gapless) ID value."""
         try:
@@ -273,9 +348,10 @@ class UtilsTable:
                     return expected
             return ids[-1] + 1
         except Exception as e:
-            self.logger.error(f"Error finding first free ID: {e}")
+            self.logger.error("Error finding first free ID: %s", e)
             return -1
 
+    @profiled
     def get_row_dict(self, id: int) -> dict | None:
         """Fetch a row by ID as a dict."""
         filter_col = self.table_class.c.ID if self.is_core else self.table_class.ID
@@ -296,9 +372,117 @@ class UtilsTable:
 
     # ---------------------- 🔹 TABLE OPERATIONS ----------------------
 
+    def _numpy_dtype(self, column: Column):
+        """NumPy dtype for a column's SQLAlchemy type (object for anything non-numeric)."""
+        import numpy as np
+
+        col_type = column.type
+        if isinstance(col_type, Boolean):
+            return np.bool_
+        if isinstance(col_type, Integer):
+            return np.int64
+        if isinstance(col_type, (Float, Numeric)):
+            return np.float64
+        if isinstance(col_type, DateTime):
+            return "datetime64[us]"
+        return object
+
+    @profiled
+    @require_authorization
+    def to_numpy(self, columns: str | list[str] | None = None, where=None,
+                 chunk_size: int = 50_000) -> dict[str, np.ndarray] | np.ndarray:
+        """
+        Read columns into typed NumPy arrays without building row objects.
+
+        Rows are pulled with DBAPI cursor fetchmany (plain tuples, no Row objects)
+        and copied batch-wise into buffers preallocated from a COUNT(*); only
+        columns whose type needs result processing (e.g. SQLite DateTime) are
+        converted in Python. NULLs become NaN in float64 and NaT in datetime64
+        columns; Integer columns containing NULLs fall back to float64 (NaN) and
+        Boolean columns containing NULLs to object (True/False/None). Other
+        types are object.
+
+        Args:
+            columns (str | list[str] | None): Column or columns to read (default: all).
+            where (ColumnElement, optional): SQLAlchemy filter expression.
+            chunk_size (int): Rows per fetchmany call (default: 50 000).
+
+        Returns:
+            dict[str, np.ndarray] | np.ndarray: Column name → array, or one array when
+                `columns` is a single name.
+        """
+        import numpy as np
+
+        single = isinstance(columns, str)
+        names = [columns] if single else (columns or self.get_column_names())
+        table = self.table
+        missing = [c for c in names if c not in table.c]
+        if missing:
+            raise ValueError(f"Columns {missing} not found in {table.name}")
+        cols = [table.c[c] for c in names]
+
+        dialect = self.engine.dialect
+        processors = [c.type.dialect_impl(dialect).result_processor(dialect, None) for c in cols]
+
+        count_stmt = select(func.count()).select_from(table)
+        stmt = select(*cols)
+        if where is not None:
+            count_stmt, stmt = count_stmt.where(where), stmt.where(where)
+
+        with self.engine.connect() as conn:
+            total = conn.execute(count_stmt).scalar()
+            buffers = [np.empty(total, dtype=self._numpy_dtype(c)) for c in cols]
+            pos = 0
+            # Executed through SQLAlchemy (bind processing, events), fetched from the raw cursor
+            cursor = conn.execute(stmt).cursor
+            while batch := cursor.fetchmany(chunk_size):
+                end = pos + len(batch)
+                if end > len(buffers[0]):  # rows appended after the count
+                    buffers = [np.concatenate((b, np.empty(end - len(b), dtype=b.dtype))) for b in buffers]
+                for i, process in enumerate(processors):
+                    values = [r[i] for r in batch]
+                    if process is not None:
+                        values = [process(v) for v in values]
+                    # NumPy stores None as False in bool and rejects it in int buffers
+                    kind = buffers[i].dtype.kind
+                    if kind in "bi" and any(v is None for v in values):
+                        buffers[i] = buffers[i].astype(object if kind == "b" else np.float64)
+                    buffers[i][pos:end] = values
+                pos = end
+
+        arrays = {name: buffer[:pos] for name, buffer in zip(names, buffers)}
+        return arrays[names[0]] if single else arrays
+
+    @profiled
+    @require_authorization
+    def to_arrow(self, columns: list[str] | None = None, where=None, chunk_size: int = 50_000):
+        """
+        Read columns into a pyarrow Table (requires the optional ``pyarrow`` package).
+
+        Built from to_numpy() buffers; NaN/NaT/None become Arrow nulls.
+
+        Args:
+            columns (list[str] | None): Columns to read (default: all).
+            where (ColumnElement, optional): SQLAlchemy filter expression.
+            chunk_size (int): Rows per fetchmany call (default: 50 000).
+
+        Returns:
+            pyarrow.Table: Column-oriented result.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("⛔ - to_arrow requires pyarrow: pip install ControlDB[arrow]") from e
+
+        arrays = self.to_numpy(list(columns) if columns else None, where=where, chunk_size=chunk_size)
+        return pa.table({name: pa.array(values, from_pandas=True) for name, values in arrays.items()})
+
+    @profiled
     def get_df_table(self) -> pd.DataFrame | None:
         """Return the full table as a pandas DataFrame."""
         table_name = getattr(self.table_class, "__tablename__", getattr(self.table_class, "name", None))
+        import pandas as pd
+
         try:
             with self.engine.connect() as conn:
                 df = pd.read_sql_query(f"SELECT * FROM [{table_name}]", conn)
@@ -306,9 +490,86 @@ class UtilsTable:
                 df = df.set_index("ID")
             return df
         except Exception as e:
-            self.logger.warning(f"⚠️ - Get Table failed: {e}")
+            self.logger.warning("⚠️ - Get Table failed: %s", e)
+            return None
+
+    def coerce_dataframe(self, df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """
+        Convert a DataFrame to this table's column types (see utils_frame.coerce_dataframe).
+
+        Non-nullable columns without a default are required, except autoincrement keys.
+
+        Returns:
+            tuple[pd.DataFrame, pd.DataFrame]: (valid converted rows, rejected rows with '_reason').
+        """
+        from .utils_frame import coerce_dataframe
+
+        required = [
+            c.name for c in self.table.columns
+            if not c.nullable and not c.primary_key and c.default is None and c.server_default is None
+        ]
+        return coerce_dataframe(df, self.get_column_definitions(), required=required)
+
+    @profiled
+    @require_authorization
+    @coordinated(failure=None)
+    def insert_dataframe(self, df: pd.DataFrame, coerce: bool = True, chunk_size: int = 1000) -> int | None:
+        """
+        Bulk insert a DataFrame with one executemany per chunk.
+
+        Rows that fail type coercion are not inserted; they are kept in
+        self.rejected_rows (with a '_reason' column) for inspection.
+
+        Args:
+            df (pd.DataFrame): Rows to insert; columns unknown to the table are ignored.
+            coerce (bool): Validate and convert column types before inserting (default: True).
+            chunk_size (int): Rows per executemany batch (default: 1000).
+
+        Returns:
+            int | None: Number of rows inserted, or None if the insert failed and was rolled back.
+        """
+        from .utils_frame import dataframe_to_records
+
+        table_name = self.table.name
+        columns = self.get_column_names()
+
+        unknown = [c for c in df.columns if c not in columns]
+        if unknown:
+            self.logger.warning("⚠️ - Ignoring columns not in '%s': %s", table_name, unknown)
+        df = df[[c for c in df.columns if c in columns]]
+
+        # Let the database assign autoincrement keys when none are given
+        for pk in self.table.primary_key.columns:
+            if pk.name in df.columns and df[pk.name].isna().all():
+                df = df.drop(columns=pk.name)
+
+        if coerce:
+            df, self.rejected_rows = self.coerce_dataframe(df)
+            if len(self.rejected_rows):
+                self.logger.warning("⚠️ - %s rows rejected for '%s'", len(self.rejected_rows), table_name)
+        else:
+            self.rejected_rows = df.iloc[0:0]
+
+        if df.empty:
+            return 0
+
+        records = dataframe_to_records(df)
+        stmt = insert(self.table)
+        self.last_error = None
+        try:
+            for start in range(0, len(records), chunk_size):
+                self.session.execute(stmt, records[start:start + chunk_size])
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            self.last_error = e
+            self.logger.error("❌ insert_dataframe into '%s' failed: %s", table_name, e)
             return None
 
+        self.logger.info("✅ - Inserted %s rows into '%s'", len(records), table_name)
+        return len(records)
+
+    @profiled
     @require_authorization
     def update_column_value(self, row_id: int, column_name: str, new_value):
         """Update a single column value for a given row."""
@@ -326,7 +587,7 @@ class UtilsTable:
                 raise ValueError(f"Row with ID={row_id} not found in {table_name}")
             setattr(row, column_name, new_value)
         self.session.commit()
-        self.logger.debug(f"✅ - Updated row {row_id}: {column_name} = {new_value}")
+        self.logger.debug("✅ - Updated row %s: %s = %s", row_id, column_name, new_value)
         return True
 
     @require_authorization
@@ -338,9 +599,9 @@ class UtilsTable:
                 type_name = col_type().compile(dialect=self.engine.dialect)
                 sql = f'ALTER TABLE {table_name} ADD COLUMN {col_name} {type_name}'
                 self.session.execute(sql)
-                self.logger.debug(f"➕ Added column '{col_name}' ({type_name})")
+                self.logger.debug("➕ Added column '%s' (%s)", col_name, type_name)
             self.session.commit()
         except Exception as e:
             self.session.rollback()
-            self.logger.warning(f"⚠️ - Failed to add columns to {table_name}: {e}")
+            self.logger.warning("⚠️ - Failed to add columns to %s: %s", table_name, e)
             raise
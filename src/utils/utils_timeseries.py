@@ -0,0 +1,299 @@
+# utils_timeseries.py
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Any
+
+from sqlalchemy import Table, Column, MetaData, Index, Float, DateTime
+from sqlalchemy import select, func, and_, literal_column
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from pretty_logger import PrettyLogger
+
+from .decorators import require_authorization, profiled
+from .log_registry import sharedlog
+from .utils_table import UtilsTable
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+OHLCV_COLUMNS = {"open": Float, "high": Float, "low": Float, "close": Float, "volume": Float}
+
+
+def interval_seconds(interval: int | float | str) -> int:
+    """Convert an interval (seconds or a pandas offset such as "5min", "1h", "1D") to whole seconds."""
+    if isinstance(interval, (int, float)):
+        seconds = int(interval)
+    else:
+        import pandas as pd
+        seconds = int(pd.Timedelta(interval).total_seconds())
+    if seconds <= 0:
+        raise ValueError(f"⛔ - Interval must be positive, got {interval!r}")
+    return seconds
+
+
+@sharedlog
+class TimeSeriesTable:
+    """
+    Append-optimised OHLCV table keyed by (key columns..., time).
+
+    The primary key doubles as the clustered time index: SQLite tables are created
+    WITHOUT ROWID (rows stored in key order) and MS Access clusters on the primary
+    key when the file is compacted. Range, latest and downsample queries run in the
+    database, so only the requested rows are transferred.
+    """
+
+    __slots__ = ("logger", "logLevel", "table", "engine", "session", "time_column",
+                 "key_columns", "_authorized", "_loader")
+
+    @property
+    def authorized(self) -> bool:
+        """Check if the table is connected."""
+        return getattr(self, "_authorized", False)
+
+    @property
+    def name(self) -> str:
+        """Table name."""
+        return self.table.name
+
+    @property
+    def writer(self):
+        """WriteCoordinator used by append(), or None."""
+        return self._loader.writer
+
+    @writer.setter
+    def writer(self, value) -> None:
+        self._loader.writer = value
+
+    @property
+    def rejected_rows(self) -> Optional[pd.DataFrame]:
+        """Rows rejected by the last append() (with a '_reason' column)."""
+        return self._loader.rejected_rows
+
+    def __init__(self, table: Table, engine: Engine, session: Optional[Session] = None,
+                 time_column: str = "time", logLevel: int = 30):
+        """
+        Initialize the time-series table.
+
+        Args:
+            table (Table): Core Table with a DateTime primary key column `time_column`.
+            engine (Engine): SQLAlchemy engine.
+            session (Optional[Session]): SQLAlchemy session used for appends.
+            time_column (str): Name of the timestamp column (default: "time").
+            logLevel (int): Logging level (default: 30).
+        """
+        if engine is None:
+            raise RuntimeError("⛔ - No active engine connection provided")
+        if time_column not in table.c:
+            raise KeyError(f"❌ Time column '{time_column}' not found in '{table.name}'")
+
+        self.logger: PrettyLogger
+        self.logLevel = logLevel
+        self.table = table
+        self.engine = engine
+        self.session = session
+        self.time_column = time_column
+        self.key_columns: list[str] = [c.name for c in table.primary_key.columns if c.name != time_column]
+        self._loader = UtilsTable(table, engine=engine, session=session, logLevel=logLevel)
+        self._authorized = True
+
+    @staticmethod
+    def build(table_name: str, metadata: MetaData, keys: Optional[dict] = None,
+              columns: Optional[dict] = None, time_column: str = "time") -> Table:
+        """
+        Define a time-series Core Table.
+
+        Args:
+            table_name (str): Name of the table.
+            metadata (MetaData): Metadata to attach the table to.
+            keys (Optional[dict]): Series key columns (e.g. {"symbol": String(16)}) leading the primary key.
+            columns (Optional[dict]): Value columns (default: open/high/low/close/volume as Float).
+            time_column (str): Name of the timestamp column (default: "time").
+
+        Returns:
+            Table: Table with primary key (keys..., time).
+        """
+        keys = keys or {}
+        columns = OHLCV_COLUMNS if columns is None else columns
+        table = Table(
+            table_name, metadata,
+            *[Column(name, col_type, primary_key=True) for name, col_type in keys.items()],
+            Column(time_column, DateTime, primary_key=True),
+            *[Column(name, col_type) for name, col_type in columns.items()],
+            sqlite_with_rowid=False,
+        )
+        if keys:
+            # Scans over all series filter on time only
+            Index(f"ix_{table_name}_{time_column}", table.c[time_column])
+        return table
+
+    # ---------------------- 🔹 WRITE ----------------------
+
+    @profiled
+    @require_authorization
+    def append(self, df: pd.DataFrame, chunk_size: int = 10_000) -> int | None:
+        """
+        Append rows in executemany batches.
+
+        Args:
+            df (pd.DataFrame): Rows with the time column, key columns and value columns.
+            chunk_size (int): Rows per batch (default: 10 000).
+
+        Returns:
+            int | None: Number of rows appended, or None if the batch failed and was rolled back
+                (for example on a duplicate (key, time)).
+        """
+        return self._loader.insert_dataframe(df, chunk_size=chunk_size)
+
+    # ---------------------- 🔹 READ ----------------------
+
+    def _where(self, start: Any = None, end: Any = None, keys: Optional[dict] = None, table=None) -> list:
+        table = self.table if table is None else table
+        time = table.c[self.time_column]
+        conditions = []
+        if start is not None:
+            conditions.append(time >= start)
+        if end is not None:
+            conditions.append(time < end)
+        for name, value in (keys or {}).items():
+            if name not in self.key_columns:
+                raise KeyError(f"❌ '{name}' is not a key column of '{self.name}'")
+            conditions.append(table.c[name] == value)
+        return conditions
+
+    def _frame(self, stmt) -> pd.DataFrame:
+        import pandas as pd
+
+        with self.engine.connect() as conn:
+            result = conn.execute(stmt)
+            return pd.DataFrame(result.fetchall(), columns=list(result.keys()))
+
+    @profiled
+    @require_authorization
+    def range(self, start: Any = None, end: Any = None, columns: Optional[list[str]] = None,
+              **keys) -> pd.DataFrame | None:
+        """
+        Return rows with start <= time < end in time order.
+
+        Args:
+            start (datetime, optional): Inclusive lower bound (default: unbounded).
+            end (datetime, optional): Exclusive upper bound (default: unbounded).
+            columns (Optional[list[str]]): Columns to return (default: all).
+            **keys: Series key filters, e.g. symbol="BTC".
+
+        Returns:
+            pd.DataFrame | None: Matching rows, or None if the query failed.
+        """
+        cols = [self.table.c[c] for c in columns] if columns else [self.table]
+        stmt = (
+            select(*cols)
+            .where(*self._where(start, end, keys))
+            .order_by(*[self.table.c[k] for k in self.key_columns], self.table.c[self.time_column])
+        )
+        try:
+            return self._frame(stmt)
+        except Exception as e:
+            self.logger.error("❌ range on '%s' failed: %s", self.name, e)
+            return None
+
+    @profiled
+    @require_authorization
+    def latest(self, n: int = 1, **keys) -> pd.DataFrame | None:
+        """
+        Return the last `n` rows in ascending time order.
+
+        Args:
+            n (int): Number of rows (default: 1).
+            **keys: Series key filters, e.g. symbol="BTC".
+
+        Returns:
+            pd.DataFrame | None: Rows, or None if the query failed.
+        """
+        time = self.table.c[self.time_column]
+        stmt = select(self.table).where(*self._where(keys=keys)).order_by(time.desc()).limit(n)
+        try:
+            return self._frame(stmt).iloc[::-1].reset_index(drop=True)
+        except Exception as e:
+            self.logger.error("❌ latest on '%s' failed: %s", self.name, e)
+            return None
+
+    # ---------------------- 🔹 DOWNSAMPLE ----------------------
+
+    def _bucket(self, seconds: int):
+        """Per-dialect SQL expression numbering `seconds`-wide buckets since the Unix epoch."""
+        time = self.engine.dialect.identifier_preparer.quote(self.time_column)
+        dialect = self.engine.dialect.name
+        if dialect == "sqlite":
+            expr = f"(CAST(strftime('%s', {time}) AS INTEGER) / {seconds})"
+        elif dialect == "access":
+            expr = f"(DateDiff('s', #1970-01-01#, {time}) \\ {seconds})"
+        else:
+            expr = f"FLOOR(EXTRACT(EPOCH FROM {time}) / {seconds})"
+        return literal_column(expr)
+
+    @profiled
+    @require_authorization
+    def downsample(self, interval: int | str, start: Any = None, end: Any = None, **keys) -> pd.DataFrame | None:
+        """
+        Aggregate OHLCV rows into wider candles in the database.
+
+        open/close come from the first/last row of each bucket, high/low are the
+        max/min and volume is summed. Buckets are aligned to the Unix epoch.
+
+        Args:
+            interval (int | str): Bucket width in seconds or as pandas offset ("5min", "1h").
+            start (datetime, optional): Inclusive lower bound on source rows.
+            end (datetime, optional): Exclusive upper bound on source rows.
+            **keys: Series key filters, e.g. symbol="BTC".
+
+        Returns:
+            pd.DataFrame | None: Columns (keys..., time, open, high, low, close, volume),
+                or None if the query failed.
+        """
+        import pandas as pd
+
+        seconds = interval_seconds(interval)
+        t = self.table
+        time = t.c[self.time_column]
+        bucket = self._bucket(seconds)
+        key_cols = [t.c[k] for k in self.key_columns]
+
+        grouped = (
+            select(
+                *key_cols,
+                bucket.label("bucket"),
+                func.min(time).label("first_time"),
+                func.max(time).label("last_time"),
+                func.max(t.c.high).label("high"),
+                func.min(t.c.low).label("low"),
+                func.sum(t.c.volume).label("volume"),
+            )
+            .where(*self._where(start, end, keys))
+            .group_by(*key_cols, bucket)
+            .subquery("b")
+        )
+        first, last = t.alias("o"), t.alias("c")
+        join = (
+            grouped
+            .join(first, and_(first.c[self.time_column] == grouped.c.first_time,
+                              *[first.c[k] == grouped.c[k] for k in self.key_columns]))
+            .join(last, and_(last.c[self.time_column] == grouped.c.last_time,
+                             *[last.c[k] == grouped.c[k] for k in self.key_columns]))
+        )
+        stmt = (
+            select(*[grouped.c[k] for k in self.key_columns], grouped.c.bucket,
+                   first.c.open, grouped.c.high, grouped.c.low, last.c.close, grouped.c.volume)
+            .select_from(join)
+            .order_by(*[grouped.c[k] for k in self.key_columns], grouped.c.bucket)
+        )
+        try:
+            df = self._frame(stmt)
+        except Exception as e:
+            self.logger.error("❌ downsample on '%s' failed: %s", self.name, e)
+            return None
+
+        df.insert(len(self.key_columns), self.time_column,
+                  pd.to_datetime(df.pop("bucket").astype("int64") * seconds, unit="s"))
+        return df
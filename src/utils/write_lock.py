@@ -0,0 +1,217 @@
+# write_lock.py
+
+import re
+import sys
+import time
+import random
+import threading
+import functools
+import contextlib
+from typing import Callable, Optional
+
+from .query_stats import Histogram
+
+
+# Lock waits are longer than query latencies: up to the deadline
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# SQLite "database is locked"/SQLITE_BUSY and the Jet/ACE lock errors
+# (3006/3008/3009/3045/3188/3211/3218/3260/3261/3262: record, table or file locked by another session)
+_LOCK_ERROR = re.compile(
+    r"database (?:table )?is locked|database is busy|sqlite_busy|could not lock|currently locked"
+    r"|file already in use|locked by (?:another )?(?:user|session)|\(-?(?:3006|3008|3009|3045|3188|3211|3218|3260|3261|3262)\)",
+    re.IGNORECASE,
+)
+
+
+def is_lock_error(error: Optional[BaseException]) -> bool:
+    """Return True if `error` is a transient lock conflict worth retrying."""
+    return error is not None and bool(_LOCK_ERROR.search(str(error)))
+
+
+class WriteCoordinator:
+    """
+    Serialise writes to one database file across threads and processes.
+
+    Writers take an advisory lock on ``<database file>.lock`` (``fcntl.flock`` on
+    POSIX, ``msvcrt.locking`` on Windows) before writing. If the lock is held or
+    a write still fails with a lock error (e.g. a process that does not use the
+    coordinator), the write is retried with exponential backoff and jitter until
+    the deadline. Lock waits, retries and timeouts are counted for ``stats()``.
+    The lock is reentrant within a thread, so nested writes do not deadlock.
+    """
+
+    def __init__(self, path: str, deadline: float = 30.0, base_delay: float = 0.01, max_delay: float = 1.0):
+        """
+        Initialize the coordinator.
+
+        Args:
+            path (str): Database file path; the lock file is ``path + ".lock"``.
+            deadline (float): Seconds a write may wait for the lock and retry (default: 30).
+            base_delay (float): First backoff delay in seconds (default: 0.01).
+            max_delay (float): Upper bound of a single backoff delay (default: 1.0).
+        """
+        self.path = path + ".lock"
+        self.deadline = deadline
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._handle = None
+        self._stats_lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """Clear the lock metrics."""
+        with self._stats_lock:
+            self.waits = Histogram(WAIT_BUCKETS)
+            self.retries = 0
+            self.timeouts = 0
+
+    def snapshot(self) -> dict:
+        """Return lock metrics: wait histogram, acquisitions, retries and timeouts."""
+        with self._stats_lock:
+            return {
+                "acquisitions": self.waits.count,
+                "retries": self.retries,
+                "timeouts": self.timeouts,
+                "wait": self.waits.to_dict(),
+            }
+
+    def backoff(self, attempt: int) -> float:
+        """Delay before retry `attempt` (0-based): exponential with equal jitter."""
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    # ---------------------- 🔹 FILE LOCK ----------------------
+
+    def _try_lock_file(self) -> bool:
+        handle = open(self.path, "a+b")
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            handle.close()
+            return False
+        self._handle = handle
+        return True
+
+    def _unlock_file(self) -> None:
+        handle, self._handle = self._handle, None
+        try:
+            if sys.platform == "win32":
+                import msvcrt
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+        finally:
+            handle.close()
+
+    @contextlib.contextmanager
+    def hold(self, deadline: Optional[float] = None):
+        """
+        Hold the write lock for the duration of a with-block.
+
+        Args:
+            deadline (Optional[float]): Absolute ``time.monotonic()`` deadline
+                (default: now + ``self.deadline``).
+
+        Raises:
+            TimeoutError: If the lock could not be taken before the deadline.
+        """
+        deadline = time.monotonic() + self.deadline if deadline is None else deadline
+        started = time.perf_counter()
+        if not self._thread_lock.acquire(timeout=max(0.0, deadline - time.monotonic())):
+            self._timed_out()
+        try:
+            if self._depth == 0:
+                attempt = 0
+                while not self._try_lock_file():
+                    if time.monotonic() >= deadline:
+                        self._timed_out()
+                    time.sleep(min(self.backoff(attempt), max(0.0, deadline - time.monotonic())))
+                    attempt += 1
+                with self._stats_lock:
+                    self.waits.observe(time.perf_counter() - started)
+            self._depth += 1
+        except BaseException:
+            self._thread_lock.release()
+            raise
+
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._unlock_file()
+            self._thread_lock.release()
+
+    def _timed_out(self):
+        with self._stats_lock:
+            self.timeouts += 1
+        raise TimeoutError(f"Write lock on {self.path} not acquired within {self.deadline}s")
+
+    # ---------------------- 🔹 RETRY ----------------------
+
+    def call(self, fn: Callable, error: Optional[Callable[[], Optional[BaseException]]] = None):
+        """
+        Run a write under the lock, retrying lock errors with backoff until the deadline.
+
+        Args:
+            fn (Callable): Write to run.
+            error (Optional[Callable]): Returns the error of a write that reports
+                failure instead of raising (e.g. ``UtilsRow.last_error``).
+
+        Returns:
+            Any: Result of the last attempt.
+
+        Raises:
+            TimeoutError: If the lock could not be taken before the deadline.
+        """
+        deadline = time.monotonic() + self.deadline
+        attempt = 0
+        while True:
+            with self.hold(deadline):
+                try:
+                    result, raised = fn(), None
+                except Exception as e:
+                    result, raised = None, e
+                failure = raised if raised is not None else (error() if error else None)
+            if not is_lock_error(failure) or time.monotonic() >= deadline:
+                if raised is not None:
+                    raise raised
+                return result
+            with self._stats_lock:
+                self.retries += 1
+            time.sleep(min(self.backoff(attempt), max(0.0, deadline - time.monotonic())))
+            attempt += 1
+
+
+def coordinated(failure=None):
+    """
+    Run a write method through ``self.writer`` (a WriteCoordinator) when one is set.
+
+    Lock errors reported through ``self.last_error`` are retried. A missed deadline
+    is logged, stored in ``self.last_error`` and returns `failure`.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            writer = getattr(self, "writer", None)
+            if writer is None:
+                return method(self, *args, **kwargs)
+            try:
+                return writer.call(lambda: method(self, *args, **kwargs), error=lambda: self.last_error)
+            except TimeoutError as e:
+                self.last_error = e
+                self.logger.error("❌ %s gave up: %s", method.__name__, e)
+                return failure
+        return wrapper
+    return decorator
@@ -0,0 +1,116 @@
+import unittest
+import asyncio
+import tempfile
+import time
+from unittest import mock
+
+import pandas as pd
+from sqlalchemy import String, Float
+
+from src import AsyncControlDBManager, ControlDB
+
+
+class TestAsyncControlDB(unittest.TestCase):
+    """asyncio facade on the embedded SQLite backend."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    async def _manager(self) -> AsyncControlDBManager:
+        manager = AsyncControlDBManager("asyncdb", rootPath=self.temp_dir.name, db_type="db", workers=4)
+        await manager.setup(username="admin", password="pw")
+        return manager
+
+    def test_row_crud_and_reads(self):
+        """Test awaitable row CRUD, bulk insert and DataFrame reads."""
+        async def scenario():
+            async with await self._manager() as manager:
+                db = await manager.create("tenant", password="pw")
+                self.assertIs(manager.get("tenant"), db)
+                coins = await db.create_table("CoinTable", {"symbol": String(16), "total": Float})
+
+                ids = await asyncio.gather(*[coins.create(symbol=f"S{i}", total=float(i)) for i in range(20)])
+                self.assertEqual(sorted(ids), list(range(1, 21)))
+                rows = await asyncio.gather(*[coins.get(id) for id in ids * 3])
+                self.assertTrue(all(row["ID"] == id for row, id in zip(rows, ids * 3)))
+                self.assertTrue(await coins.merge(3, {"total": 30.0}))
+                self.assertEqual((await coins.get(3))["total"], 30.0)
+                self.assertTrue(await coins.delete(4))
+                self.assertIsNone(await coins.get(4))
+
+                self.assertEqual(await coins.insert_dataframe(pd.DataFrame({"symbol": ["X"], "total": [1.0]})), 1)
+                df = await coins.get_df()
+                self.assertEqual(len(df), 20)
+                self.assertIs((await db.load_table("CoinTable")).table.table, coins.table.table)
+
+                totals = await manager.query_all("CoinTable", aggregate={"n": ("count", "*")})
+                self.assertEqual(int(totals["n"].iloc[0]), 20)
+        asyncio.run(scenario())
+
+    def test_writes_are_serialised_and_cancellable(self):
+        """Test that a cancelled write still holds the file lock until it has finished."""
+        async def scenario():
+            async with await self._manager() as manager:
+                db = await manager.create("tenant", password="pw")
+                order = []
+
+                def slow_write(tag):
+                    order.append(f"{tag}-start")
+                    time.sleep(0.2)
+                    order.append(f"{tag}-end")
+
+                first = asyncio.create_task(db.run(slow_write, "a", write=True))
+                await asyncio.sleep(0.05)
+                second = asyncio.create_task(db.run(slow_write, "b", write=True))
+                await asyncio.sleep(0)
+                first.cancel()
+                with self.assertRaises(asyncio.CancelledError):
+                    await first
+                await second
+                self.assertListEqual(order, ["a-start", "a-end", "b-start", "b-end"])
+        asyncio.run(scenario())
+
+    def test_event_loop_stays_responsive(self):
+        """Test that blocking database work does not stall the event loop."""
+        async def scenario():
+            async with await self._manager() as manager:
+                db = await manager.create("tenant", password="pw")
+                coins = await db.create_table("CoinTable", {"symbol": String(16), "total": Float})
+                frame = pd.DataFrame({"symbol": ["BTC"] * 5000, "total": range(5000)})
+
+                lag = 0.0
+                done = asyncio.Event()
+
+                async def heartbeat():
+                    nonlocal lag
+                    while not done.is_set():
+                        started = time.perf_counter()
+                        await asyncio.sleep(0.005)
+                        lag = max(lag, time.perf_counter() - started - 0.005)
+
+                beat = asyncio.create_task(heartbeat())
+                await asyncio.gather(*[coins.insert_dataframe(frame) for _ in range(4)],
+                                     *[coins.get_df() for _ in range(8)])
+                done.set()
+                await beat
+                self.assertLess(lag, 0.25)
+        asyncio.run(scenario())
+
+    def test_close_detaches_each_database_once(self):
+        """Test that closing the manager detaches wrapped and unwrapped databases exactly once."""
+        async def scenario():
+            manager = await self._manager()
+            await manager.create("tenant", password="pw")
+            detach = ControlDB.detach
+            with mock.patch.object(ControlDB, "detach", autospec=True, side_effect=detach) as spy:
+                await manager.close()
+            names = sorted(call.args[0].name for call in spy.call_args_list)
+            self.assertListEqual(names, sorted(db.name for db in manager.manager.databaseDir.values()))
+        asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    unittest.main()
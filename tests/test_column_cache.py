@@ -0,0 +1,85 @@
+import os
+import unittest
+import tempfile
+import subprocess
+import sys
+
+import numpy as np
+from sqlalchemy import Integer, Float, String, text
+
+from src import ControlDB
+from src.utils import ColumnCache
+from tests.utils import close_db
+
+
+class TestColumnCache(unittest.TestCase):
+    """Memory-mapped column cache on the embedded SQLite backend."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = ControlDB("cache", rootPath=self.temp_dir.name, db_type="db")
+        self.db.setup()
+        self.table = self.db.create_table("Strategy", {"symbol": String, "close": Float, "rsi": Float, "n": Integer})
+        for i in range(5):
+            self.table.row.id = None
+            self.table.row.create(symbol="BTC", close=100.0 + i, rsi=None if i == 2 else 50.0, n=i)
+
+    def tearDown(self):
+        close_db(self.temp_dir, self.db)
+
+    def test_refresh_is_incremental(self):
+        """Test that only appended IDs are read and NULLs become NaN."""
+        cache = self.db.column_cache("Strategy")
+        self.assertIsInstance(cache, ColumnCache)
+        self.assertListEqual(cache.columns, ["close", "rsi", "n"])
+        self.assertEqual(cache.refresh(), 5)
+        self.assertEqual(cache.refresh(), 0)
+
+        self.table.row.id = None
+        self.table.row.create(symbol="ETH", close=200.0, rsi=70.0, n=9)
+        self.assertEqual(cache.refresh(), 1)
+
+        close = cache.column("close")
+        self.assertIsInstance(close, np.memmap)
+        self.assertFalse(close.flags.writeable)
+        np.testing.assert_array_equal(close, [100, 101, 102, 103, 104, 200])
+        self.assertTrue(np.isnan(cache.column("rsi")[2]))
+        np.testing.assert_array_equal(cache.ids(), np.arange(1, 7))
+        self.assertEqual(cache.last_id, 6)
+
+    def test_shared_with_other_process(self):
+        """Test that another process maps the same committed rows read-only."""
+        cache = self.db.column_cache("Strategy", columns=["close"])
+        cache.refresh()
+        cache_dir = os.path.dirname(cache.path)
+        code = (
+            "import json, os, numpy as np; p = os.path.join(%r, 'Strategy');"
+            "rows = json.load(open(os.path.join(p, 'meta.json')))['rows'];"
+            "print(np.memmap(os.path.join(p, 'close.f8'), dtype=np.float64, mode='r', shape=(rows,)).sum())"
+        ) % cache_dir
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertAlmostEqual(float(out.stdout), 510.0)
+
+    def test_rebuild_after_column_change(self):
+        """Test that a cache built for other columns must be rebuilt."""
+        self.db.column_cache("Strategy", columns=["close"]).refresh()
+        cache = self.db.column_cache("Strategy", columns=["close", "rsi"])
+        with self.assertRaises(ValueError):
+            cache.refresh()
+        self.assertEqual(cache.rebuild(), 5)
+        self.assertEqual(len(cache), 5)
+
+    def test_lowercase_id_column(self):
+        """Test that tables keyed by a lowercase 'id' column are cached too."""
+        with self.db.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE Ticks (id INTEGER PRIMARY KEY AUTOINCREMENT, price REAL)"))
+            conn.execute(text("INSERT INTO Ticks (price) VALUES (1.5), (2.5), (3.5)"))
+        cache = self.db.column_cache("Ticks")
+        self.assertListEqual(cache.columns, ["price"])
+        self.assertEqual(cache.refresh(), 3)
+        np.testing.assert_array_equal(cache.ids(), [1, 2, 3])
+        np.testing.assert_array_equal(cache.column("price"), [1.5, 2.5, 3.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
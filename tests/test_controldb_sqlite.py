@@ -0,0 +1,344 @@
+import unittest
+import os
+import tempfile
+import threading
+import datetime
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import String, Integer, Float, Boolean, DateTime, text
+
+from src import ControlDB, ControlDBManager, ROOTBASE, UserTable
+from src.utils import UtilsTable
+from tests.utils import temp_controldb, close_db
+
+
+class TestControlDBSqlite(unittest.TestCase):
+    """ControlDB on the embedded SQLite backend (no MS Access driver required)."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root_path = os.path.join(self.temp_dir.name, "test_db")
+        self.db: ControlDB = temp_controldb(
+            "test_db",
+            self.root_path,
+            db_type="db",
+            password="unused",
+            base=ROOTBASE,
+        )
+
+    def tearDown(self):
+        close_db(self.temp_dir, self.db)
+
+    def test_setup_creates_file_and_tables(self):
+        """Test that setup creates an SQLite file with the base tables."""
+        self.assertTrue(self.db.is_sqlite)
+        self.assertTrue(self.db.authorized)
+        self.assertTrue(os.path.isfile(os.path.join(self.root_path, "test_db.db")))
+        self.assertEqual(set(self.db.get_table_names()), {"UserTable", "DatabaseTable", "LogicalTable", "PartitionTable", "ShardTable"})
+
+    def test_row_crud_on_core_table(self):
+        """Test UtilsRow CRUD on a dynamically created Core table."""
+        table = self.db.create_table("Prices", {"ID": Integer, "symbol": String, "close": Float})
+        self.assertIsInstance(table, UtilsTable)
+
+        id = table.row.create(symbol="BTC", close=1.5)
+        self.assertEqual(id, 1)
+        self.assertTrue(table.row.merge({"close": 2.5}))
+        self.assertEqual(table.row.get(id)["close"], 2.5)
+        self.assertTrue(table.row.replace({"symbol": "ETH"}))
+        self.assertEqual(table.row.get(id), {"ID": 1, "symbol": "ETH", "close": None})
+        self.assertTrue(table.row.delete())
+        self.assertIsNone(table.row.get(id))
+
+    def test_row_statements_are_cached(self):
+        """Test that per-row operations reuse prebuilt statements and merge upserts."""
+        table = self.db.create_table("Prices", {"symbol": String, "close": Float})
+        row = table.row
+        self.assertIs(row._statement("select"), row._statement("select"))
+
+        row.id = 5
+        self.assertTrue(row.merge({"symbol": "BTC", "close": 1.0}))
+        self.assertTrue(row.merge({"close": 2.0}))
+        self.assertEqual(row.get(5), {"ID": 5, "symbol": "BTC", "close": 2.0})
+        self.assertEqual(len(table.get_column_as_list("ID")), 1)
+
+    def test_row_rejects_unknown_columns(self):
+        """Test that misspelled columns fail instead of being dropped from prebuilt statements."""
+        table = self.db.create_table("Prices", {"symbol": String, "close": Float})
+        row = table.row
+        self.assertIsNone(row.create(symbl="BTC", close=1.0))
+        self.assertIsInstance(row.last_error, KeyError)
+        self.assertEqual(table.get_column_as_list("ID"), [])
+
+        id = row.create(symbol="BTC", close=1.0)
+        self.assertFalse(row.merge({"closee": 5.0}))
+        self.assertIsInstance(row.last_error, KeyError)
+        self.assertFalse(row.merge({"close": 2.0, "bogus": 3}))
+        self.assertFalse(row.merge({}))
+        self.assertFalse(row.replace({"symbol": "ETH", "bogus": 3}))
+        self.assertEqual(row.get(id), {"ID": id, "symbol": "BTC", "close": 1.0})
+
+    def test_row_writes_keep_lowercase_id(self):
+        """Test that merge/replace insert under the table's own ID column name."""
+        with self.db.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE Lower (id INTEGER PRIMARY KEY AUTOINCREMENT, v TEXT)"))
+            conn.execute(text("INSERT INTO Lower (v) VALUES ('A'), ('B'), ('C')"))
+        row = self.db.load_table("Lower").row
+
+        row.id = 2
+        self.assertTrue(row.replace({"v": "B2"}))
+        row.id = 10
+        self.assertTrue(row.merge({"v": "X"}))
+
+        self.assertEqual(row.get(2), {"id": 2, "v": "B2"})
+        self.assertEqual(row.get(10), {"id": 10, "v": "X"})
+        self.assertListEqual(self.db.load_table("Lower").get_column_as_list("id"), [1, 2, 3, 10])
+
+    def test_to_numpy_and_arrow(self):
+        """Test typed column reads into NumPy buffers and Arrow tables."""
+        table = self.db.create_table("Prices", {"symbol": String, "close": Float, "volume": Integer})
+        for i in range(7):
+            table.row.id = None
+            table.row.create(symbol=f"S{i}", close=i * 1.5, volume=None if i == 3 else i)
+
+        arrays = table.to_numpy(["ID", "close", "volume", "symbol"], chunk_size=3)
+        self.assertEqual(arrays["ID"].dtype, np.int64)
+        np.testing.assert_array_equal(arrays["close"], np.arange(7) * 1.5)
+        self.assertEqual(arrays["volume"].dtype, np.float64)
+        self.assertTrue(np.isnan(arrays["volume"][3]))
+        self.assertListEqual(list(arrays["symbol"][:2]), ["S0", "S1"])
+
+        close = table.to_numpy("close", where=table.table.c.close > 4)
+        np.testing.assert_array_equal(close, [4.5, 6.0, 7.5, 9.0])
+
+        arrow = table.to_arrow(["close", "volume"])
+        self.assertEqual(arrow.num_rows, 7)
+        self.assertEqual(arrow.column("volume").null_count, 1)
+
+    def test_to_numpy_keeps_nulls(self):
+        """Test that NULLs survive to_numpy/to_arrow for every column type."""
+        table = self.db.create_table("Flags", {"flag": Boolean, "volume": Integer, "close": Float,
+                                               "time": DateTime, "symbol": String})
+        table.row.create(flag=True, volume=1, close=1.5, time=datetime.datetime(2024, 1, 1), symbol="A")
+        table.row.create(flag=None, volume=None, close=None, time=None, symbol=None)
+        table.row.create(flag=False, volume=3, close=3.5, time=datetime.datetime(2024, 1, 3), symbol="C")
+
+        arrays = table.to_numpy(["flag", "volume", "close", "time", "symbol"], chunk_size=2)
+        self.assertListEqual(list(arrays["flag"]), [True, None, False])
+        self.assertTrue(np.isnan(arrays["volume"][1]))
+        self.assertTrue(np.isnan(arrays["close"][1]))
+        self.assertTrue(np.isnat(arrays["time"][1]))
+        self.assertIsNone(arrays["symbol"][1])
+
+        flags = table.to_numpy("flag", where=table.table.c.flag.isnot(None))
+        self.assertEqual(flags.dtype, np.bool_)
+
+        arrow = table.to_arrow(["flag", "volume", "close", "time", "symbol"])
+        self.assertEqual(arrow.column("flag").to_pylist(), [True, None, False])
+        for name in arrow.column_names:
+            self.assertEqual(arrow.column(name).null_count, 1, name)
+
+    def test_row_crud_on_orm_table(self):
+        """Test UtilsRow CRUD on an ORM class."""
+        table = self.db.load_table(UserTable)
+        id = table.row.create(username="john", password="pw", fullname="John", email="j@example.com")
+        self.assertEqual(table.row.get(id)["username"], "john")
+        self.assertListEqual(table.get_column_as_list("username"), ["john"])
+
+    def test_load_table_is_memoised(self):
+        """Test that load_table shares the mapped table until reconnect but not row state."""
+        table = self.db.load_table(UserTable)
+        again = self.db.load_table(UserTable)
+        self.assertIsNot(again, table)
+        self.assertIs(again.table_class, table.table_class)
+        self.assertIs(again.row._statements, table.row._statements)
+        self.assertIsNot(again.row, table.row)
+        self.assertFalse(hasattr(table, "__dict__"))
+        self.assertFalse(hasattr(table.row, "__dict__"))
+        with mock.patch.object(UtilsTable, "__init__", side_effect=AssertionError("handle() ran __init__")):
+            handle = self.db.load_table(UserTable)
+        self.assertIs(handle.logger, table.logger)
+        self.assertIsNone(handle.last_error)
+        self.assertIsNot(handle.row, again.row)
+
+        created = self.db.create_table("Prices", {"close": Float})
+        loaded = self.db.load_table("Prices")
+        self.assertIs(loaded.table_class, created.table_class)
+        loaded.row.set_id(7)
+        self.assertIsNone(created.row.id)
+        self.assertIsNone(self.db.load_table("Prices").row.id)
+
+        self.db.detach()
+        self.db.connect(base=ROOTBASE)
+        self.assertIsNot(self.db.load_table(UserTable).row._statements, table.row._statements)
+
+    def test_import_excel_after_reconnect(self):
+        """Test that a table loaded by name coerces with its real column types."""
+        self.db.create_table("Prices", {"symbol": String, "close": Float, "time": DateTime})
+        path = os.path.join(self.temp_dir.name, "prices.xlsx")
+        pd.DataFrame({
+            "symbol": ["BTC", "ETH", "ADA"],
+            "close": [1.5, "2", "bad"],
+            "time": [datetime.datetime(2024, 1, 1), "2024-01-02", None],
+        }).to_excel(path, index=False)
+
+        self.db.detach()
+        self.db.connect(base=ROOTBASE)
+        prices = self.db.load_table("Prices")
+        self.assertTrue(issubclass(prices.get_column_definitions()["close"], Float))
+        self.assertEqual(self.db.import_excel("Prices", path), 2)
+
+        self.assertListEqual(prices.get_column_as_list("close"), [1.5, 2.0])
+        self.assertEqual(prices.row.get(2)["time"], datetime.datetime(2024, 1, 2))
+
+
+class TestScopedSessionSqlite(unittest.TestCase):
+    """ControlDB in scoped mode: one thread-local session per caller thread."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = ControlDB("scoped", rootPath=self.temp_dir.name, db_type="db", scoped=True)
+        self.db.setup(base=ROOTBASE)
+
+    def tearDown(self):
+        close_db(self.temp_dir, self.db)
+
+    def test_threads_get_own_sessions(self):
+        """Test that concurrent reads through one handle use per-thread sessions."""
+        table = self.db.create_table("Prices", {"close": Float})
+        ids = [table.row.create(close=float(i)) for i in range(20)]
+        self.db.release_session()
+
+        rows = self.db.load_table("Prices").row
+
+        def read(row_id):
+            session = self.db.session()
+            close = rows.get(row_id)["close"]
+            same = self.db.session() is session
+            self.db.release_session()
+            return row_id, close, same, session
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(read, ids * 5))
+
+        self.assertTrue(self.db.scoped)
+        self.assertTrue(all(close == float(row_id - 1) and same for row_id, close, same, _ in results))
+        self.assertGreater(len({id(session) for *_, session in results}), 1)
+
+    def test_threads_write_through_one_handle(self):
+        """Test that set_id + merge/delete from several threads on one handle hit their own rows."""
+        table = self.db.create_table("Prices", {"close": Float})
+        ids = [table.row.create(close=0.0) for _ in range(40)]
+        self.db.release_session()
+
+        prices = self.db.load_table("Prices")
+        # Every thread sets its ID before any of them writes
+        barrier = threading.Barrier(8, timeout=10)
+
+        def write(row_id):
+            row = prices.row
+            row.set_id(row_id)
+            barrier.wait()
+            ok = row.delete() if row_id % 4 == 0 else row.merge({"close": float(row_id)})
+            self.db.release_session()
+            return ok
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            self.assertTrue(all(pool.map(write, ids)))
+
+        df = self.db.load_table("Prices").get_df_table()
+        self.assertEqual(sorted(df.index), [i for i in ids if i % 4])
+        self.assertTrue((df["close"] == df.index.astype(float)).all())
+
+
+class TestReaderSqlite(unittest.TestCase):
+    """Read-only reader connections next to a writing instance."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db: ControlDB = temp_controldb("writer", self.temp_dir.name, db_type="db", password="unused")
+        self.table = self.db.create_table("Prices", {"symbol": String, "close": Float})
+        self.table.insert_dataframe(pd.DataFrame({"symbol": ["BTC", "ETH"], "close": [1.0, 2.0]}))
+
+    def tearDown(self):
+        close_db(self.temp_dir, self.db)
+
+    def test_reader_sees_committed_snapshot(self):
+        """Test that a reader is not blocked by an open write transaction and cannot write."""
+        reader = self.db.reader()
+        try:
+            self.assertTrue(reader.read_only)
+            self.assertFalse(self.db.read_only)
+            self.assertEqual(reader.id, self.db.id)
+            prices = reader.load_table("Prices")
+
+            # Uncommitted write on the writer's session holds the write lock
+            self.db.session.execute(self.table.table.insert(), {"symbol": "SOL", "close": 3.0})
+            self.assertEqual(len(prices.get_df_table()), 2)
+            self.db.session.commit()
+            self.assertEqual(len(prices.get_df_table()), 3)
+
+            self.assertIsNone(prices.row.create(symbol="XRP", close=4.0))
+            self.assertIn("readonly", str(prices.row.last_error))
+        finally:
+            reader.detach()
+
+
+class TestControlDBManagerSqlite(unittest.TestCase):
+    """ControlDBManager setup/login/create on the embedded SQLite backend."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_setup_login_and_reload(self):
+        """Test that databases created by one manager are loaded by the next login."""
+        manager = ControlDBManager("MyDB", rootPath=self.temp_dir.name, db_type="db")
+        manager.setup(username="admin", password="pw")
+        db = manager.create("tenant", password="pw", folderSystem=["a", "b"])
+        self.assertEqual(db.id, 2)
+        manager.detach_all()
+
+        manager = ControlDBManager("MyDB", rootPath=self.temp_dir.name, db_type="db")
+        self.assertFalse(manager.login("admin", password="wrong"))
+        self.assertTrue(manager.login("admin", password="pw"))
+        self.assertListEqual(sorted(manager.databaseDir), [1, 2])
+        self.assertEqual(manager.get(2).name, os.path.join("a", "b", "tenant"))
+        self.assertIs(manager.get(os.path.join("a", "b", "tenant")), manager.get(2))
+        manager.detach_all()
+
+    def test_query_all_fans_out(self):
+        """Test that query_all merges tenants, skips missing tables and reports failures."""
+        manager = ControlDBManager("MyDB", rootPath=self.temp_dir.name, db_type="db")
+        manager.setup(username="admin", password="pw")
+        for n in range(3):
+            table = manager.create(f"tenant{n}", password="pw").create_table("CoinTable", {"total": Float})
+            table.insert_dataframe(pd.DataFrame({"total": [1.0 * n, 2.0]}))
+        manager.create("broken", password="pw").create_table("CoinTable", {"other": Float})
+
+        df = manager.query_all("CoinTable", aggregate={"total": ("sum", "total"), "rows": ("count", "*")})
+        self.assertListEqual(list(df.columns), ["_db_id", "_db_name", "total", "rows"])
+        self.assertListEqual(sorted(df["_db_name"]), ["tenant0", "tenant1", "tenant2"])
+        self.assertEqual(df["total"].sum(), 9.0)
+        self.assertEqual(df["rows"].sum(), 6)
+        self.assertListEqual(list(manager.query_errors), ["broken"])
+
+        rows = manager.query_all("CoinTable", columns=["total"], where=lambda t: t.c.total > 1.5,
+                                 databases=["tenant2"], workers=1)
+        self.assertListEqual(rows["total"].tolist(), [2.0, 2.0])
+
+        slow = text("(WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 1000000000) "
+                    "SELECT count(*) FROM c) > 0")
+        df = manager.query_all("CoinTable", columns=["total"], where=slow, databases=["tenant0"], timeout=0.2)
+        self.assertTrue(df.empty)
+        self.assertIn("timed out", manager.query_errors["tenant0"])
+        manager.detach_all()
+
+
+if __name__ == "__main__":
+    unittest.main()
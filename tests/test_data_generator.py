@@ -0,0 +1,87 @@
+import unittest
+import os
+import tempfile
+
+import numpy as np
+from sqlalchemy import Column, Integer, Float, String, DateTime
+from sqlalchemy.orm import declarative_base
+
+from src import ControlDB, DataGenerator, ROOTBASE, UserTable
+from tests.utils import temp_controldb, close_db
+
+KLINEBASE = declarative_base()
+
+
+class KlineTable(KLINEBASE):
+    __tablename__ = "KlineTable"
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    time = Column(DateTime)
+    open = Column(Float)
+    high = Column(Float)
+    low = Column(Float)
+    close = Column(Float)
+    volume = Column(Float)
+
+
+class TestDataGenerator(unittest.TestCase):
+    """Unit tests for synthetic dataset generation."""
+
+    def setUp(self):
+        self.gen = DataGenerator(seed=1)
+
+    def test_frame_follows_model_and_spec(self):
+        """Test that frames skip autoincrement keys, keep unique columns unique and honour specs."""
+        df = self.gen.frame(UserTable, 500, spec={
+            "email": {"cardinality": 10, "skew": 1.5},
+            "fullname": {"values": ["A", "B"], "weights": [9, 1], "null_fraction": 0.1},
+        })
+
+        self.assertListEqual(list(df.columns), ["username", "password", "fullname", "email"])
+        self.assertEqual(len(df), 500)
+        self.assertTrue(df["username"].is_unique)
+        self.assertLessEqual(df["email"].nunique(), 10)
+        self.assertTrue(df["fullname"].isna().any())
+        self.assertGreater((df["fullname"] == "A").sum(), (df["fullname"] == "B").sum())
+
+        # Chunked generation continues sequences
+        next_chunk = self.gen.frame(UserTable, 10, offset=500)
+        self.assertFalse(set(next_chunk["username"]) & set(df["username"]))
+
+    def test_ohlcv_is_consistent(self):
+        """Test that candles are ordered in time and high/low bound open/close."""
+        df = self.gen.ohlcv(1000, freq="1min")
+        self.assertTrue(df["time"].is_monotonic_increasing)
+        self.assertTrue((df["high"] >= df[["open", "close"]].max(axis=1)).all())
+        self.assertTrue((df["low"] <= df[["open", "close"]].min(axis=1)).all())
+        np.testing.assert_allclose(df["open"].iloc[1:].to_numpy(), df["close"].iloc[:-1].to_numpy())
+
+
+class TestDataGeneratorPopulate(unittest.TestCase):
+    """Bulk loading generated data into an SQLite ControlDB."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db: ControlDB = temp_controldb(
+            "gen_db", os.path.join(self.temp_dir.name, "gen_db"), db_type="db",
+            password="unused", base=[ROOTBASE, KLINEBASE],
+        )
+
+    def tearDown(self):
+        close_db(self.temp_dir, self.db)
+
+    def test_populate_in_chunks(self):
+        """Test that populate inserts all rows across chunks."""
+        gen = DataGenerator(seed=2)
+        self.assertEqual(gen.populate(self.db, UserTable, 250, chunk_size=100), 250)
+
+        inserted = gen.populate(self.db, KlineTable, 300, chunk_size=128,
+                                frame_fn=lambda n, offset: gen.ohlcv(n, start="2024-01-01"))
+        self.assertEqual(inserted, 300)
+
+        table = self.db.load_table(KlineTable)
+        self.assertEqual(len(table.get_column_as_list("close")), 300)
+        self.assertEqual(len(set(self.db.load_table(UserTable).get_column_as_list("username"))), 250)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from src.utils.decorators import profiled, profiler, require_authorization
+
+
+class Dummy:
+    authorized = True
+
+    @profiled
+    @require_authorization
+    def work(self, n: int) -> int:
+        return sum(range(n))
+
+
+class TestProfiled(unittest.TestCase):
+    """Unit tests for the @profiled method decorator."""
+
+    def setUp(self):
+        self.was_enabled = profiler.enabled
+        profiler.enabled = False
+        profiler.reset()
+
+    def tearDown(self):
+        profiler.enabled = self.was_enabled
+        profiler.reset()
+
+    def test_disabled_records_nothing(self):
+        """Test that calls are not recorded while profiling is disabled."""
+        self.assertEqual(Dummy().work(10), 45)
+        self.assertListEqual(profiler.report(), [])
+
+    def test_session_reports_calls(self):
+        """Test that a session enables profiling and reports only calls made inside it."""
+        dummy = Dummy()
+        profiler.enabled = True
+        dummy.work(10)
+        profiler.enabled = False
+
+        with profiler.session(cprofile=True, memory=True) as report:
+            for _ in range(3):
+                dummy.work(1000)
+
+        self.assertFalse(profiler.enabled)
+        self.assertEqual(len(report.methods), 1)
+        self.assertEqual(report.methods[0]["method"], "Dummy.work")
+        self.assertEqual(report.methods[0]["calls"], 3)
+        self.assertIsNotNone(report.cprofile)
+        self.assertIn("Dummy.work", report.format())
+
+    def test_require_authorization_still_applies(self):
+        """Test that the profiling wrapper does not bypass authorization."""
+        dummy = Dummy()
+        dummy.authorized = False
+        with self.assertRaises(PermissionError):
+            dummy.work(1)
+
+
+if __name__ == "__main__":
+    unittest.main()
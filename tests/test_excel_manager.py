@@ -1,5 +1,8 @@
 import unittest
 import os
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
+
 import pandas as pd
 
 from tests.utils import (
@@ -202,3 +205,163 @@ class TestExcelManager(unittest.TestCase):
         result = self.manager.remove_file(self.test_path)
         self.assertTrue(result)
         self.assertFalse(os.path.exists(self.test_path))
+
+    # -----------------------
+    # Parsed workbook cache tests
+    # -----------------------
+    def test_read_file_cache_hits_until_file_changes(self):
+        """Test that cached sheets are reused and invalidated when the file is rewritten."""
+        self.manager.cache_size = 4
+        df1 = pd.DataFrame({"ID": [1, 2], "Value": ["A", "B"]})
+        df1.to_excel(self.test_path, index=False)
+
+        first = self.manager.read_file(self.test_path, sheet_name="Sheet1")
+        self.assertEqual(len(self.manager._cache), 1)
+
+        # Mutating the returned frame must not leak into the cache
+        first.loc[0, "Value"] = "Changed"
+        second = self.manager.read_file(self.test_path, sheet_name="Sheet1")
+        pd.testing.assert_frame_equal(second, df1)
+        self.assertEqual(self.manager.get_columns(self.test_path, sheet_name="Sheet1"), ["ID", "Value"])
+
+        # Rewriting the workbook changes the fingerprint
+        df2 = pd.DataFrame({"ID": [1, 2, 3], "Value": ["A", "B", "C"]})
+        self.manager.upload_dataframe(self.test_path, df2)
+        third = self.manager.read_file(self.test_path, sheet_name="Sheet1")
+        pd.testing.assert_frame_equal(third, df2)
+
+    def test_read_file_cache_evicts_least_recently_used(self):
+        """Test that the in-memory cache never grows beyond cache_size."""
+        self.manager.cache_size = 1
+        df = pd.DataFrame({"A": [1]})
+        with pd.ExcelWriter(self.test_path, engine="openpyxl") as writer:
+            df.to_excel(writer, sheet_name="One", index=False)
+            df.to_excel(writer, sheet_name="Two", index=False)
+
+        self.manager.read_file(self.test_path, sheet_name="One")
+        self.manager.read_file(self.test_path, sheet_name="Two")
+        self.assertEqual(len(self.manager._cache), 1)
+        self.assertEqual(next(iter(self.manager._cache))[3], "Two")
+
+        self.manager.clear_cache()
+        self.assertEqual(len(self.manager._cache), 0)
+
+    # -----------------------
+    # Parallel read tests
+    # -----------------------
+    def test_read_many_collects_errors(self):
+        """Test that read_many reads all workbooks and records failures without aborting."""
+        paths = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir.name, f"book_{i}.xlsx")
+            pd.DataFrame({"ID": [i], "X": [i * 10]}).to_excel(path, index=False)
+            paths.append(path)
+
+        broken = os.path.join(self.temp_dir.name, "broken.xlsx")
+        with open(broken, "w") as f:
+            f.write("not a workbook")
+        missing = os.path.join(self.temp_dir.name, "missing.xlsx")
+
+        result = self.manager.read_many(paths + [broken, missing], workers=2)
+        self.assertListEqual(list(result.keys()), paths)
+        self.assertEqual(result[paths[2]].loc[0, "X"], 20)
+        self.assertSetEqual(set(self.manager.read_errors), {broken, missing})
+
+        combined = self.manager.read_many(paths, workers=2, concat=True)
+        self.assertEqual(len(combined), 3)
+        self.assertListEqual(combined["source"].tolist(), paths)
+        self.assertDictEqual(self.manager.read_errors, {})
+
+        # Invalid arguments fail before any file is read
+        with self.assertRaises(ValueError):
+            self.manager.read_many(paths + [missing], workers=2, concat=True, sheet_name=None)
+        self.assertDictEqual(self.manager.read_errors, {})
+
+    def test_iter_many_cancels_queued_reads_when_closed(self):
+        """Test that stopping iter_many early cancels the parses still queued in the pool."""
+        paths = []
+        for i in range(8):
+            path = os.path.join(self.temp_dir.name, f"book_{i}.xlsx")
+            pd.DataFrame({"ID": [i]}).to_excel(path, index=False)
+            paths.append(path)
+
+        submitted = []
+
+        class SpyPool(ProcessPoolExecutor):
+            def submit(self, *args, **kwargs):
+                submitted.append(super().submit(*args, **kwargs))
+                return submitted[-1]
+
+        with mock.patch("src.excel_manager.ProcessPoolExecutor", SpyPool):
+            reads = self.manager.iter_many(paths, workers=1)
+            path, df = next(reads)
+            reads.close()
+        self.assertIn(path, paths)
+        self.assertEqual(len(submitted), 8)
+        self.assertTrue(all(f.done() for f in submitted))
+        self.assertTrue(any(f.cancelled() for f in submitted))
+
+    # -----------------------
+    # Metadata probe tests
+    # -----------------------
+    def test_probe_reports_header_and_dimensions(self):
+        """Test that probe returns sheet names, headers and row count without reading the body."""
+        df = pd.DataFrame({"X": range(50), "Y": range(50), "Z": range(50)})
+        with pd.ExcelWriter(self.test_path, engine="openpyxl") as writer:
+            df.to_excel(writer, sheet_name="Data", index=False)
+            df.iloc[:5, :2].to_excel(writer, sheet_name="Small", index=False)
+
+        info = self.manager.probe(self.test_path)
+        self.assertListEqual(info["sheet_names"], ["Data", "Small"])
+        self.assertEqual(info["sheet"], "Data")
+        self.assertListEqual(info["columns"], ["X", "Y", "Z"])
+        self.assertEqual(info["dimensions"], "A1:C51")
+        self.assertEqual(info["row_count"], 50)
+
+        info = self.manager.probe(self.test_path, sheet_name="Small")
+        self.assertListEqual(info["columns"], ["X", "Y"])
+        self.assertEqual(info["row_count"], 5)
+
+        self.assertIsNone(self.manager.probe("non_existing_file.xlsx"))
+
+    def test_get_columns_matches_pandas_labels(self):
+        """Test that probed headers are labelled like pandas (unnamed and duplicate columns)."""
+        df = pd.DataFrame([[1, 2, 3]], columns=["A", "A", None])
+        df.to_excel(self.test_path, index=False)
+
+        expected = pd.read_excel(self.test_path, nrows=0).columns.tolist()
+        self.assertListEqual(self.manager.get_columns(self.test_path), expected)
+
+    # -----------------------
+    # Incremental update tests
+    # -----------------------
+    def test_sync_dataframe_updates_inserts_and_deletes(self):
+        """Test that sync_dataframe rewrites changed cells, appends new keys and drops missing keys."""
+        df1 = pd.DataFrame({"ID": [1, 2, 3, 4], "Value": ["A", "B", "C", "D"], "Score": [1.0, 2.0, None, 4.0]})
+        with pd.ExcelWriter(self.test_path, engine="openpyxl") as writer:
+            df1.to_excel(writer, sheet_name="Status", index=False)
+            df1.to_excel(writer, sheet_name="Other", index=False)
+
+        df2 = pd.DataFrame({"ID": [1, 3, 5], "Value": ["A", "C2", "E"], "Score": [1.0, None, 5.0]})
+        summary = self.manager.sync_dataframe(self.test_path, df2, index_column="ID", sheet_name="Status")
+
+        self.assertDictEqual(summary, {"updated_rows": 1, "updated_cells": 1, "inserted": 1, "deleted": 2})
+        df_out = read_excel(self.test_path, "Status")
+        pd.testing.assert_frame_equal(df_out, df2, check_dtype=False)
+
+        # Other sheets are preserved
+        pd.testing.assert_frame_equal(read_excel(self.test_path, "Other"), df1, check_dtype=False)
+
+        # A second sync with identical data writes nothing
+        summary = self.manager.sync_dataframe(self.test_path, df2, index_column="ID", sheet_name="Status")
+        self.assertDictEqual(summary, {"updated_rows": 0, "updated_cells": 0, "inserted": 0, "deleted": 0})
+
+    def test_sync_dataframe_creates_missing_file_and_rejects_duplicates(self):
+        """Test that sync_dataframe creates a missing file and refuses duplicate keys."""
+        df = pd.DataFrame({"ID": [1, 2], "Value": ["A", "B"]})
+        summary = self.manager.sync_dataframe(self.test_path, df, index_column="ID")
+        self.assertEqual(summary["inserted"], 2)
+        pd.testing.assert_frame_equal(read_excel(self.test_path), df)
+
+        duplicated = pd.DataFrame({"ID": [1, 1], "Value": ["A", "B"]})
+        self.assertIsNone(self.manager.sync_dataframe(self.test_path, duplicated, index_column="ID"))
@@ -0,0 +1,47 @@
+import os
+import sys
+import json
+import unittest
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("pandas", "numpy", "openpyxl", "pyodbc", "msaccessdb", "win32com")
+
+PROBE = f"""
+import sys, json, time
+start = time.perf_counter()
+from src import ControlDB, ControlDBManager
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed": elapsed, "loaded": [m for m in {HEAVY_MODULES!r} if m in sys.modules]}}))
+"""
+
+
+class TestImportTime(unittest.TestCase):
+    """Package import must not pull in pandas, Excel or Access driver modules."""
+
+    def run_probe(self) -> dict:
+        out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, env=os.environ.copy(),
+                             capture_output=True, text=True, check=True)
+        return json.loads(out.stdout.strip().splitlines()[-1])
+
+    def test_no_heavy_imports(self):
+        """Test that importing ControlDB and ControlDBManager leaves heavy modules unloaded."""
+        self.assertListEqual(self.run_probe()["loaded"], [])
+
+    def test_import_budget(self):
+        """Test that a cold package import stays within the time budget."""
+        self.assertLess(self.run_probe()["elapsed"], 1.0)
+
+    def test_lazy_attributes(self):
+        """Test that lazily exported names resolve to the real objects."""
+        import src
+        from src.excel_manager import ExcelManager
+        self.assertIs(src.ExcelManager, ExcelManager)
+        self.assertIn("DataGenerator", dir(src))
+        with self.assertRaises(AttributeError):
+            src.DoesNotExist
+
+
+if __name__ == "__main__":
+    unittest.main()
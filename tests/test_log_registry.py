@@ -0,0 +1,45 @@
+import logging
+import unittest
+
+from src.utils.log_registry import get_logger, sharedlog, registered_loggers
+
+
+@sharedlog
+class Handle:
+    def __init__(self, name: str, logLevel: int = 30):
+        self.name = name
+
+
+class TestLogRegistry(unittest.TestCase):
+    """Unit tests for the shared logger registry."""
+
+    def test_handlers_added_once(self):
+        """Test that repeated lookups reuse the logger without stacking handlers."""
+        first = get_logger("RegistryTest", level=logging.INFO)
+        handlers = len(first.logger.handlers)
+        for level in (logging.INFO, logging.DEBUG, logging.ERROR) * 20:
+            logger = get_logger("RegistryTest", level=level)
+            self.assertIs(logger.logger, first.logger)
+        self.assertIs(get_logger("RegistryTest", level=logging.INFO), first)
+        self.assertEqual(len(first.logger.handlers), handlers)
+        self.assertIn("RegistryTest", registered_loggers())
+
+    def test_sharedlog_instances_keep_own_level(self):
+        """Test that decorated instances share one logger but each honours its own logLevel."""
+        a, b = Handle("a"), Handle("b", logLevel=logging.DEBUG)
+        c = Handle("c", logging.ERROR)
+        self.assertIs(a.logger.logger, b.logger.logger)
+        self.assertEqual((a.logger.level, b.logger.level, c.logger.level),
+                         (logging.WARNING, logging.DEBUG, logging.ERROR))
+
+        with self.assertLogs("Handle", level=logging.DEBUG) as logs:
+            b.logger.debug("shown")
+            c.logger.warning("hidden")
+            a.logger.info("hidden")
+            a.logger.warning("shown too")
+        self.assertEqual([r.getMessage() for r in logs.records], ["shown", "shown too"])
+        self.assertTrue(all(h.level == logging.NOTSET for h in a.logger.logger.handlers))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import os
+import unittest
+import tempfile
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import String
+
+from src import ControlDBManager, DataGenerator
+from src.partitioned_table import period_bounds
+
+
+class TestPartitionedTable(unittest.TestCase):
+    """Time-partitioned logical tables on the embedded SQLite backend."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = ControlDBManager("parts", rootPath=self.temp_dir.name, db_type="db")
+        self.manager.setup(username="admin", password="pw")
+        gen = DataGenerator(seed=3)
+        # 1 candle per hour over ~3 months
+        self.candles = gen.ohlcv(24 * 80, start="2024-01-15", freq="1h").assign(symbol="BTC")
+
+    def tearDown(self):
+        self.manager.detach_all()
+        self.temp_dir.cleanup()
+
+    def test_period_bounds(self):
+        """Test day/month/year period boundaries."""
+        self.assertEqual(period_bounds(datetime(2024, 2, 10, 5), "month"), (datetime(2024, 2, 1), datetime(2024, 3, 1)))
+        self.assertEqual(period_bounds(datetime(2024, 2, 10, 5), "day"), (datetime(2024, 2, 10), datetime(2024, 2, 11)))
+        self.assertEqual(period_bounds(datetime(2024, 2, 10), None), (None, None))
+
+    def test_monthly_rollover_and_pruning(self):
+        """Test that appends create one file per month and ranges only scan overlapping files."""
+        table = self.manager.create_partitioned("Kline1h", period="month", keys={"symbol": String(16)})
+        self.assertEqual(table.append(self.candles), len(self.candles))
+        self.assertListEqual([p["start"].month for p in table.partitions], [1, 2, 3, 4])
+
+        start, end = datetime(2024, 2, 20), datetime(2024, 3, 5)
+        self.assertEqual(len(table.prune(start, end)), 2)
+        rows = table.range(start, end, symbol="BTC")
+        expected = self.candles[(self.candles["time"] >= start) & (self.candles["time"] < end)]
+        self.assertListEqual(list(rows["time"]), list(expected["time"]))
+
+        daily = table.downsample("1D", symbol="BTC")
+        self.assertEqual(len(daily), 80)
+        self.assertAlmostEqual(daily["volume"].sum(), self.candles["volume"].sum())
+
+        # Partitions are registered databases and survive a new login
+        self.manager.detach_all()
+        manager = ControlDBManager("parts", rootPath=self.temp_dir.name, db_type="db")
+        self.assertTrue(manager.login("admin", password="pw"))
+        reopened = manager.partitioned("Kline1h")
+        self.assertEqual(len(reopened.partitions), 4)
+        self.assertEqual(len(reopened.range(symbol="BTC")), len(self.candles))
+        manager.detach_all()
+
+    def test_size_rollover(self):
+        """Test that a full partition file is closed and continued in a new file."""
+        table = self.manager.create_partitioned("Kline", period=None, max_bytes=1)
+        first, second = self.candles.iloc[:100], self.candles.iloc[100:200]
+        self.assertEqual(table.append(first), 100)
+        self.assertEqual(table.append(second), 100)
+
+        self.assertEqual(len(table.partitions), 2)
+        self.assertEqual(table.partitions[0]["end"], second["time"].iloc[0].to_pydatetime())
+        self.assertEqual(len(table.range(end=second["time"].iloc[0])), 100)
+        self.assertEqual(len(table.range()), 200)
+        for p in table.partitions:
+            self.assertTrue(os.path.isfile(self.manager.get(p["databaseID"]).filePath))
+
+    def test_rows_without_time_are_rejected(self):
+        """Test that rows with a missing time are reported instead of silently dropped."""
+        table = self.manager.create_partitioned("Kline", period="month")
+        df = self.candles.iloc[:10].copy()
+        df.loc[df.index[[2, 5]], "time"] = pd.NaT
+        with self.assertLogs("PartitionedTable", level="WARNING"):
+            self.assertEqual(table.append(df), 8)
+        self.assertListEqual(list(table.rejected_rows.index), list(df.index[[2, 5]]))
+        self.assertTrue(table.rejected_rows["_reason"].str.contains("time").all())
+        self.assertEqual(len(table.range()), 8)
+
+        self.assertEqual(table.append(self.candles.iloc[10:20]), 10)
+        self.assertEqual(len(table.rejected_rows), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+import json
+import unittest
+
+from sqlalchemy import create_engine, text
+
+from src.utils.query_stats import QueryStats, normalize_statement, stats_to_json, stats_to_prometheus
+
+
+class TestQueryStats(unittest.TestCase):
+    """Unit tests for engine-level query instrumentation."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        self.stats = QueryStats()
+        self.stats.attach(self.engine)
+
+    def tearDown(self):
+        self.stats.detach(self.engine)
+        self.engine.dispose()
+
+    def test_normalize_statement_groups_literals(self):
+        """Test that statements differing only in literals share one shape."""
+        a = normalize_statement("SELECT * FROM [T]  WHERE ID = 12 AND name = 'x'")
+        b = normalize_statement("SELECT * FROM [T] WHERE ID = 7 AND name = 'it''s'")
+        self.assertEqual(a, b)
+        self.assertEqual(normalize_statement("SELECT a FROM T1 WHERE ID IN (?, ?, ?)"), "SELECT a FROM T1 WHERE ID IN (?)")
+
+    def test_records_statements_commits_and_checkouts(self):
+        """Test that executions, commits and checkouts are counted per statement shape."""
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE TABLE T (ID INTEGER PRIMARY KEY, v TEXT)"))
+            conn.execute(text("INSERT INTO T (v) VALUES (:v)"), [{"v": "a"}, {"v": "b"}])
+        for i in range(3):
+            with self.engine.connect() as conn:
+                conn.execute(text(f"SELECT v FROM T WHERE ID = {i}")).all()
+
+        snap = self.stats.snapshot()
+        self.assertEqual(snap["queries"], 5)
+        self.assertEqual(snap["commits"], 1)
+        self.assertEqual(snap["checkouts"]["count"], 4)
+
+        select_shape = snap["statements"]["SELECT v FROM T WHERE ID = ?"]
+        self.assertEqual(select_shape["count"], 3)
+        self.assertEqual(sum(select_shape["buckets"].values()), 3)
+        self.assertEqual(snap["statements"]["INSERT INTO T (v) VALUES (?)"]["executemany"], 1)
+        # Affected rows: the insert wrote two, reads affect none
+        self.assertEqual(snap["statements"]["INSERT INTO T (v) VALUES (?)"]["rows_affected"], 2)
+        self.assertEqual(select_shape["rows_affected"], 0)
+
+        # Detached engines are no longer recorded
+        self.stats.detach(self.engine)
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1")).all()
+        self.assertEqual(self.stats.snapshot()["queries"], 5)
+        self.stats.attach(self.engine)
+
+    def test_export_formats(self):
+        """Test JSON and Prometheus exports of aggregated snapshots."""
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1")).all()
+        aggregated = {"root": self.stats.snapshot()}
+
+        self.assertEqual(json.loads(stats_to_json(aggregated))["root"]["queries"], 1)
+
+        prom = stats_to_prometheus(aggregated)
+        self.assertIn('controldb_query_duration_seconds_count{database="root",statement="SELECT ?"} 1', prom)
+        self.assertIn('controldb_query_duration_seconds_bucket{database="root",statement="SELECT ?",le="+Inf"} 1', prom)
+        self.assertIn('controldb_commits_total{database="root"} 0', prom)
+        self.assertIn('controldb_query_rows_affected_total{database="root",statement="SELECT ?"} 0', prom)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import tempfile
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import String, Float, Integer
+
+from src import ControlDBManager
+from src.sharded_table import shard_of
+
+
+class TestShardedTable(unittest.TestCase):
+    """Hash-sharded logical tables on the embedded SQLite backend."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = ControlDBManager("shards", rootPath=self.temp_dir.name, db_type="db")
+        self.manager.setup(username="admin", password="pw")
+        self.table = self.manager.create_sharded(
+            "Trades", shard_key="symbol", shards=4,
+            columns={"symbol": String(16), "price": Float, "qty": Integer},
+        )
+        rng = np.random.default_rng(0)
+        self.symbols = [f"SYM{i}" for i in range(20)]
+        self.rows = pd.DataFrame({
+            "symbol": rng.choice(self.symbols, size=500),
+            "price": rng.uniform(1, 200, size=500),
+            "qty": rng.integers(1, 10, size=500),
+        })
+
+    def tearDown(self):
+        self.manager.detach_all()
+        self.temp_dir.cleanup()
+
+    def test_shard_of_is_stable(self):
+        """Test that shard numbers do not depend on the process hash seed or value type."""
+        self.assertEqual(shard_of("BTC", 8), shard_of("BTC", 8))
+        self.assertEqual(shard_of(5, 8), shard_of("5", 8))
+        self.assertTrue(0 <= shard_of("BTC", 8) < 8)
+
+    def test_insert_routes_and_lookups_hit_one_shard(self):
+        """Test batched routing, point lookups and merged scans."""
+        self.assertEqual(self.table.insert(self.rows), 500)
+
+        for number in range(4):
+            stored = self.table.shard(number).get_column_as_list("symbol")
+            self.assertTrue(all(self.table.shard_of(s) == number for s in stored))
+
+        btc = self.table.get("SYM3")
+        self.assertEqual(len(btc), (self.rows["symbol"] == "SYM3").sum())
+
+        expensive = self.table.scan(where=lambda t: t.c.price > 100, columns=["symbol", "price"])
+        self.assertEqual(len(expensive), (self.rows["price"] > 100).sum())
+        self.assertListEqual(sorted(expensive.columns), ["_shard", "price", "symbol"])
+
+    def test_shard_map_is_persisted(self):
+        """Test that a new login reopens the same shard map."""
+        self.table.insert(self.rows)
+        databases = dict(self.table.databases)
+        self.manager.detach_all()
+
+        manager = ControlDBManager("shards", rootPath=self.temp_dir.name, db_type="db")
+        self.assertTrue(manager.login("admin", password="pw"))
+        reopened = manager.sharded("Trades")
+        self.assertDictEqual(reopened.databases, databases)
+        self.assertEqual(len(reopened.scan()), 500)
+        manager.detach_all()
+
+
+if __name__ == "__main__":
+    unittest.main()
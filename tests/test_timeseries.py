@@ -0,0 +1,76 @@
+import unittest
+import tempfile
+from datetime import datetime
+
+import pandas as pd
+from sqlalchemy import String
+
+from src import ControlDB, DataGenerator
+from src.utils import TimeSeriesTable
+from tests.utils import close_db
+
+
+class TestTimeSeriesTable(unittest.TestCase):
+    """Time-series OHLCV mode on the embedded SQLite backend."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db = ControlDB("series", rootPath=self.temp_dir.name, db_type="db")
+        self.db.setup()
+        self.candles = self.db.create_timeseries("Kline1m", keys={"symbol": String(16)})
+        gen = DataGenerator(seed=1)
+        self.btc = gen.ohlcv(600, start="2024-01-01", freq="1min").assign(symbol="BTC")
+        self.eth = gen.ohlcv(600, start="2024-01-01", freq="1min").assign(symbol="ETH")
+        self.assertEqual(self.candles.append(pd.concat([self.btc, self.eth])), 1200)
+
+    def tearDown(self):
+        close_db(self.temp_dir, self.db)
+
+    def test_range_and_latest(self):
+        """Test half-open time ranges, key filters and latest rows."""
+        self.assertIsInstance(self.candles, TimeSeriesTable)
+        self.assertListEqual(self.candles.key_columns, ["symbol"])
+
+        rows = self.candles.range(datetime(2024, 1, 1, 1), datetime(2024, 1, 1, 2), symbol="BTC")
+        self.assertEqual(len(rows), 60)
+        self.assertEqual(rows["time"].iloc[0], datetime(2024, 1, 1, 1))
+        self.assertTrue(rows["time"].is_monotonic_increasing)
+
+        last = self.candles.latest(3, symbol="ETH")
+        self.assertListEqual(list(last["time"]), list(self.eth["time"].iloc[-3:]))
+        self.assertAlmostEqual(last["close"].iloc[-1], self.eth["close"].iloc[-1])
+
+    def test_duplicate_append_rolls_back(self):
+        """Test that re-appending existing (symbol, time) keys fails without partial writes."""
+        self.assertIsNone(self.candles.append(self.btc.iloc[:10]))
+        self.assertEqual(len(self.candles.range(symbol="BTC")), 600)
+
+    def test_downsample_matches_pandas(self):
+        """Test that server-side downsampling equals a pandas resample."""
+        result = self.candles.downsample("1h", symbol="BTC")
+        expected = (
+            self.btc.set_index("time")
+            .resample("1h")
+            .agg({"open": "first", "high": "max", "low": "min", "close": "last", "volume": "sum"})
+        )
+        self.assertEqual(len(result), 10)
+        self.assertListEqual(list(result["time"]), list(expected.index))
+        for column in ("open", "high", "low", "close", "volume"):
+            self.assertTrue(((result[column].to_numpy() - expected[column].to_numpy()) ** 2 < 1e-12).all(), column)
+
+        both = self.candles.downsample("5min")
+        self.assertEqual(len(both), 2 * 120)
+        self.assertListEqual(sorted(both["symbol"].unique()), ["BTC", "ETH"])
+
+    def test_load_timeseries_reflects_keys(self):
+        """Test that an existing time-series table is reflected with its key columns."""
+        self.db.detach()
+        self.db.connect()
+        candles = self.db.load_timeseries("Kline1m")
+        self.assertListEqual(candles.key_columns, ["symbol"])
+        self.assertIs(self.db.load_timeseries("Kline1m"), candles)
+        self.assertEqual(len(candles.latest(5, symbol="BTC")), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+import datetime
+
+import pandas as pd
+from sqlalchemy import create_engine, MetaData, Table, Column, Integer, Float, String, Boolean, DateTime
+
+from src.utils import UtilsTable, coerce_dataframe
+from src.utils.utils_frame import dataframe_to_records
+
+
+class TestCoerceDataFrame(unittest.TestCase):
+    """Unit tests for the vectorized coercion stage used by bulk loads."""
+
+    def test_coerce_converts_and_splits_bad_rows(self):
+        """Test that valid values are converted and invalid rows are rejected with a reason."""
+        df = pd.DataFrame({
+            "count": [1, "2", None, "x", 2.5],
+            "price": ["1.5", 2, None, "y", 3],
+            "name": ["a", "b", None, "c", "d"],
+            "active": ["yes", 0, True, "maybe", "no"],
+            "time": ["2024-01-01", "bad", None, "2024-03-01", "2024-01-02 10:00"],
+        })
+        definitions = {"count": Integer, "price": Float, "name": String, "active": Boolean, "time": DateTime}
+
+        valid, rejected = coerce_dataframe(df, definitions, required=["name"])
+
+        self.assertListEqual(valid.index.tolist(), [0])
+        self.assertEqual(str(valid["count"].dtype), "Int64")
+        self.assertEqual(valid["price"].dtype, "float64")
+        self.assertEqual(valid.loc[0, "price"], 1.5)
+        self.assertTrue(valid.loc[0, "active"])
+        self.assertEqual(valid.loc[0, "time"], pd.Timestamp("2024-01-01"))
+
+        self.assertListEqual(rejected.index.tolist(), [1, 2, 3, 4])
+        self.assertEqual(rejected.loc[1, "_reason"], "time: invalid DateTime")
+        self.assertEqual(rejected.loc[2, "_reason"], "name: missing required value")
+        self.assertIn("count: invalid Integer", rejected.loc[3, "_reason"])
+        self.assertIn("active: invalid Boolean", rejected.loc[3, "_reason"])
+        self.assertEqual(rejected.loc[4, "_reason"], "count: invalid Integer")
+        # Rejected rows keep their original values
+        self.assertEqual(rejected.loc[3, "count"], "x")
+
+    def test_records_use_native_values(self):
+        """Test that records hold datetime.datetime and None instead of pandas scalars."""
+        df = pd.DataFrame({"time": pd.to_datetime(["2024-01-01", None]), "close": [1.5, None]}, index=[5, 6])
+        records = dataframe_to_records(df)
+        self.assertIs(type(records[0]["time"]), datetime.datetime)
+        self.assertEqual(records[0]["time"], datetime.datetime(2024, 1, 1))
+        self.assertEqual(records[1], {"time": None, "close": None})
+
+
+class TestInsertDataFrame(unittest.TestCase):
+    """Bulk insert through UtilsTable on an in-memory SQLite engine."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        metadata = MetaData()
+        self.table = Table(
+            "Prices", metadata,
+            Column("ID", Integer, primary_key=True, autoincrement=True),
+            Column("symbol", String, nullable=False),
+            Column("close", Float),
+            Column("time", DateTime),
+        )
+        metadata.create_all(self.engine)
+        self.utils = UtilsTable(self.table, engine=self.engine)
+
+    def tearDown(self):
+        self.utils.session.close()
+        self.engine.dispose()
+
+    def test_insert_dataframe_inserts_valid_rows(self):
+        """Test that insert_dataframe writes valid rows and keeps rejected ones aside."""
+        df = pd.DataFrame({
+            "symbol": ["BTC", "ETH", None, "ADA"],
+            "close": [1.5, "2", 3.0, "n/a"],
+            "time": ["2024-01-01", datetime.datetime(2024, 1, 2), None, "2024-01-04"],
+            "unknown": [1, 2, 3, 4],
+        })
+
+        inserted = self.utils.insert_dataframe(df, chunk_size=1)
+
+        self.assertEqual(inserted, 2)
+        self.assertEqual(len(self.utils.rejected_rows), 2)
+        self.assertListEqual(self.utils.get_column_as_list("symbol"), ["BTC", "ETH"])
+        self.assertListEqual(self.utils.get_column_as_list("close"), [1.5, 2.0])
+        self.assertListEqual(self.utils.get_column_as_list("ID"), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import unittest
+import os
+import time
+import tempfile
+import multiprocessing
+from sqlite3 import OperationalError
+
+from sqlalchemy import String, Float
+
+from src import ControlDB
+from src.utils import WriteCoordinator, is_lock_error
+from src.utils.query_stats import stats_to_prometheus
+
+
+def _hold_lock(path, ready, seconds):
+    with WriteCoordinator(path).hold():
+        ready.set()
+        time.sleep(seconds)
+
+
+def _write_rows(root, n):
+    db = ControlDB("shared", rootPath=root, db_type="db", write_deadline=30)
+    db.connect()
+    table = db.load_table("Trades")
+    for i in range(n):
+        if table.row.create(symbol=f"P{os.getpid()}", price=float(i)) is None:
+            raise RuntimeError(table.row.last_error)
+    db.detach()
+
+
+class TestWriteCoordinator(unittest.TestCase):
+    """Advisory write lock, backoff and retries."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "data.db")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_is_lock_error(self):
+        """Test that SQLite and Access lock errors are recognised."""
+        self.assertTrue(is_lock_error(OperationalError("database is locked")))
+        self.assertTrue(is_lock_error(Exception("[Microsoft][ODBC Microsoft Access Driver] Could not update; "
+                                                "currently locked by another session on this machine. (-3218)")))
+        self.assertTrue(is_lock_error(Exception("Could not use 'C:\\db.accdb'; file already in use.")))
+        self.assertFalse(is_lock_error(OperationalError("no such table: Trades")))
+        self.assertFalse(is_lock_error(None))
+
+    def test_backoff_grows_with_jitter(self):
+        """Test that delays double up to max_delay and stay within the jitter band."""
+        writer = WriteCoordinator(self.path, base_delay=0.01, max_delay=0.1)
+        for attempt, cap in [(0, 0.01), (2, 0.04), (10, 0.1)]:
+            delay = writer.backoff(attempt)
+            self.assertTrue(cap / 2 <= delay <= cap)
+
+    def test_lock_is_exclusive_across_processes(self):
+        """Test that a second process waits for the lock and times out at the deadline."""
+        ctx = multiprocessing.get_context("spawn")
+        ready = ctx.Event()
+        holder = ctx.Process(target=_hold_lock, args=(self.path, ready, 1.0))
+        holder.start()
+        self.assertTrue(ready.wait(30))
+
+        writer = WriteCoordinator(self.path, deadline=0.2)
+        with self.assertRaises(TimeoutError):
+            with writer.hold():
+                pass
+        self.assertEqual(writer.snapshot()["timeouts"], 1)
+
+        writer.deadline = 30
+        with writer.hold():
+            with writer.hold():  # reentrant within the thread
+                pass
+        holder.join()
+        snapshot = writer.snapshot()
+        self.assertEqual(snapshot["acquisitions"], 1)
+        self.assertGreater(snapshot["wait"]["max"], 0.1)
+
+    def test_call_retries_lock_errors(self):
+        """Test that lock errors are retried until the write succeeds."""
+        writer = WriteCoordinator(self.path, base_delay=0.001)
+        attempts = []
+
+        def flaky():
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise OperationalError("database is locked")
+            return "ok"
+
+        self.assertEqual(writer.call(flaky), "ok")
+        self.assertEqual(writer.snapshot()["retries"], 2)
+        with self.assertRaises(OperationalError):
+            writer.call(lambda: (_ for _ in ()).throw(OperationalError("no such table: Trades")))
+
+
+class TestCoordinatedControlDB(unittest.TestCase):
+    """Several processes writing one SQLite file through ControlDB."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        db = ControlDB("shared", rootPath=self.temp_dir.name, db_type="db", write_deadline=30)
+        db.setup()
+        db.create_table("Trades", {"symbol": String(16), "price": Float})
+        db.detach()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_concurrent_writers_do_not_drop_rows(self):
+        """Test that coordinated row writes from several processes all land, with lock metrics."""
+        ctx = multiprocessing.get_context("spawn")
+        workers = [ctx.Process(target=_write_rows, args=(self.temp_dir.name, 25)) for _ in range(3)]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join()
+        self.assertTrue(all(p.exitcode == 0 for p in workers))
+
+        db = ControlDB("shared", rootPath=self.temp_dir.name, db_type="db", write_deadline=30)
+        db.connect()
+        table = db.load_table("Trades")
+        self.assertEqual(len(table.get_column_as_list("ID")), 75)
+        self.assertIs(table.row.writer, db.writer)
+
+        self.assertTrue(table.row.merge({"price": 1.0}))
+        stats = db.stats()
+        self.assertEqual(stats["write_lock"]["acquisitions"], 1)
+        self.assertIn("controldb_write_lock_wait_seconds_count", stats_to_prometheus({"shared": stats}))
+        db.detach()
+
+
+if __name__ == "__main__":
+    unittest.main()